@@ -0,0 +1,70 @@
+"""
+Move user activity records into the time-series collection.
+
+Copies user_activities into user_activity_events in timestamp order, batch by
+batch, with user_id and project_id as the time-series meta field, removing each
+batch from user_activities once it is copied. Safe to stop and re-run; at most
+the batch in flight when it stopped is copied twice.
+
+Usage:
+    ACTIVITY_STORAGE=timeseries python migrate_activity_events.py [--batch-size 1000] [--dry-run]
+
+Rollout order:
+    1. Set ACTIVITY_STORAGE=timeseries on the API. New activity goes to the
+       time-series collection; feeds, active-user counts and rollups read both
+       collections for as long as user_activities holds records with a date
+       timestamp, so nothing drops out of them.
+    2. Run this script. Each API worker notices within
+       ACTIVITY_LEGACY_CHECK_SECONDS that user_activities is drained and stops
+       reading it.
+While a batch is in flight its records can be counted twice, as above.
+"""
+
+import asyncio
+
+import typer
+
+from server import (
+    ACTIVITY_EVENTS_COLLECTION,
+    MIGRATABLE_ACTIVITIES,
+    activity_timeseries,
+    db,
+    ensure_indexes,
+    migrate_activity_batch,
+)
+
+cli = typer.Typer(add_completion=False)
+
+
+async def migrate(batch_size: int, dry_run: bool):
+    pending = await db.user_activities.count_documents(MIGRATABLE_ACTIVITIES)
+    print(f"📦 {pending} activity records in user_activities")
+    if dry_run or not pending:
+        return
+
+    await ensure_indexes()
+    moved = 0
+    while True:
+        count = await migrate_activity_batch(batch_size)
+        if not count:
+            break
+        moved += count
+        print(f"✅ Moved {moved}/{pending} records to {ACTIVITY_EVENTS_COLLECTION}")
+
+    left = await db.user_activities.count_documents({})
+    if left:
+        print(f"⚠️ {left} records without a date timestamp were left in user_activities")
+
+
+@cli.command()
+def main(
+    batch_size: int = typer.Option(1000, help="Activity records moved per batch"),
+    dry_run: bool = typer.Option(False, help="Only count records that would be moved"),
+):
+    if not activity_timeseries():
+        raise typer.BadParameter("Set ACTIVITY_STORAGE=timeseries to migrate activity records")
+    asyncio.run(migrate(batch_size, dry_run))
+
+
+if __name__ == "__main__":
+    cli()
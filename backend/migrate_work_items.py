@@ -0,0 +1,64 @@
+"""
+Move embedded project work items into their own collections.
+
+Copies tasks, deliverables, milestones and gate reviews from each project
+document into project_tasks / project_deliverables / project_milestones /
+project_gate_reviews, then strips the arrays and marks the project with
+work_item_storage="collections". Safe to re-run; projects that change while
+being migrated are retried on the next pass.
+
+Usage:
+    python migrate_work_items.py [--batch-size 100] [--passes 3] [--dry-run]
+
+Set WORK_ITEM_STORAGE=collections on the API so new projects are created split.
+"""
+
+import asyncio
+
+import typer
+
+from server import db, ensure_indexes, migrate_project_work_items
+
+cli = typer.Typer(add_completion=False)
+
+EMBEDDED_PROJECTS = {"work_item_storage": {"$ne": "collections"}}
+
+
+async def migrate(batch_size: int, passes: int, dry_run: bool):
+    pending = await db.projects.count_documents(EMBEDDED_PROJECTS)
+    print(f"📦 {pending} projects with embedded work items")
+    if dry_run or not pending:
+        return
+
+    await ensure_indexes()
+    retry_ids = None
+    for pass_number in range(1, passes + 1):
+        query = dict(EMBEDDED_PROJECTS)
+        if retry_ids is not None:
+            query["id"] = {"$in": retry_ids}
+
+        migrated, retry_ids = 0, []
+        async for project in db.projects.find(query).batch_size(batch_size):
+            if await migrate_project_work_items(project):
+                migrated += 1
+            else:
+                retry_ids.append(project["id"])
+
+        print(f"✅ Pass {pass_number}: migrated {migrated} projects, {len(retry_ids)} changed mid-migration")
+        if not retry_ids:
+            return
+
+    print(f"⚠️ {len(retry_ids)} projects still embedded; run again: {', '.join(retry_ids[:10])}")
+
+
+@cli.command()
+def main(
+    batch_size: int = typer.Option(100, help="Projects fetched per cursor batch"),
+    passes: int = typer.Option(3, help="Retry passes for projects updated during migration"),
+    dry_run: bool = typer.Option(False, help="Only count projects that would be migrated"),
+):
+    asyncio.run(migrate(batch_size, passes, dry_run))
+
+
+if __name__ == "__main__":
+    cli()
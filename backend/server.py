@@ -1,13 +1,47 @@
 import os
 import asyncio
+import base64
+import binascii
+import concurrent.futures
+import copy
+import csv
+import functools
+import io
+import itertools
+import inspect
+import logging
+import logging.handlers
+import multiprocessing
+import pickle
+import queue
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from bisect import bisect_left
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Optional, List, Dict, Any
 import uuid
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, status, UploadFile, File, Header, Query, WebSocket, WebSocketDisconnect
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import MutableHeaders
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from pymongo import MongoClient
+from pydantic import BaseModel, Field, ValidationError
+from bson import ObjectId
+import numpy as np
+import pandas as pd
+import orjson
+from pymongo import MongoClient, ReplaceOne, ReturnDocument, UpdateOne, monitoring
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure, PyMongoError
 from motor.motor_asyncio import AsyncIOMotorClient
 from dotenv import load_dotenv
 import hashlib
@@ -15,6 +49,78 @@ import jwt
 import json
 from emergentintegrations.llm.chat import LlmChat, UserMessage
 
+# Logging - JSON records handed to a background thread through a queue so the
+# event loop never blocks on stdout
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+HIGH_VOLUME_LOG_SAMPLE_RATE = float(os.getenv("HIGH_VOLUME_LOG_SAMPLE_RATE", "0.1"))
+
+current_request_id: ContextVar[Optional[str]] = ContextVar("current_request_id", default=None)
+
+class RequestContextFilter(logging.Filter):
+    """Stamps records with the request id and drops sampled-out high-volume records.
+
+    Runs in the calling thread, before the record crosses the queue, so the
+    request's contextvars are still visible. Pass extra={"sample_rate": r} to
+    keep only a fraction r of a noisy message.
+    """
+    def filter(self, record: logging.LogRecord) -> bool:
+        sample_rate = getattr(record, "sample_rate", None)
+        if sample_rate is not None and random.random() >= sample_rate:
+            return False
+        record.request_id = current_request_id.get()
+        return True
+
+class JSONLogFormatter(logging.Formatter):
+    """One JSON object per line"""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return orjson.dumps(entry, default=str).decode()
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """Queues records with their exception info intact.
+
+    The stock prepare() formats the traceback into msg and drops exc_info on the
+    calling (event loop) thread; here only the message is resolved, and the
+    listener thread renders the traceback into its own field.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        return record
+
+def configure_logging() -> logging.handlers.QueueListener:
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONLogFormatter())
+
+    impact_logger = logging.getLogger("impact")
+    impact_logger.setLevel(LOG_LEVEL)
+    impact_logger.handlers = [queue_handler]
+    impact_logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+log_listener = configure_logging()
+logger = logging.getLogger("impact.api")
+
 # Authentication helper functions
 def get_password_hash(password: str) -> str:
     """Hash password using SHA-256"""
@@ -37,7 +143,7 @@ async def create_admin_notification(notification_type: str, message: str, data:
         await db.admin_notifications.insert_one(notification_data)
         
     except Exception as e:
-        print(f"Admin notification error: {str(e)}")
+        logger.exception("Admin notification error: %s", e)
 
 async def log_user_activity(user_id: str, action: str, details: str, project_id: str = None, affected_users: List[str] = None):
     """Log user activity for tracking and notifications"""
@@ -53,10 +159,10 @@ async def log_user_activity(user_id: str, action: str, details: str, project_id:
             "affected_users": affected_users or []
         }
         
-        await db.user_activities.insert_one(activity_data)
+        await activity_collection().insert_one(activity_document(activity_data))
         
     except Exception as e:
-        print(f"Activity logging error: {str(e)}")
+        logger.exception("Activity logging error: %s", e)
 
 def create_access_token(data: dict) -> str:
     """Create JWT access token"""
@@ -68,7 +174,48 @@ def create_access_token(data: dict) -> str:
 
 load_dotenv()
 
-app = FastAPI(title="IMPACT Methodology API", version="1.0.0")
+# Fast JSON rendering - orjson with native datetime and ObjectId support
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _orjson_default(value: Any) -> Any:
+    """Encode the types orjson does not handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+class MongoJSONResponse(JSONResponse):
+    """JSON response rendered with orjson; Mongo documents can be returned as-is"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+class MongoJSONRoute(APIRoute):
+    """Route that wraps plain handler results in MongoJSONResponse.
+
+    FastAPI runs jsonable_encoder over every returned value before the response
+    class sees it, which walks large project documents twice. Returning a
+    Response from the handler skips that pass entirely.
+    """
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_model = kwargs.get("response_model")
+        if (response_model is None or isinstance(response_model, DefaultPlaceholder)) and inspect.iscoroutinefunction(endpoint):
+            endpoint = _render_with_orjson(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+
+def _render_with_orjson(endpoint, status_code: Optional[int] = None):
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return MongoJSONResponse(result, status_code=status_code or 200)
+    return wrapper
+
+app = FastAPI(title="IMPACT Methodology API", version="1.0.0", default_response_class=MongoJSONResponse)
+app.router.route_class = MongoJSONRoute
 
 # CORS configuration
 app.add_middleware(
@@ -79,13 +226,761 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Request metrics - per-route latency histograms, status counters and response sizes
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+RESPONSE_SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+UNMATCHED_ROUTE = "<unmatched>"
+
+class RouteMetrics:
+    """Preallocated counters for one (method, route template) pair.
+
+    Updates happen on the event loop thread with no await in between, so plain
+    integer increments are safe without a lock.
+    """
+    __slots__ = ("latency_buckets", "latency_sum", "size_buckets", "size_sum", "count", "status_counts", "db_commands", "db_seconds")
+
+    def __init__(self):
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.size_buckets = [0] * (len(RESPONSE_SIZE_BUCKETS) + 1)
+        self.size_sum = 0
+        self.count = 0
+        self.status_counts: Dict[int, int] = {}
+        self.db_commands = 0
+        self.db_seconds = 0.0
+
+    def observe(self, status_code: int, duration: float, size: int):
+        self.count += 1
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.latency_sum += duration
+        self.size_buckets[bisect_left(RESPONSE_SIZE_BUCKETS, size)] += 1
+        self.size_sum += size
+        self.status_counts[status_code] = self.status_counts.get(status_code, 0) + 1
+
+class MetricsRegistry:
+    """Process-wide request metrics rendered in Prometheus text format"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.routes: Dict[tuple, RouteMetrics] = {}
+
+    def observe(self, method: str, route: str, status_code: int, duration: float, size: int):
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.observe(status_code, duration, size)
+
+    def observe_db(self, method: str, route: str, commands: int, seconds: float):
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.db_commands += commands
+        metrics.db_seconds += seconds
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP impact_http_requests_in_flight Requests currently being served",
+            "# TYPE impact_http_requests_in_flight gauge",
+            f"impact_http_requests_in_flight {self.in_flight}",
+        ]
+        routes = sorted(self.routes.items())
+
+        lines.append("# HELP impact_http_requests_total Requests by route template and status code")
+        lines.append("# TYPE impact_http_requests_total counter")
+        for (method, route), metrics in routes:
+            for status_code, count in sorted(metrics.status_counts.items()):
+                lines.append(f'impact_http_requests_total{{method="{method}",route="{route}",status="{status_code}"}} {count}')
+
+        for name, help_text, bounds, attr, sum_attr in (
+            ("impact_http_request_duration_seconds", "Request latency by route template", LATENCY_BUCKETS, "latency_buckets", "latency_sum"),
+            ("impact_http_response_size_bytes", "Response body size by route template", RESPONSE_SIZE_BUCKETS, "size_buckets", "size_sum"),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for (method, route), metrics in routes:
+                labels = f'method="{method}",route="{route}"'
+                cumulative = 0
+                for bound, bucket_count in zip(bounds, getattr(metrics, attr)):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {metrics.count}')
+                lines.append(f"{name}_sum{{{labels}}} {getattr(metrics, sum_attr)}")
+                lines.append(f"{name}_count{{{labels}}} {metrics.count}")
+
+        for name, help_text, kind, attr in (
+            ("impact_db_commands_total", "Mongo commands issued by route template", "counter", "db_commands"),
+            ("impact_db_duration_seconds_total", "Time spent in Mongo commands by route template", "counter", "db_seconds"),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for (method, route), metrics in routes:
+                lines.append(f'{name}{{method="{method}",route="{route}"}} {getattr(metrics, attr)}')
+
+        return "\n".join(lines) + "\n"
+
+request_metrics = MetricsRegistry()
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware feeding request_metrics; keyed by route template, not raw path"""
+
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+        size = 0
+
+        async def send_with_metrics(message):
+            nonlocal status_code, size
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.registry.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            self.registry.in_flight -= 1
+            route = scope.get("route")
+            self.registry.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status_code,
+                time.perf_counter() - start,
+                size,
+            )
+
+app.add_middleware(RequestMetricsMiddleware, registry=request_metrics)
+
+# ====================================================================================
+# CACHE - ONE ASYNC API OVER MEMORY, LOCAL DISK OR REDIS BACKENDS
+# ====================================================================================
+
+# CACHE_BACKEND picks the store: "memory" (per process, LRU + TTL), "disk" (a sqlite
+# file shared by the workers on one host) or "redis" (shared by every host; needs the
+# optional redis package). Keys are "<namespace>:<rest>"; metrics are per namespace.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+CACHE_DEFAULT_TTL_SECONDS = int(os.getenv("CACHE_DEFAULT_TTL_SECONDS", "300"))
+# Upper bound for any entry; Redis tag sets live this long so they outlast their members
+CACHE_MAX_TTL_SECONDS = int(os.getenv("CACHE_MAX_TTL_SECONDS", "86400"))
+CACHE_DISK_PATH = os.getenv("CACHE_DISK_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache.sqlite3"))
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
+CACHE_REDIS_PREFIX = os.getenv("CACHE_REDIS_PREFIX", "impact:cache:")
+
+CACHE_MISS = object()
+CACHE_COUNTERS = ("hits", "misses", "sets", "deletes", "coalesced", "stale_skips", "errors")
+# Every backend keeps a version per tag, bumped by each invalidation, so a load that
+# straddles an invalidation on any worker is not stored. clear() bumps this tag,
+# which every load checks. Versions untouched for CACHE_MAX_TTL_SECONDS are dropped.
+CACHE_CLEAR_TAG = "cache:clear"
+
+class MemoryCacheBackend:
+    """LRU with per-entry expiry and a tag -> keys index, local to this process"""
+    name = "memory"
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.tag_keys: Dict[str, set] = {}
+        # tag -> (version, monotonic time it was bumped), oldest bump first
+        self.versions: "OrderedDict[str, tuple]" = OrderedDict()
+        self.evictions = 0
+
+    def _remove(self, key: str) -> bool:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[2]:
+            keys = self.tag_keys.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tag_keys[tag]
+        return True
+
+    async def tag_versions(self, tags) -> Dict[str, int]:
+        return {tag: self.versions.get(tag, (0,))[0] for tag in tags}
+
+    async def get(self, key: str) -> Any:
+        entry = self.entries.get(key)
+        if entry is None:
+            return CACHE_MISS
+        if entry[1] <= time.monotonic():
+            self._remove(key)
+            return CACHE_MISS
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: Any, ttl: float, tags: tuple, versions: Optional[Dict[str, int]] = None) -> bool:
+        if versions is not None and await self.tag_versions(versions) != versions:
+            return False
+        self._remove(key)
+        self.entries[key] = (value, time.monotonic() + ttl, tags)
+        for tag in tags:
+            self.tag_keys.setdefault(tag, set()).add(key)
+        while len(self.entries) > self.max_entries:
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return self._remove(key)
+
+    async def invalidate_tags(self, tags) -> int:
+        now = time.monotonic()
+        for tag in tags:
+            version = self.versions.pop(tag, (0,))[0] + 1
+            self.versions[tag] = (version, now)
+        while self.versions and next(iter(self.versions.values()))[1] < now - CACHE_MAX_TTL_SECONDS:
+            self.versions.popitem(last=False)
+        keys = set().union(*(self.tag_keys.get(tag, ()) for tag in tags))
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    async def clear(self):
+        self.entries.clear()
+        self.tag_keys.clear()
+
+    async def size(self) -> int:
+        return len(self.entries)
+
+class DiskCacheBackend:
+    """sqlite-backed cache: survives restarts and is shared by workers on one host.
+
+    Values are pickled, so only point it at a file this service owns. Calls run
+    in the thread pool over one connection guarded by a lock.
+    """
+    name = "disk"
+
+    def __init__(self, path: str = CACHE_DISK_PATH, max_entries: int = CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.connection: Optional[sqlite3.Connection] = None
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            connection.executescript(
+                "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value BLOB, expires_at REAL, accessed_at REAL);"
+                "CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed_at);"
+                "CREATE TABLE IF NOT EXISTS cache_tags (tag TEXT, key TEXT, PRIMARY KEY (tag, key));"
+                "CREATE INDEX IF NOT EXISTS cache_tags_key ON cache_tags (key);"
+                "CREATE TABLE IF NOT EXISTS cache_tag_versions (tag TEXT PRIMARY KEY, version INTEGER, bumped_at REAL);"
+                "CREATE INDEX IF NOT EXISTS cache_tag_versions_bumped ON cache_tag_versions (bumped_at);"
+            )
+            self.connection = connection
+        return self.connection
+
+    def _run(self, operation, *args):
+        with self.lock:
+            return operation(self._connect(), *args)
+
+    @staticmethod
+    def _delete_keys(connection: sqlite3.Connection, keys: List[str]) -> int:
+        deleted = 0
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            deleted += connection.execute(f"DELETE FROM cache_entries WHERE key IN ({marks})", chunk).rowcount
+            connection.execute(f"DELETE FROM cache_tags WHERE key IN ({marks})", chunk)
+        return deleted
+
+    @staticmethod
+    def _versions(connection: sqlite3.Connection, tags: List[str]) -> Dict[str, int]:
+        marks = ",".join("?" * len(tags))
+        found = dict(connection.execute(f"SELECT tag, version FROM cache_tag_versions WHERE tag IN ({marks})", tags))
+        return {tag: found.get(tag, 0) for tag in tags}
+
+    def _get(self, connection: sqlite3.Connection, key: str) -> Any:
+        row = connection.execute("SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return CACHE_MISS
+        now = time.time()
+        if row[1] <= now:
+            self._delete_keys(connection, [key])
+            return CACHE_MISS
+        connection.execute("UPDATE cache_entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return pickle.loads(row[0])
+
+    def _set(self, connection: sqlite3.Connection, key: str, value: bytes, ttl: float, tags: tuple, versions: Optional[Dict[str, int]]) -> bool:
+        now = time.time()
+        with connection:
+            # IMMEDIATE takes the write lock first, so no other worker invalidates between the check and the write
+            connection.execute("BEGIN IMMEDIATE")
+            if versions is not None and self._versions(connection, list(versions)) != versions:
+                return False
+            connection.execute("DELETE FROM cache_tags WHERE key = ?", (key,))
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now)
+            )
+            connection.executemany("INSERT OR IGNORE INTO cache_tags (tag, key) VALUES (?, ?)", [(tag, key) for tag in tags])
+            excess = connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0] - self.max_entries
+            if excess > 0:
+                # Expired entries go first, then the least recently read
+                victims = [row[0] for row in connection.execute(
+                    "SELECT key FROM cache_entries ORDER BY expires_at <= ? DESC, accessed_at LIMIT ?", (now, excess)
+                )]
+                self.evictions += self._delete_keys(connection, victims)
+        return True
+
+    def _invalidate(self, connection: sqlite3.Connection, tags: List[str]) -> int:
+        now = time.time()
+        marks = ",".join("?" * len(tags))
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.executemany(
+                "INSERT INTO cache_tag_versions (tag, version, bumped_at) VALUES (?, 1, ?) "
+                "ON CONFLICT (tag) DO UPDATE SET version = version + 1, bumped_at = excluded.bumped_at",
+                [(tag, now) for tag in tags]
+            )
+            connection.execute("DELETE FROM cache_tag_versions WHERE bumped_at < ?", (now - CACHE_MAX_TTL_SECONDS,))
+            keys = [row[0] for row in connection.execute(f"SELECT DISTINCT key FROM cache_tags WHERE tag IN ({marks})", tags)]
+            return self._delete_keys(connection, keys)
+
+    async def get(self, key: str) -> Any:
+        return await run_in_threadpool(self._run, self._get, key)
+
+    async def tag_versions(self, tags) -> Dict[str, int]:
+        return await run_in_threadpool(self._run, self._versions, list(tags))
+
+    async def set(self, key: str, value: Any, ttl: float, tags: tuple, versions: Optional[Dict[str, int]] = None) -> bool:
+        value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return await run_in_threadpool(self._run, self._set, key, value, ttl, tags, versions)
+
+    async def delete(self, key: str) -> bool:
+        return bool(await run_in_threadpool(self._run, self._delete_keys, [key]))
+
+    async def invalidate_tags(self, tags) -> int:
+        tags = list(tags)
+        return await run_in_threadpool(self._run, self._invalidate, tags) if tags else 0
+
+    async def clear(self):
+        await run_in_threadpool(self._run, lambda connection: connection.executescript("DELETE FROM cache_entries; DELETE FROM cache_tags;"))
+
+    async def size(self) -> int:
+        return await run_in_threadpool(self._run, lambda connection: connection.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0])
+
+class RedisCacheBackend:
+    """Redis (or any server speaking its protocol) via a redis.asyncio-compatible client.
+
+    Pass ``client`` to use a stand-in such as fakeredis in tests; otherwise one is
+    created from CACHE_REDIS_URL. Each tag is a set of the keys carrying it, with
+    its version in a separate counter.
+    """
+    name = "redis"
+
+    def __init__(self, client=None, url: str = CACHE_REDIS_URL, prefix: str = CACHE_REDIS_PREFIX):
+        if client is None:
+            try:
+                import redis.asyncio as redis_asyncio
+            except ImportError as e:
+                raise RuntimeError("CACHE_BACKEND=redis needs the redis package (pip install redis)") from e
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.prefix = prefix
+        self.evictions = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _version(self, tag: str) -> str:
+        return f"{self.prefix}version:{tag}"
+
+    async def tag_versions(self, tags) -> Dict[str, int]:
+        tags = list(tags)
+        values = await self.client.mget([self._version(tag) for tag in tags])
+        return {tag: int(value or 0) for tag, value in zip(tags, values)}
+
+    async def get(self, key: str) -> Any:
+        value = await self.client.get(self._key(key))
+        return CACHE_MISS if value is None else pickle.loads(value)
+
+    async def set(self, key: str, value: Any, ttl: float, tags: tuple, versions: Optional[Dict[str, int]] = None) -> bool:
+        if versions is not None and await self.tag_versions(versions) != versions:
+            return False
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(key), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), px=max(1, int(ttl * 1000)))
+            for tag in tags:
+                pipe.sadd(self._tag(tag), key)
+                pipe.expire(self._tag(tag), CACHE_MAX_TTL_SECONDS)
+            await pipe.execute()
+        if versions is not None and await self.tag_versions(versions) != versions:
+            # An invalidation bumped a version between the check and the write and
+            # may have read the tag set before this key joined it
+            await self.client.delete(self._key(key))
+            return False
+        return True
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self.client.delete(self._key(key)))
+
+    async def invalidate_tags(self, tags) -> int:
+        invalidated = 0
+        for tag in tags:
+            # Bump first: a concurrent set either sees the new version or is in the tag set read below
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.incr(self._version(tag))
+                pipe.expire(self._version(tag), CACHE_MAX_TTL_SECONDS)
+                await pipe.execute()
+            keys = await self.client.smembers(self._tag(tag))
+            if keys:
+                invalidated += await self.client.delete(*(self._key(key.decode() if isinstance(key, bytes) else key) for key in keys))
+            await self.client.delete(self._tag(tag))
+        return invalidated
+
+    async def clear(self):
+        # Versions stay so that loads started before the clear still see a changed one
+        versions = self._version("").encode()
+        keys = [
+            key async for key in self.client.scan_iter(match=f"{self.prefix}*")
+            if not (key if isinstance(key, bytes) else key.encode()).startswith(versions)
+        ]
+        for start in range(0, len(keys), 500):
+            await self.client.delete(*keys[start:start + 500])
+
+    async def size(self) -> Optional[int]:
+        return None
+
+def create_cache_backend(kind: str = CACHE_BACKEND):
+    if kind == "memory":
+        return MemoryCacheBackend()
+    if kind == "disk":
+        return DiskCacheBackend()
+    if kind == "redis":
+        return RedisCacheBackend()
+    raise ValueError(f"Unknown CACHE_BACKEND {kind!r}; expected memory, disk or redis")
+
+class Cache:
+    """Cache front end: TTLs, tag invalidation, single-flight loading and hit/miss metrics.
+
+    Backend failures are logged and counted, then treated as misses, so a cache
+    outage slows requests down instead of failing them. Values handed out by the
+    memory backend are shared; callers must not mutate them.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+    def count(self, key: str, counter: str):
+        namespace = key.split(":", 1)[0]
+        counters = self.counters.get(namespace)
+        if counters is None:
+            counters = self.counters[namespace] = dict.fromkeys(CACHE_COUNTERS, 0)
+        counters[counter] += 1
+
+    async def lookup(self, key: str) -> Any:
+        """The cached value, or CACHE_MISS"""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("Cache get failed for %s: %s", key, e, extra={"sample_rate": HIGH_VOLUME_LOG_SAMPLE_RATE})
+            self.count(key, "errors")
+            value = CACHE_MISS
+        self.count(key, "misses" if value is CACHE_MISS else "hits")
+        return value
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = await self.lookup(key)
+        return default if value is CACHE_MISS else value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None, tags=(), versions: Optional[Dict[str, int]] = None):
+        """Store value; with ``versions`` (from tag_versions) only if none of those tags was invalidated since"""
+        ttl = min(ttl or CACHE_DEFAULT_TTL_SECONDS, CACHE_MAX_TTL_SECONDS)
+        try:
+            stored = await self.backend.set(key, value, ttl, tuple(tags), versions)
+            self.count(key, "sets" if stored else "stale_skips")
+        except Exception as e:
+            logger.warning("Cache set failed for %s: %s", key, e)
+            self.count(key, "errors")
+
+    async def delete(self, key: str):
+        try:
+            await self.backend.delete(key)
+            self.count(key, "deletes")
+        except Exception as e:
+            logger.warning("Cache delete failed for %s: %s", key, e)
+            self.count(key, "errors")
+
+    async def tag_versions(self, key: str, tags) -> Optional[Dict[str, int]]:
+        try:
+            return await self.backend.tag_versions((CACHE_CLEAR_TAG, *tags))
+        except Exception as e:
+            logger.warning("Cache tag versions failed for %s: %s", key, e)
+            self.count(key, "errors")
+            return None
+
+    async def invalidate(self, *tags: str) -> int:
+        try:
+            return await self.backend.invalidate_tags(tags)
+        except Exception as e:
+            logger.warning("Cache invalidation failed for %s: %s", tags, e)
+            self.count("invalidate", "errors")
+            return 0
+
+    async def clear(self):
+        await self.backend.clear()
+        await self.backend.invalidate_tags((CACHE_CLEAR_TAG,))
+
+    async def get_or_set(self, key: str, loader, ttl: Optional[float] = None, tags=()) -> Any:
+        """Cached value, or ``await loader()`` stored under key; concurrent misses share one load"""
+        value = await self.lookup(key)
+        if value is not CACHE_MISS:
+            return value
+        pending = self.inflight.get(key)
+        if pending is not None:
+            self.count(key, "coalesced")
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self.inflight[key] = future
+        try:
+            versions = await self.tag_versions(key, tags)
+            value = await loader()
+            if versions is not None:
+                await self.set(key, value, ttl, tags, versions)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark it retrieved so an unawaited future is not logged
+            future.exception()
+            raise
+        finally:
+            self.inflight.pop(key, None)
+
+    async def stats(self) -> dict:
+        try:
+            entries = await self.backend.size()
+        except Exception as e:
+            logger.warning("Cache size failed: %s", e)
+            entries = None
+        return {
+            "backend": self.backend.name,
+            "entries": entries,
+            "evictions": self.backend.evictions,
+            "namespaces": {
+                namespace: {
+                    **counters,
+                    "hit_ratio": round(counters["hits"] / (counters["hits"] + counters["misses"]), 4)
+                    if counters["hits"] + counters["misses"] else None,
+                }
+                for namespace, counters in sorted(self.counters.items())
+            },
+        }
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP impact_cache_operations_total Cache operations by key namespace and outcome",
+            "# TYPE impact_cache_operations_total counter",
+        ]
+        for namespace, counters in sorted(self.counters.items()):
+            for counter, value in counters.items():
+                lines.append(f'impact_cache_operations_total{{backend="{self.backend.name}",namespace="{namespace}",result="{counter}"}} {value}')
+        lines.append("# HELP impact_cache_evictions_total Entries evicted to stay under CACHE_MAX_ENTRIES")
+        lines.append("# TYPE impact_cache_evictions_total counter")
+        lines.append(f'impact_cache_evictions_total{{backend="{self.backend.name}"}} {self.backend.evictions}')
+        return "\n".join(lines) + "\n"
+
+cache = Cache(create_cache_backend())
+
+# Per-use TTLs. Writes through this process invalidate by tag straight away; the TTL
+# bounds staleness for other workers when the backend is per-process memory.
+# With per-process memory, a lockout (rejection, deletion) made on one worker reaches
+# the others only when their copy expires, so keep that window to a few seconds
+AUTH_USER_CACHE_TTL_SECONDS = int(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "5" if CACHE_BACKEND == "memory" else "30"))
+ADMIN_DASHBOARD_CACHE_TTL_SECONDS = int(os.getenv("ADMIN_DASHBOARD_CACHE_TTL_SECONDS", "30"))
+ORGANIZATION_ASSESSMENTS_CACHE_TTL_SECONDS = int(os.getenv("ORGANIZATION_ASSESSMENTS_CACHE_TTL_SECONDS", "60"))
+PREDICTIVE_ANALYTICS_CACHE_TTL_SECONDS = int(os.getenv("PREDICTIVE_ANALYTICS_CACHE_TTL_SECONDS", "3600"))
+# Generated playbooks cost an LLM call each, so keep them for the longest allowed
+PLAYBOOK_CACHE_TTL_SECONDS = int(os.getenv("PLAYBOOK_CACHE_TTL_SECONDS", str(CACHE_MAX_TTL_SECONDS)))
+
+# Mongo command monitoring - per-request command counts, DB time and slow-command log
+SLOW_MONGO_COMMAND_MS = float(os.getenv("SLOW_MONGO_COMMAND_MS", "100"))
+
+class RequestDBStats:
+    """Mongo commands attributed to one request.
+
+    Motor runs pymongo on executor threads with the request's context copied
+    over, so listener callbacks for concurrent queries can race on these fields.
+    """
+    __slots__ = ("command_count", "duration_micros", "_lock")
+
+    def __init__(self):
+        self.command_count = 0
+        self.duration_micros = 0
+        self._lock = threading.Lock()
+
+    def record(self, duration_micros: int):
+        with self._lock:
+            self.command_count += 1
+            self.duration_micros += duration_micros
+
+current_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar("current_db_stats", default=None)
+
+# Where each command keeps the document it filters on
+COMMAND_FILTER_FIELDS = {
+    "find": "filter",
+    "count": "query",
+    "findAndModify": "query",
+    "distinct": "query",
+    "aggregate": "pipeline",
+}
+BATCH_FILTER_FIELDS = {"update": "updates", "delete": "deletes"}
+
+def query_shape(value: Any) -> Any:
+    """Replace literal values with '?' so filters can be logged without user data"""
+    if isinstance(value, dict):
+        return {key: query_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [query_shape(item) for item in value[:1]] if value else []
+    return "?"
+
+def command_filter_shape(command_name: str, command: dict) -> Any:
+    if command_name in COMMAND_FILTER_FIELDS:
+        return query_shape(command.get(COMMAND_FILTER_FIELDS[command_name], {}))
+    batch_field = BATCH_FILTER_FIELDS.get(command_name)
+    if batch_field and command.get(batch_field):
+        return query_shape(command[batch_field][0].get("q", {}))
+    return None
+
+class MongoCommandMonitor(monitoring.CommandListener):
+    """Attributes Mongo commands to the current request and logs slow ones"""
+
+    def __init__(self, slow_command_ms: float):
+        self.slow_command_micros = slow_command_ms * 1000
+        self._pending: Dict[tuple, tuple] = {}
+
+    def started(self, event):
+        # Only the slow path needs the command body, so keep a reference until completion
+        self._pending[(event.connection_id, event.request_id)] = (event.command, event.database_name)
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event)
+
+    def _finish(self, event):
+        command, database_name = self._pending.pop((event.connection_id, event.request_id), (None, None))
+        stats = current_db_stats.get()
+        if stats is not None:
+            stats.record(event.duration_micros)
+        if event.duration_micros >= self.slow_command_micros and command is not None:
+            collection = command.get(event.command_name)
+            shape = command_filter_shape(event.command_name, command)
+            logger.warning(
+                "Slow Mongo command: %s %s.%s took %.1f ms filter=%s",
+                event.command_name, database_name, collection, event.duration_micros / 1000, shape,
+                extra={"sample_rate": HIGH_VOLUME_LOG_SAMPLE_RATE},
+            )
+
+mongo_command_monitor = MongoCommandMonitor(SLOW_MONGO_COMMAND_MS)
+
+class DBTimingMiddleware:
+    """Scopes RequestDBStats to each request and reports them in a Server-Timing header"""
+
+    def __init__(self, app, registry: MetricsRegistry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestDBStats()
+        token = current_db_stats.set(stats)
+
+        async def send_with_server_timing(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration_micros / 1000:.1f};desc="{stats.command_count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        finally:
+            current_db_stats.reset(token)
+            route = scope.get("route")
+            self.registry.observe_db(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                stats.command_count,
+                stats.duration_micros / 1_000_000,
+            )
+
+app.add_middleware(DBTimingMiddleware, registry=request_metrics)
+
+class RequestIDMiddleware:
+    """Binds X-Request-ID (or a fresh id) to the request's log records and echoes it back"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        token = current_request_id.set(request_id)
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            current_request_id.reset(token)
+
+app.add_middleware(RequestIDMiddleware)
+
+@app.on_event("shutdown")
+async def flush_logs():
+    log_listener.stop()
+
 # Database configuration
 MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017")
 DB_NAME = os.getenv("DB_NAME", "impact_methodology")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "sk-ant-REDACTED")
 
 # MongoDB client
-client = AsyncIOMotorClient(MONGO_URL)
+client = AsyncIOMotorClient(MONGO_URL, event_listeners=[mongo_command_monitor])
 db = client[DB_NAME]
 
 # Security
@@ -597,6 +1492,11 @@ class UserApprovalRequest(BaseModel):
     action: str  # approve, reject
     rejection_reason: Optional[str] = None
 
+class BulkUserApprovalRequest(BaseModel):
+    user_ids: List[str]
+    action: str  # approve, reject
+    rejection_reason: Optional[str] = None
+
 class ProjectAssignment(BaseModel):
     project_id: str
     user_id: str
@@ -723,6 +1623,23 @@ class Milestone(BaseModel):
     approved_by: Optional[str] = None
     approval_date: Optional[datetime] = None
 
+# Fields the work item endpoints may change
+TASK_UPDATE_FIELDS = ("status", "assigned_to", "notes", "priority")
+DELIVERABLE_UPDATE_FIELDS = ("status", "assigned_to", "content", "file_url", "approval_notes")
+WORK_ITEM_FILTERS_PER_UPDATE = 100
+
+# Project list pagination
+PROJECT_PAGE_DEFAULT_LIMIT = 50
+PROJECT_PAGE_MAX_LIMIT = 100
+
+class WorkItemChange(BaseModel):
+    id: str
+    changes: Dict[str, Any]
+
+class BulkWorkItemUpdate(BaseModel):
+    tasks: List[WorkItemChange] = []
+    deliverables: List[WorkItemChange] = []
+
 class PhaseGateReview(BaseModel):
     id: Optional[str] = None
     phase: str
@@ -854,16 +1771,23 @@ def create_jwt_token(user_id: str, email: str) -> str:
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Get current user from JWT token"""
+    return await authenticate_token(credentials.credentials)
+
+async def authenticate_token(token: str) -> User:
+    """Resolve a JWT to its user; shared by bearer auth and WebSocket query-string auth"""
     try:
-        token = credentials.credentials
-        print(f"Received token: {token}")
         payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
         user_id = payload.get("user_id")
         if not user_id:
             raise HTTPException(status_code=401, detail="Invalid token")
         
-        user = await db.users.find_one({"id": user_id})
-        if not user:
+        user = await cache.get_or_set(
+            f"user:{user_id}",
+            lambda: db.users.find_one({"id": user_id}),
+            ttl=AUTH_USER_CACHE_TTL_SECONDS,
+            tags=(f"user:{user_id}",),
+        )
+        if not user or user.get("status") == "deleting":
             raise HTTPException(status_code=401, detail="User not found")
         
         return User(**user)
@@ -872,25 +1796,162 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     except Exception as e:
-        print(f"Authentication error: {str(e)}")
+        logger.warning("Authentication error: %s", e, extra={"sample_rate": HIGH_VOLUME_LOG_SAMPLE_RATE})
         raise HTTPException(status_code=401, detail=f"Authentication error: {str(e)}")
 
+# ====================================================================================
+# ASSESSMENT SCORE VECTORS - ONE DIMENSION REGISTRY FOR ALL ANALYTICS
+# ====================================================================================
+
+# Older assessment models and analytics name two dimensions differently from ASSESSMENT_TYPES
+SCORE_DIMENSION_ALIASES = {
+    "leadership_support": "leadership_commitment",
+    "resource_adequacy": "resource_availability",
+}
+# Every dimension in ASSESSMENT_TYPES, then those only the change readiness,
+# manufacturing EAM and project analytics code paths score
+SCORE_DIMENSIONS = tuple(dict.fromkeys(
+    [dimension["id"] for type_config in ASSESSMENT_TYPES.values() for dimension in type_config["dimensions"]] + [
+        "change_management_maturity", "communication_effectiveness", "workforce_adaptability",
+        "technical_readiness", "manufacturing_constraints", "shift_work_considerations",
+    ]
+))
+SCORE_DIMENSION_INDEX = {dimension: index for index, dimension in enumerate(SCORE_DIMENSIONS)}
+SCORE_DIMENSION_INDEX.update((alias, SCORE_DIMENSION_INDEX[canonical]) for alias, canonical in SCORE_DIMENSION_ALIASES.items())
+
+# Core dimensions, then the manufacturing-specific ones, scored by the manufacturing EAM assessment
+MANUFACTURING_EAM_DIMENSIONS = (
+    "leadership_commitment", "organizational_culture", "resource_availability",
+    "stakeholder_engagement", "training_capability",
+    "manufacturing_constraints", "maintenance_operations_alignment",
+    "shift_work_considerations", "technical_readiness", "safety_compliance",
+)
+
+def score_columns(dimensions) -> List[int]:
+    """Column of each dimension (canonical or alias) in a ScoreVector or stacked matrix"""
+    return [SCORE_DIMENSION_INDEX[dimension] for dimension in dimensions]
+
+def score_value(value: float):
+    # Scores are whole numbers on the 1-5 scale; keep them ints in payloads and messages
+    return int(value) if value.is_integer() else value
+
+class ScoreVector(Mapping):
+    """Assessment dimension scores as one float array over SCORE_DIMENSIONS.
+
+    Unscored dimensions are NaN. Lookups accept canonical names and aliases, so
+    ``scores.get("leadership_support", 3)`` reads leadership_commitment; iteration
+    yields overall_score (when known) then the scored dimensions by canonical name.
+    Every analytic helper that takes an ``assessment_data`` dict also takes a
+    ScoreVector, and ``stack`` turns a batch into a matrix for column-wise maths.
+    """
+    __slots__ = ("values", "overall_score")
+
+    def __init__(self, values: np.ndarray, overall_score: Optional[float] = None):
+        self.values = values
+        self.overall_score = overall_score
+
+    @classmethod
+    def empty(cls) -> "ScoreVector":
+        return cls(np.full(len(SCORE_DIMENSIONS), np.nan))
+
+    @classmethod
+    def from_scores(cls, scores: Dict[str, Any], overall_score: Optional[float] = None) -> "ScoreVector":
+        """From flat {dimension: score}; an overall_score key is kept, unknown keys are ignored"""
+        vector = cls.empty()
+        vector.overall_score = scores.get("overall_score", overall_score)
+        for dimension, score in scores.items():
+            index = SCORE_DIMENSION_INDEX.get(dimension)
+            # A canonical score wins over its alias when a document carries both
+            if index is not None and isinstance(score, (int, float)) and (
+                dimension not in SCORE_DIMENSION_ALIASES or np.isnan(vector.values[index])
+            ):
+                vector.values[index] = score
+        return vector
+
+    @classmethod
+    def from_assessment(cls, assessment: Dict[str, Any], dimensions=None) -> "ScoreVector":
+        """From an assessment document or request body shaped {dimension: {"score": n}}"""
+        if isinstance(assessment, ScoreVector):
+            return assessment if dimensions is None else assessment.restrict(dimensions)
+        scores = {}
+        for dimension in (SCORE_DIMENSION_INDEX if dimensions is None else dimensions):
+            entry = assessment.get(dimension)
+            if isinstance(entry, dict) and entry.get("score") is not None:
+                scores[dimension] = entry["score"]
+        overall_score = assessment.get("overall_score")
+        return cls.from_scores(scores, overall_score if isinstance(overall_score, (int, float)) else None)
+
+    @classmethod
+    def coerce(cls, scores) -> "ScoreVector":
+        """Pass a ScoreVector through; build one from a flat score dict"""
+        return scores if isinstance(scores, ScoreVector) else cls.from_scores(scores or {})
+
+    @staticmethod
+    def stack(vectors: List["ScoreVector"]) -> np.ndarray:
+        """(len(vectors), len(SCORE_DIMENSIONS)) matrix; NaN where a dimension is unscored"""
+        if not vectors:
+            return np.empty((0, len(SCORE_DIMENSIONS)))
+        return np.vstack([vector.values for vector in vectors])
+
+    def restrict(self, dimensions, fill: Optional[float] = None, with_overall: bool = True) -> "ScoreVector":
+        """Only the given dimensions, with unscored ones set to ``fill`` when given"""
+        vector = ScoreVector.empty()
+        columns = score_columns(dimensions)
+        taken = self.values[columns]
+        vector.values[columns] = taken if fill is None else np.where(np.isnan(taken), fill, taken)
+        if with_overall:
+            vector.overall_score = self.overall_score
+        return vector
+
+    def take(self, dimensions, default: float = 3.0) -> np.ndarray:
+        taken = self.values[score_columns(dimensions)]
+        return np.where(np.isnan(taken), default, taken)
+
+    def mean(self, dimensions=None) -> float:
+        """Average of the scored dimensions among ``dimensions`` (all by default); 0 when none are scored"""
+        taken = self.values if dimensions is None else self.values[score_columns(dimensions)]
+        taken = taken[~np.isnan(taken)]
+        return float(taken.mean()) if taken.size else 0
+
+    def weighted(self, weights: Dict[str, float], default: float = 3.0) -> float:
+        return float(np.dot(self.take(weights.keys(), default), list(weights.values())))
+
+    def get(self, dimension: str, default=None):
+        index = SCORE_DIMENSION_INDEX.get(dimension)
+        if index is None:
+            if dimension == "overall_score" and self.overall_score is not None:
+                return self.overall_score
+            return default
+        value = self.values[index]
+        return default if value != value else score_value(float(value))
+
+    def __getitem__(self, dimension: str):
+        value = self.get(dimension)
+        if value is None:
+            raise KeyError(dimension)
+        return value
+
+    def __contains__(self, dimension) -> bool:
+        return self.get(dimension) is not None
+
+    def __iter__(self):
+        if self.overall_score is not None:
+            yield "overall_score"
+        for index in np.flatnonzero(~np.isnan(self.values)):
+            yield SCORE_DIMENSIONS[index]
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.values))) + (self.overall_score is not None)
+
+    def __repr__(self) -> str:
+        return f"ScoreVector({dict(self.items())})"
+
 def calculate_universal_readiness_analysis(assessment_data: dict, assessment_type: str) -> Dict[str, Any]:
     """Calculate universal readiness analysis for any assessment type"""
-    # Extract scores from assessment data
-    scores = []
-    dimension_scores = {}
-    
+    # Average the scored dimensions of this assessment type
     type_config = ASSESSMENT_TYPES.get(assessment_type, ASSESSMENT_TYPES["general_readiness"])
-    
-    for dimension in type_config["dimensions"]:
-        dim_id = dimension["id"]
-        if dim_id in assessment_data and "score" in assessment_data[dim_id]:
-            score = assessment_data[dim_id]["score"]
-            scores.append(score)
-            dimension_scores[dim_id] = score
-    
-    avg_score = sum(scores) / len(scores) if scores else 0
+    scores = ScoreVector.from_assessment(assessment_data)
+    avg_score = scores.mean(dimension["id"] for dimension in type_config["dimensions"])
     
     # Calculate organizational inertia based on type
     base_inertia = (5 - avg_score) * 20
@@ -1434,14 +2495,11 @@ def predict_task_success_probability(task_id: str, assessment_data: dict, overal
         return {"success_probability": 70.0, "risk_level": "Medium", "confidence": "Low"}
     
     task_info = task_risk_factors[task_id]
+    scores = ScoreVector.coerce(assessment_data)
     
     # Calculate risk score based on primary factors
-    factor_scores = []
-    for factor in task_info["primary_factors"]:
-        score = assessment_data.get(factor, 3.0)
-        factor_scores.append(score)
-    
-    avg_factor_score = sum(factor_scores) / len(factor_scores)
+    factor_scores = scores.take(task_info["primary_factors"])
+    avg_factor_score = float(factor_scores.mean())
     
     # Calculate success probability
     base_success = 100 - (task_info["base_risk"] * 100)
@@ -1465,7 +2523,7 @@ def predict_task_success_probability(task_id: str, assessment_data: dict, overal
         "success_probability": round(success_probability, 1),
         "risk_level": risk_level,
         "primary_factors": task_info["primary_factors"],
-        "factor_scores": {factor: assessment_data.get(factor, 3.0) for factor in task_info["primary_factors"]},
+        "factor_scores": {factor: scores.get(factor, 3.0) for factor in task_info["primary_factors"]},
         "critical_dependencies": task_info["critical_dependencies"],
         "confidence": "High" if len(factor_scores) >= 2 else "Medium"
     }
@@ -1497,21 +2555,20 @@ def predict_budget_overrun_risk(assessment_data: dict, overall_score: float, tot
         }
     }
     
-    # Calculate weighted risk score
-    weighted_risk = 0
-    risk_details = []
+    # Calculate weighted risk score; higher risk for lower scores
+    scores = ScoreVector.coerce(assessment_data)
+    risk_contributions = (3.0 - scores.take(budget_risk_factors)) * [config["weight"] for config in budget_risk_factors.values()]
+    weighted_risk = float(risk_contributions.sum())
     
-    for factor, config in budget_risk_factors.items():
-        score = assessment_data.get(factor, 3.0)
-        risk_contribution = (3.0 - score) * config["weight"]  # Higher risk for lower scores
-        weighted_risk += risk_contribution
-        
-        risk_details.append({
+    risk_details = [
+        {
             "factor": factor,
-            "score": score,
-            "risk_contribution": round(risk_contribution, 2),
+            "score": scores.get(factor, 3.0),
+            "risk_contribution": round(float(risk_contribution), 2),
             "impact_description": config["impact"]
-        })
+        }
+        for (factor, config), risk_contribution in zip(budget_risk_factors.items(), risk_contributions)
+    ]
     
     # Calculate overrun probability and amount
     base_overrun_rate = 0.15  # 15% base overrun rate
@@ -1569,13 +2626,9 @@ def predict_scope_creep_risk(assessment_data: dict, assessment_type: str) -> dic
     
     pattern = scope_risk_patterns.get(assessment_type, scope_risk_patterns["general_readiness"])
     
-    # Calculate scope creep probability
-    risk_scores = []
-    for factor in pattern["high_risk_factors"]:
-        score = assessment_data.get(factor, 3.0)
-        risk_scores.append(3.0 - score)  # Higher risk for lower scores
-    
-    avg_risk_score = sum(risk_scores) / len(risk_scores)
+    # Calculate scope creep probability; higher risk for lower scores
+    scores = ScoreVector.coerce(assessment_data)
+    avg_risk_score = float((3.0 - scores.take(pattern["high_risk_factors"])).mean())
     scope_creep_probability = (pattern["base_risk"] + avg_risk_score * 0.15) * 100
     scope_creep_probability = max(10, min(70, scope_creep_probability))
     
@@ -1595,7 +2648,7 @@ def predict_scope_creep_risk(assessment_data: dict, assessment_type: str) -> dic
         "impact_level": impact_level,
         "expected_impact": expected_impact,
         "high_risk_factors": pattern["high_risk_factors"],
-        "factor_scores": {factor: assessment_data.get(factor, 3.0) for factor in pattern["high_risk_factors"]},
+        "factor_scores": {factor: scores.get(factor, 3.0) for factor in pattern["high_risk_factors"]},
         "typical_scope_additions": pattern["typical_scope_additions"],
         "mitigation_strategies": generate_scope_creep_mitigation(pattern["high_risk_factors"], assessment_data)
     }
@@ -1873,7 +2926,7 @@ def generate_detailed_budget_tracking(project_data: dict, assessment_data: dict,
     total_remaining = total_budgeted - total_spent
     
     # Generate budget alerts
-    budget_alerts = generate_budget_alerts(task_level_budgets, phase_level_budgets, total_budgeted, total_spent)
+    budget_alerts = generate_budget_alerts(task_level_budgets, list(phase_level_budgets.values()), total_budgeted, total_spent)
     
     # Calculate cost performance metrics
     cost_performance = calculate_cost_performance_metrics(task_level_budgets, total_budgeted, total_spent)
@@ -1901,6 +2954,14 @@ def generate_detailed_budget_tracking(project_data: dict, assessment_data: dict,
         "generated_at": datetime.utcnow()
     }
 
+# (threshold %, alert type, severity, message, recommended action), checked highest first
+OVERALL_BUDGET_ALERT_LEVELS = (
+    (90, "Critical", "High", "Project budget {value:.1f}% utilized - immediate action required",
+     "Implement emergency cost controls and review remaining scope"),
+    (75, "Warning", "Medium", "Project budget {value:.1f}% utilized - monitor closely",
+     "Review upcoming expenses and optimize resource allocation"),
+)
+
 def generate_budget_alerts(task_budgets: List[dict], phase_budgets: List[dict], total_budgeted: float, total_spent: float) -> List[dict]:
     """Generate real-time budget alerts based on spending patterns"""
     alerts = []
@@ -1908,24 +2969,16 @@ def generate_budget_alerts(task_budgets: List[dict], phase_budgets: List[dict],
     # Overall budget alerts
     utilization = (total_spent / total_budgeted * 100) if total_budgeted > 0 else 0
     
-    if utilization > 90:
+    level = alert_level(utilization, OVERALL_BUDGET_ALERT_LEVELS)
+    if level:
+        threshold, alert_type, severity, message, recommended_action = level
         alerts.append({
-            "type": "Critical",
+            "type": alert_type,
             "category": "Overall Budget",
-            "severity": "High",
-            "message": f"Project budget {utilization:.1f}% utilized - immediate action required",
-            "recommended_action": "Implement emergency cost controls and review remaining scope",
-            "threshold": 90,
-            "current_value": utilization
-        })
-    elif utilization > 75:
-        alerts.append({
-            "type": "Warning",
-            "category": "Overall Budget", 
-            "severity": "Medium",
-            "message": f"Project budget {utilization:.1f}% utilized - monitor closely",
-            "recommended_action": "Review upcoming expenses and optimize resource allocation",
-            "threshold": 75,
+            "severity": severity,
+            "message": message.format(value=utilization),
+            "recommended_action": recommended_action,
+            "threshold": threshold,
             "current_value": utilization
         })
     
@@ -2311,74 +3364,137 @@ async def get_admin_user(current_user: User = Depends(get_current_user)):
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
+@app.get("/api/admin/metrics", response_class=PlainTextResponse)
+async def get_request_metrics(admin_user: User = Depends(get_admin_user)):
+    """Request metrics in Prometheus text exposition format"""
+    return PlainTextResponse(
+        request_metrics.render_prometheus() + cache.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+class CacheInvalidationRequest(BaseModel):
+    tags: List[str] = []
+    clear: bool = False
+
+@app.get("/api/admin/cache")
+async def get_cache_stats(admin_user: User = Depends(get_admin_user)):
+    """Cache backend, size and per-namespace hit/miss counters for this process"""
+    try:
+        return await cache.stats()
+    except Exception as e:
+        logger.exception("Cache Stats Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
+
+@app.post("/api/admin/cache/invalidate")
+async def invalidate_cache(request: CacheInvalidationRequest, admin_user: User = Depends(get_admin_user)):
+    """Drop entries carrying any of the given tags (e.g. "org:Acme", "user:<id>"), or everything"""
+    if not request.clear and not request.tags:
+        raise HTTPException(status_code=400, detail="Give tags to invalidate or set clear")
+    try:
+        if request.clear:
+            await cache.clear()
+            invalidated = None
+        else:
+            invalidated = await cache.invalidate(*request.tags)
+        await log_user_activity(
+            admin_user.id,
+            "cache_invalidated",
+            "Cleared the cache" if request.clear else f"Invalidated cache tags: {', '.join(request.tags)}"
+        )
+        return {"cleared": request.clear, "tags": request.tags, "invalidated": invalidated}
+    except Exception as e:
+        logger.exception("Cache Invalidation Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to invalidate cache: {str(e)}")
+
+async def build_admin_dashboard() -> dict:
+    """Platform-wide user, project and assessment statistics for the admin center"""
+    (
+        # User statistics
+        total_users, pending_approvals, approved_users, rejected_users,
+        # Project and assessment statistics
+        active_projects, total_projects, total_assessments,
+        # Recent activities and pending notifications
+        recent_activities, pending_notifications,
+        # Platform usage statistics
+        daily_active_users, weekly_active_users, monthly_active_users,
+        project_completion_rate, assessment_completion_rate
+    ) = await asyncio.gather(
+        db.users.count_documents({}),
+        db.users.count_documents({"status": "pending_approval"}),
+        db.users.count_documents({"status": "approved"}),
+        db.users.count_documents({"status": "rejected"}),
+        db.projects.count_documents({"status": "active"}),
+        db.projects.count_documents({}),
+        db.assessments.count_documents({}),
+        find_activities({}, 10),
+        db.admin_notifications.find({"resolved": False}).sort("created_at", -1).limit(5).to_list(5),
+        calculate_daily_active_users(),
+        calculate_weekly_active_users(),
+        calculate_monthly_active_users(),
+        calculate_project_completion_rate(),
+        calculate_assessment_completion_rate()
+    )
+    
+    platform_usage = {
+        "daily_active_users": daily_active_users,
+        "weekly_active_users": weekly_active_users,
+        "monthly_active_users": monthly_active_users,
+        "project_completion_rate": project_completion_rate,
+        "assessment_completion_rate": assessment_completion_rate
+    }
+    
+    dashboard_stats = {
+        "user_statistics": {
+            "total_users": total_users,
+            "pending_approvals": pending_approvals,
+            "approved_users": approved_users,
+            "rejected_users": rejected_users
+        },
+        "project_statistics": {
+            "active_projects": active_projects,
+            "total_projects": total_projects,
+            "completion_rate": platform_usage["project_completion_rate"]
+        },
+        "assessment_statistics": {
+            "total_assessments": total_assessments,
+            "completion_rate": platform_usage["assessment_completion_rate"]
+        },
+        "platform_usage": platform_usage,
+        "recent_activities": recent_activities,
+        "pending_notifications": pending_notifications,
+        "generated_at": datetime.utcnow()
+    }
+    
+    return dashboard_stats
+
+async def cached_admin_dashboard() -> dict:
+    return await cache.get_or_set("admin_dashboard", build_admin_dashboard, ttl=ADMIN_DASHBOARD_CACHE_TTL_SECONDS)
+
 @app.get("/api/admin/dashboard")
 async def get_admin_dashboard(admin_user: User = Depends(get_admin_user)):
     """Get admin dashboard statistics"""
     try:
-        # Get user statistics
-        total_users = await db.users.count_documents({})
-        pending_approvals = await db.users.count_documents({"status": "pending_approval"})
-        approved_users = await db.users.count_documents({"status": "approved"})
-        rejected_users = await db.users.count_documents({"status": "rejected"})
-        
-        # Get project statistics
-        active_projects = await db.projects.count_documents({"status": "active"})
-        total_projects = await db.projects.count_documents({})
-        
-        # Get assessment statistics
-        total_assessments = await db.assessments.count_documents({})
-        
-        # Get recent activities
-        recent_activities = []
-        activities_cursor = db.user_activities.find({}).sort("timestamp", -1).limit(10)
-        async for activity in activities_cursor:
-            activity["_id"] = str(activity["_id"])
-            recent_activities.append(activity)
-        
-        # Get pending notifications
-        pending_notifications = []
-        notifications_cursor = db.admin_notifications.find({"resolved": False}).sort("created_at", -1).limit(5)
-        async for notification in notifications_cursor:
-            notification["_id"] = str(notification["_id"])
-            pending_notifications.append(notification)
-        
-        # Platform usage statistics
-        platform_usage = {
-            "daily_active_users": await calculate_daily_active_users(),
-            "weekly_active_users": await calculate_weekly_active_users(),
-            "monthly_active_users": await calculate_monthly_active_users(),
-            "project_completion_rate": await calculate_project_completion_rate(),
-            "assessment_completion_rate": await calculate_assessment_completion_rate()
-        }
-        
-        dashboard_stats = {
-            "user_statistics": {
-                "total_users": total_users,
-                "pending_approvals": pending_approvals,
-                "approved_users": approved_users,
-                "rejected_users": rejected_users
-            },
-            "project_statistics": {
-                "active_projects": active_projects,
-                "total_projects": total_projects,
-                "completion_rate": platform_usage["project_completion_rate"]
-            },
-            "assessment_statistics": {
-                "total_assessments": total_assessments,
-                "completion_rate": platform_usage["assessment_completion_rate"]
-            },
-            "platform_usage": platform_usage,
-            "recent_activities": recent_activities,
-            "pending_notifications": pending_notifications,
-            "generated_at": datetime.utcnow()
-        }
-        
-        return dashboard_stats
+        return await cached_admin_dashboard()
         
     except Exception as e:
-        print(f"Admin Dashboard Error: {str(e)}")
+        logger.exception("Admin Dashboard Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get admin dashboard: {str(e)}")
 
+async def list_users(query: dict, limit: int, offset: int) -> dict:
+    # Get users with pagination (sensitive data excluded by projection)
+    users, total_count = await asyncio.gather(
+        db.users.find(query, {"hashed_password": 0}).skip(offset).limit(limit).sort("created_at", -1).to_list(limit),
+        db.users.count_documents(query)
+    )
+    
+    return {
+        "users": users,
+        "total_count": total_count,
+        "offset": offset,
+        "limit": limit,
+        "has_more": offset + limit < total_count
+    }
+
 @app.get("/api/admin/users")
 async def get_all_users(
     status: Optional[str] = None,
@@ -2393,31 +3509,25 @@ async def get_all_users(
         if status:
             query["status"] = status
         
-        # Get users with pagination
-        users_cursor = db.users.find(query).skip(offset).limit(limit).sort("created_at", -1)
-        users = []
-        
-        async for user in users_cursor:
-            user["_id"] = str(user["_id"])
-            # Remove sensitive data
-            user.pop("hashed_password", None)
-            users.append(user)
-        
-        # Get total count
-        total_count = await db.users.count_documents(query)
-        
-        return {
-            "users": users,
-            "total_count": total_count,
-            "offset": offset,
-            "limit": limit,
-            "has_more": offset + limit < total_count
-        }
+        return await list_users(query, limit, offset)
         
     except Exception as e:
-        print(f"Get Users Error: {str(e)}")
+        logger.exception("Get Users Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get users: {str(e)}")
 
+async def resolve_registration_notifications(user_ids: List[str], resolved_by: str):
+    """Resolve pending-registration notifications once these users are handled"""
+    resolved = {"$set": {"resolved": True, "resolved_at": datetime.utcnow(), "resolved_by": resolved_by}}
+    await db.admin_notifications.update_many({"data.user_id": {"$in": user_ids}, "type": "user_registration"}, resolved)
+    # A bulk import raises one notification listing every user it created; it resolves with the last of them
+    await db.admin_notifications.update_many(
+        {"data.user_ids": {"$in": user_ids}, "type": "bulk_user_registration"},
+        {"$pull": {"data.user_ids": {"$in": user_ids}}}
+    )
+    await db.admin_notifications.update_many(
+        {"data.user_ids": {"$size": 0}, "type": "bulk_user_registration", "resolved": False}, resolved
+    )
+
 @app.post("/api/admin/users/approve")
 async def approve_user_registration(
     approval_request: UserApprovalRequest,
@@ -2429,6 +3539,8 @@ async def approve_user_registration(
         user = await db.users.find_one({"id": approval_request.user_id})
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
+        if user.get("status") == "deleting":
+            raise HTTPException(status_code=409, detail="User is being deleted")
         
         # Update user status
         update_data = {
@@ -2441,10 +3553,12 @@ async def approve_user_registration(
         if approval_request.action == "reject" and approval_request.rejection_reason:
             update_data["rejection_reason"] = approval_request.rejection_reason
         
+        # A deletion that started since the read above keeps the account locked out
         result = await db.users.update_one(
-            {"id": approval_request.user_id},
+            {"id": approval_request.user_id, "status": {"$ne": "deleting"}},
             {"$set": update_data}
         )
+        await cache.invalidate(f"user:{approval_request.user_id}")
         
         if result.modified_count == 0:
             raise HTTPException(status_code=404, detail="User not found or already processed")
@@ -2458,10 +3572,7 @@ async def approve_user_registration(
         )
         
         # Mark notification as resolved
-        await db.admin_notifications.update_one(
-            {"data.user_id": approval_request.user_id, "type": "user_registration"},
-            {"$set": {"resolved": True, "resolved_at": datetime.utcnow(), "resolved_by": admin_user.id}}
-        )
+        await resolve_registration_notifications([approval_request.user_id], admin_user.id)
         
         return {
             "message": f"User {approval_request.action}d successfully",
@@ -2471,87 +3582,295 @@ async def approve_user_registration(
             "processed_at": datetime.utcnow()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"User Approval Error: {str(e)}")
+        logger.exception("User Approval Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to process user approval: {str(e)}")
 
-@app.delete("/api/admin/users/{user_id}")
-async def delete_user(
-    user_id: str,
+BULK_APPROVAL_MAX_USERS = int(os.getenv("BULK_APPROVAL_MAX_USERS", "5000"))
+
+@app.post("/api/admin/users/bulk-approve")
+async def bulk_approve_user_registrations(
+    approval_request: BulkUserApprovalRequest,
     admin_user: User = Depends(get_admin_user)
 ):
-    """Delete a user account (admin only)"""
+    """Approve or reject many user registrations in one request"""
     try:
-        # Prevent admin from deleting themselves
-        if user_id == admin_user.id:
-            raise HTTPException(status_code=400, detail="Cannot delete your own admin account")
-        
-        # Get user details before deletion for logging
-        user_to_delete = await db.users.find_one({"id": user_id})
-        if not user_to_delete:
-            raise HTTPException(status_code=404, detail="User not found")
-        
-        # Check if this is the only admin (if user is admin)
-        if user_to_delete.get("is_admin", False):
-            admin_count = await db.users.count_documents({"is_admin": True})
-            if admin_count <= 1:
-                raise HTTPException(
-                    status_code=400, 
-                    detail="Cannot delete the only admin user. Promote another user to admin first."
-                )
-        
-        # Delete user's projects first (or you might want to reassign them)
-        user_projects = await db.projects.find({"user_id": user_id}).to_list(None)
-        project_count = len(user_projects)
-        
-        # Delete user's projects
-        await db.projects.delete_many({"user_id": user_id})
-        
-        # Delete user's assessments
-        user_assessments = await db.assessments.find({"user_id": user_id}).to_list(None)
-        assessment_count = len(user_assessments)
-        await db.assessments.delete_many({"user_id": user_id})
-        
-        # Remove user from project assignments
-        await db.project_assignments.delete_many({"user_id": user_id})
-        
-        # Delete user activity logs
-        await db.user_activities.delete_many({"user_id": user_id})
-        
-        # Delete admin notifications related to this user
-        await db.admin_notifications.delete_many({"data.user_id": user_id})
-        
-        # Finally, delete the user account
-        delete_result = await db.users.delete_one({"id": user_id})
+        if approval_request.action not in ("approve", "reject"):
+            raise HTTPException(status_code=400, detail="Action must be 'approve' or 'reject'")
+        
+        user_ids = list(dict.fromkeys(approval_request.user_ids))
+        if len(user_ids) > BULK_APPROVAL_MAX_USERS:
+            raise HTTPException(status_code=400, detail=f"At most {BULK_APPROVAL_MAX_USERS} users per request")
+        
+        target_status = "approved" if approval_request.action == "approve" else "rejected"
+        users = {
+            user["id"]: user
+            async for user in db.users.find(
+                {"id": {"$in": user_ids}},
+                {"_id": 0, "id": 1, "full_name": 1, "email": 1, "status": 1}
+            )
+        }
         
-        if delete_result.deleted_count == 0:
-            raise HTTPException(status_code=500, detail="Failed to delete user")
+        outcomes = []
+        to_process = []
+        for user_id in user_ids:
+            user = users.get(user_id)
+            if not user or user.get("status") == "deleting":
+                outcomes.append({"user_id": user_id, "status": "not_found"})
+            elif user.get("status") == target_status:
+                outcomes.append({"user_id": user_id, "status": "already_processed"})
+            else:
+                to_process.append(user_id)
+                outcomes.append({"user_id": user_id, "status": approval_request.action + "d"})
         
-        # Log admin activity
-        await log_user_activity(
-            admin_user.id,
-            "user_deleted",
-            f"Admin {admin_user.full_name} deleted user {user_to_delete['full_name']} ({user_to_delete['email']}) along with {project_count} projects and {assessment_count} assessments"
-        )
+        now = datetime.utcnow()
+        if to_process:
+            update_data = {
+                "status": target_status,
+                "approved_at": now,
+                "approved_by": admin_user.id,
+                "is_active": approval_request.action == "approve"
+            }
+            if approval_request.action == "reject" and approval_request.rejection_reason:
+                update_data["rejection_reason"] = approval_request.rejection_reason
+            
+            await db.users.update_many({"id": {"$in": to_process}, "status": {"$ne": "deleting"}}, {"$set": update_data})
+            await cache.invalidate(*(f"user:{user_id}" for user_id in to_process))
+            await resolve_registration_notifications(to_process, admin_user.id)
+            await log_user_activity(
+                admin_user.id,
+                f"user_bulk_{approval_request.action}",
+                f"Admin {admin_user.full_name} {approval_request.action}d {len(to_process)} users",
+                affected_users=to_process
+            )
         
         return {
-            "message": "User deleted successfully",
-            "deleted_user": {
-                "id": user_id,
-                "email": user_to_delete['email'],
-                "full_name": user_to_delete['full_name']
-            },
-            "cleanup_stats": {
-                "projects_deleted": project_count,
-                "assessments_deleted": assessment_count
-            },
-            "deleted_by": admin_user.full_name,
-            "deleted_at": datetime.utcnow()
+            "message": f"{len(to_process)} users {approval_request.action}d",
+            "action": approval_request.action,
+            "processed_count": len(to_process),
+            "outcomes": outcomes,
+            "processed_by": admin_user.full_name,
+            "processed_at": now
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"User Deletion Error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to delete user: {str(e)}")
+        logger.exception("Bulk User Approval Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to process bulk approval: {str(e)}")
+
+BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "500"))
+BULK_IMPORT_MAX_ROWS = int(os.getenv("BULK_IMPORT_MAX_ROWS", "20000"))
+
+def detect_import_format(file: UploadFile, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    filename = (file.filename or "").lower()
+    if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in (file.content_type or ""):
+        return "ndjson"
+    return "csv"
+
+def open_import_rows(file: UploadFile, import_format: str):
+    """Row iterator over the spooled upload; pulled in chunks from a worker thread"""
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    if import_format == "csv":
+        return csv.DictReader(text)
+    return (parse_import_line(line) for line in text if line.strip())
+
+class InvalidImportLine:
+    """An NDJSON line that is not valid JSON; reported per row instead of failing the upload"""
+    def __init__(self, error: str):
+        self.error = error
+
+def parse_import_line(line: str):
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        return InvalidImportLine(f"Invalid JSON: {e.msg} at column {e.colno}")
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return [get_password_hash(password) for password in passwords]
+
+async def import_user_chunk(rows: List[tuple], seen_emails: set, admin_user: User, auto_approve: bool) -> List[dict]:
+    """Validate, de-duplicate and insert one chunk of (row_number, raw_row) pairs"""
+    results = []
+    candidates = []
+    for row_number, raw_row in rows:
+        if isinstance(raw_row, InvalidImportLine):
+            results.append({"row": row_number, "email": None, "status": "invalid", "errors": [raw_row.error]})
+            continue
+        if not isinstance(raw_row, dict):
+            results.append({"row": row_number, "email": None, "status": "invalid", "errors": ["Row must be an object"]})
+            continue
+        try:
+            registration = UserRegistration(**{key: value for key, value in raw_row.items() if key})
+        except ValidationError as e:
+            results.append({
+                "row": row_number,
+                "email": raw_row.get("email"),
+                "status": "invalid",
+                "errors": [f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()],
+            })
+            continue
+        email_key = registration.email.lower()
+        if email_key in seen_emails:
+            results.append({"row": row_number, "email": registration.email, "status": "duplicate", "errors": ["Email repeated in upload"]})
+            continue
+        seen_emails.add(email_key)
+        candidates.append((row_number, registration))
+
+    if not candidates:
+        return results
+
+    existing = {
+        doc["email"]
+        async for doc in db.users.find({"email": {"$in": [r.email for _, r in candidates]}}, {"_id": 0, "email": 1})
+    }
+    new_rows = []
+    for row_number, registration in candidates:
+        if registration.email in existing:
+            results.append({"row": row_number, "email": registration.email, "status": "duplicate", "errors": ["Email already registered"]})
+        else:
+            new_rows.append((row_number, registration))
+    if not new_rows:
+        return results
+
+    # One counter round trip per distinct email prefix in the chunk
+    rows_by_prefix: Dict[str, List[int]] = {}
+    for index, (_, registration) in enumerate(new_rows):
+        rows_by_prefix.setdefault(registration.email.split('@')[0], []).append(index)
+    usernames: List[Optional[str]] = [None] * len(new_rows)
+    for prefix, indexes in rows_by_prefix.items():
+        for index, username in zip(indexes, await allocate_usernames(prefix, len(indexes))):
+            usernames[index] = username
+
+    hashed_passwords = await run_in_threadpool(hash_passwords, [r.password for _, r in new_rows])
+
+    now = datetime.utcnow()
+    documents = []
+    for (row_number, registration), username, hashed_password in zip(new_rows, usernames, hashed_passwords):
+        documents.append({
+            "id": str(uuid.uuid4()),
+            "email": registration.email,
+            "hashed_password": hashed_password,
+            "full_name": registration.full_name,
+            "organization": registration.organization,
+            "role": registration.role,
+            "status": "approved" if auto_approve else "pending_approval",
+            "created_at": now,
+            "approved_at": now if auto_approve else None,
+            "approved_by": admin_user.id if auto_approve else None,
+            "rejection_reason": None,
+            "is_admin": False,
+            "is_active": auto_approve,
+            "username": username,
+            "imported_by": admin_user.id,
+        })
+
+    failed: Dict[int, str] = {}
+    try:
+        await db.users.insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        for write_error in e.details.get("writeErrors", []):
+            failed[write_error["index"]] = write_error.get("errmsg", "Insert failed")
+
+    for index, document in enumerate(documents):
+        row_number = new_rows[index][0]
+        if index in failed:
+            document.pop("_id", None)
+            if "username" in failed[index]:
+                # Username taken outside the counter (e.g. legacy data); fall back to the retrying insert
+                try:
+                    await insert_user_with_username(document, document["email"].split('@')[0])
+                except (HTTPException, DuplicateKeyError) as e:
+                    results.append({"row": row_number, "email": document["email"], "status": "failed", "errors": [str(getattr(e, "detail", e))]})
+                    continue
+            else:
+                results.append({"row": row_number, "email": document["email"], "status": "failed", "errors": [failed[index]]})
+                continue
+        results.append({
+            "row": row_number,
+            "email": document["email"],
+            "status": "created",
+            "user_id": document["id"],
+            "username": document["username"],
+        })
+    return results
+
+@app.post("/api/admin/users/bulk-import")
+async def bulk_import_users(
+    file: UploadFile = File(...),
+    auto_approve: bool = Query(False),
+    import_format: Optional[str] = Query(None, alias="format", pattern="^(csv|ndjson)$"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """Create users from a CSV or NDJSON upload (columns match UserRegistration)"""
+    try:
+        rows = open_import_rows(file, detect_import_format(file, import_format))
+        numbered_rows = enumerate(rows, start=1)
+        seen_emails: set = set()
+        results: List[dict] = []
+        rows_read = 0
+        truncated = False
+        parse_error = None
+
+        while rows_read < BULK_IMPORT_MAX_ROWS:
+            chunk_size = min(BULK_IMPORT_CHUNK_SIZE, BULK_IMPORT_MAX_ROWS - rows_read)
+            try:
+                chunk = await run_in_threadpool(lambda: list(itertools.islice(numbered_rows, chunk_size)))
+            except (UnicodeDecodeError, csv.Error) as e:
+                if not rows_read:
+                    raise HTTPException(status_code=400, detail=f"Could not parse upload: {str(e)}")
+                # Earlier chunks are already inserted; stop here and still report them
+                parse_error = f"Could not parse upload after row {rows_read}: {str(e)}"
+                break
+            if not chunk:
+                break
+            rows_read += len(chunk)
+            results.extend(await import_user_chunk(chunk, seen_emails, admin_user, auto_approve))
+        else:
+            # Rows past the limit are left unread and reported, not rejected wholesale
+            truncated = await run_in_threadpool(lambda: next(numbered_rows, None) is not None)
+
+        results.sort(key=lambda result: result["row"])
+        created = [result for result in results if result["status"] == "created"]
+
+        if created:
+            await log_user_activity(
+                admin_user.id,
+                "users_bulk_imported",
+                f"Admin {admin_user.full_name} imported {len(created)} users from {file.filename}",
+                affected_users=[result["user_id"] for result in created]
+            )
+            if not auto_approve:
+                await create_admin_notification(
+                    "bulk_user_registration",
+                    f"{len(created)} imported users are pending approval",
+                    {"user_ids": [result["user_id"] for result in created], "imported_by": admin_user.id}
+                )
+
+        return {
+            "total_rows": len(results),
+            "created": len(created),
+            "duplicates": sum(1 for result in results if result["status"] == "duplicate"),
+            "invalid": sum(1 for result in results if result["status"] == "invalid"),
+            "failed": sum(1 for result in results if result["status"] == "failed"),
+            "auto_approved": auto_approve,
+            "truncated": truncated,
+            "max_rows": BULK_IMPORT_MAX_ROWS,
+            "parse_error": parse_error,
+            "results": results
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Bulk User Import Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to import users: {str(e)}")
+    finally:
+        await file.close()
 
 @app.post("/api/admin/projects/{project_id}/assign")
 async def assign_user_to_project(
@@ -2632,7 +3951,7 @@ async def assign_user_to_project(
         }
         
     except Exception as e:
-        print(f"Project Assignment Error: {str(e)}")
+        logger.exception("Project Assignment Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to assign user to project: {str(e)}")
 
 @app.get("/api/admin/projects/{project_id}/assignments")
@@ -2669,42 +3988,43 @@ async def get_project_assignments(
         }
         
     except Exception as e:
-        print(f"Get Project Assignments Error: {str(e)}")
+        logger.exception("Get Project Assignments Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get project assignments: {str(e)}")
 
 @app.get("/api/projects/assigned")
-async def get_assigned_projects(current_user: User = Depends(get_current_user)):
-    """Get projects assigned to current user"""
+async def get_assigned_projects(
+    limit: int = Query(PROJECT_PAGE_DEFAULT_LIMIT, ge=1, le=PROJECT_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """Get summaries of projects assigned to current user"""
     try:
-        # Find projects where user is assigned
-        projects_cursor = db.projects.find({
-            "assigned_users.user_id": current_user.id
-        }).sort("created_at", -1)
-        
-        assigned_projects = []
-        async for project in projects_cursor:
-            project["_id"] = str(project["_id"])
-            
-            # Get user's role in this project
-            user_assignment = next(
-                (a for a in project.get("assigned_users", []) if a["user_id"] == current_user.id),
-                None
-            )
-            
-            if user_assignment:
-                project["user_role"] = user_assignment["role"]
-                project["user_permissions"] = user_assignment.get("permissions", [])
-                project["assigned_at"] = user_assignment.get("assigned_at")
-                
-                assigned_projects.append(project)
+        # Find projects where user is assigned, projecting only this user's assignment
+        query = {"assigned_users.user_id": current_user.id}
+        page = await list_project_summaries(query, limit, cursor, {
+            "user_assignment": {"$arrayElemAt": [
+                {"$filter": {"input": "$assigned_users", "cond": {"$eq": ["$$this.user_id", current_user.id]}}}, 0
+            ]}
+        })
+        
+        for project in page["projects"]:
+            user_assignment = project.pop("user_assignment", None) or {}
+            project["user_role"] = user_assignment.get("role")
+            project["user_permissions"] = user_assignment.get("permissions", [])
+            project["assigned_at"] = user_assignment.get("assigned_at")
         
         return {
-            "assigned_projects": assigned_projects,
-            "total_count": len(assigned_projects)
+            "user_id": current_user.id,
+            "assigned_projects": page["projects"],
+            "total_count": await db.projects.count_documents(query),
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Get Assigned Projects Error: {str(e)}")
+        logger.exception("Get Assigned Projects Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get assigned projects: {str(e)}")
 
 @app.get("/api/projects/{project_id}/activities")
@@ -2729,14 +4049,8 @@ async def get_project_activities(
             raise HTTPException(status_code=403, detail="Access denied")
         
         # Get activities for this project
-        activities_cursor = db.user_activities.find({
-            "project_id": project_id
-        }).sort("timestamp", -1).skip(offset).limit(limit)
-        
         activities = []
-        async for activity in activities_cursor:
-            activity["_id"] = str(activity["_id"])
-            
+        for activity in await find_activities({"project_id": project_id}, limit, offset):
             # Get user info for activity
             user = await db.users.find_one({"id": activity["user_id"]})
             if user:
@@ -2746,7 +4060,7 @@ async def get_project_activities(
             activities.append(activity)
         
         # Get total count
-        total_count = await db.user_activities.count_documents({"project_id": project_id})
+        total_count = await count_activities({"project_id": project_id})
         
         return {
             "project_id": project_id,
@@ -2758,7 +4072,7 @@ async def get_project_activities(
         }
         
     except Exception as e:
-        print(f"Get Project Activities Error: {str(e)}")
+        logger.exception("Get Project Activities Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get project activities: {str(e)}")
 
 async def create_user_notification(user_id: str, notification_type: str, message: str, data: dict):
@@ -2778,13 +4092,13 @@ async def create_user_notification(user_id: str, notification_type: str, message
         await db.user_notifications.insert_one(notification_data)
         
     except Exception as e:
-        print(f"User notification error: {str(e)}")
+        logger.exception("User notification error: %s", e)
 
 async def calculate_daily_active_users() -> int:
     """Calculate daily active users"""
     try:
         today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        count = await db.user_activities.count_documents({
+        count = await count_activities({
             "timestamp": {"$gte": today},
             "action": "login"
         })
@@ -2796,7 +4110,7 @@ async def calculate_weekly_active_users() -> int:
     """Calculate weekly active users"""
     try:
         week_ago = datetime.utcnow() - timedelta(days=7)
-        count = await db.user_activities.count_documents({
+        count = await count_activities({
             "timestamp": {"$gte": week_ago},
             "action": "login"
         })
@@ -2808,7 +4122,7 @@ async def calculate_monthly_active_users() -> int:
     """Calculate monthly active users"""
     try:
         month_ago = datetime.utcnow() - timedelta(days=30)
-        count = await db.user_activities.count_documents({
+        count = await count_activities({
             "timestamp": {"$gte": month_ago},
             "action": "login"
         })
@@ -3410,27 +4724,19 @@ def generate_next_phase_recommendations(phase_data: dict, assessment_data: dict,
     
     return recommendations[:5]
 
+# Dimensions that each add 5 points of success probability when scored 4 or higher
+TYPE_BONUS_DIMENSIONS = {
+    "software_implementation": ("technical_infrastructure", "user_adoption_readiness"),
+    "business_process": ("process_maturity", "cross_functional_collaboration"),
+    "manufacturing_operations": ("maintenance_operations_alignment", "safety_compliance"),
+}
+
 def get_type_specific_bonus(assessment_type: str, dimension_scores: dict) -> float:
     """Calculate type-specific success probability bonus"""
-    
     bonus = 0.0
-    
-    if assessment_type == "software_implementation":
-        if dimension_scores.get("technical_infrastructure", 3) >= 4:
-            bonus += 5
-        if dimension_scores.get("user_adoption_readiness", 3) >= 4:
-            bonus += 5
-    elif assessment_type == "business_process":
-        if dimension_scores.get("process_maturity", 3) >= 4:
+    for dimension in TYPE_BONUS_DIMENSIONS.get(assessment_type, ()):
+        if dimension_scores.get(dimension, 3) >= 4:
             bonus += 5
-        if dimension_scores.get("cross_functional_collaboration", 3) >= 4:
-            bonus += 5
-    elif assessment_type == "manufacturing_operations":
-        if dimension_scores.get("maintenance_operations_alignment", 3) >= 4:
-            bonus += 5
-        if dimension_scores.get("safety_compliance", 3) >= 4:
-            bonus += 5
-    
     return bonus
 
 def get_type_specific_risks(assessment_type: str, dimension_scores: dict) -> List[str]:
@@ -3551,31 +4857,8 @@ def generate_implementation_plan(assessment_type: str, overall_score: float) ->
 
 def calculate_manufacturing_readiness_analysis(assessment_data: dict) -> Dict[str, Any]:
     """Calculate manufacturing-specific readiness analysis using Newton's laws"""
-    # Extract scores from assessment data
-    scores = []
-    dimension_scores = {}
-    
-    # Core dimensions
-    core_dimensions = [
-        'leadership_commitment', 'organizational_culture', 'resource_availability',
-        'stakeholder_engagement', 'training_capability'
-    ]
-    
-    # Manufacturing-specific dimensions
-    manufacturing_dimensions = [
-        'manufacturing_constraints', 'maintenance_operations_alignment',
-        'shift_work_considerations', 'technical_readiness', 'safety_compliance'
-    ]
-    
-    all_dimensions = core_dimensions + manufacturing_dimensions
-    
-    for dim in all_dimensions:
-        if dim in assessment_data and 'score' in assessment_data[dim]:
-            score = assessment_data[dim]['score']
-            scores.append(score)
-            dimension_scores[dim] = score
-    
-    avg_score = sum(scores) / len(scores) if scores else 0
+    dimension_scores = ScoreVector.from_assessment(assessment_data, MANUFACTURING_EAM_DIMENSIONS)
+    avg_score = dimension_scores.mean()
     
     # Calculate manufacturing-specific inertia
     manufacturing_weight = 1.2  # Higher weight for manufacturing environment
@@ -3608,16 +4891,22 @@ def calculate_manufacturing_readiness_analysis(assessment_data: dict) -> Dict[st
         }
     }
 
+# The five scored dimensions of a ChangeReadinessAssessment
+NEWTON_LAWS_DIMENSIONS = (
+    "change_management_maturity", "communication_effectiveness", "leadership_support",
+    "workforce_adaptability", "resource_adequacy",
+)
+
 def calculate_newton_laws_analysis(assessment: ChangeReadinessAssessment) -> Dict[str, Any]:
     """Calculate Newton's laws analysis for organizational change"""
-    scores = [
-        assessment.change_management_maturity.score,
-        assessment.communication_effectiveness.score,
-        assessment.leadership_support.score,
-        assessment.workforce_adaptability.score,
-        assessment.resource_adequacy.score
-    ]
-    avg_score = sum(scores) / len(scores)
+    scores = ScoreVector.from_scores({
+        dimension: getattr(assessment, dimension).score for dimension in NEWTON_LAWS_DIMENSIONS
+    })
+    return newton_laws_table.lookup(scores)
+
+def newton_laws_analysis(scores: ScoreVector) -> Dict[str, Any]:
+    """Newton's laws analysis from the change readiness dimension scores"""
+    avg_score = scores.mean(NEWTON_LAWS_DIMENSIONS)
     
     # First Law (Inertia) - resistance to change
     organizational_inertia = (5 - avg_score) * 20  # Higher score = lower inertia
@@ -3646,6 +4935,116 @@ def calculate_newton_laws_analysis(assessment: ChangeReadinessAssessment) -> Dic
         }
     }
 
+# ====================================================================================
+# READINESS LOOKUP TABLES - ANALYSES OVER THE 1-5 SCORE LATTICE
+# ====================================================================================
+
+# Largest table built; bigger lattices compute on every call instead
+READINESS_TABLE_MAX_ENTRIES = int(os.getenv("READINESS_TABLE_MAX_ENTRIES", "50000"))
+# Fill every table at startup rather than one entry per first hit
+READINESS_TABLES_PRECOMPUTE = os.getenv("READINESS_TABLES_PRECOMPUTE", "false").lower() in ("1", "true", "yes")
+SCORE_LEVELS = 5
+
+class ScoreLatticeTable:
+    """Results of a pure function of whole 1-5 scores on fixed dimensions, memoized by key.
+
+    A key packs each dimension's score in base 6 (0 when unscored). Functions of
+    the mean score alone set ``by_mean`` and are keyed by scored count and score
+    sum instead, which keeps even nine-dimension types to a few hundred entries.
+    Fractional or out-of-range scores, and tables over READINESS_TABLE_MAX_ENTRIES,
+    fall back to calling the function. Results are shared, so treat them as read-only.
+    """
+    __slots__ = ("dimensions", "compute", "by_mean", "columns", "size", "entries")
+
+    def __init__(self, dimensions: tuple, compute, by_mean: bool = False):
+        self.dimensions = dimensions
+        self.compute = compute
+        self.by_mean = by_mean
+        self.columns = score_columns(dimensions)
+        count = len(dimensions)
+        self.size = (count + 1) * (SCORE_LEVELS * count + 1) if by_mean else (SCORE_LEVELS + 1) ** count
+        self.entries = [None] * self.size if self.size <= READINESS_TABLE_MAX_ENTRIES else None
+
+    def key(self, scores: ScoreVector) -> Optional[int]:
+        # Plain Python beats NumPy on a handful of values
+        count = total = packed = 0
+        place = 1
+        for value in scores.values[self.columns].tolist():
+            if value == value:
+                if not (1 <= value <= SCORE_LEVELS and value.is_integer()):
+                    return None
+                count += 1
+                total += int(value)
+                packed += int(value) * place
+            place *= SCORE_LEVELS + 1
+        return count * (SCORE_LEVELS * len(self.dimensions) + 1) + total if self.by_mean else packed
+
+    def scores_for(self, key: int) -> Optional[ScoreVector]:
+        """A score vector with this key, or None when no scores map to it"""
+        scores = ScoreVector.empty()
+        if self.by_mean:
+            count, total = divmod(key, SCORE_LEVELS * len(self.dimensions) + 1)
+            if not count <= total <= SCORE_LEVELS * count:
+                return None
+            # Any split of the total has the same mean; spread it as evenly as possible
+            base, extra = divmod(total, count) if count else (0, 0)
+            for position, column in enumerate(self.columns[:count]):
+                scores.values[column] = base + (position < extra)
+            return scores
+        for column in self.columns:
+            key, digit = divmod(key, SCORE_LEVELS + 1)
+            if digit:
+                scores.values[column] = digit
+        return scores
+
+    def lookup(self, scores: ScoreVector):
+        key = self.key(scores) if self.entries is not None else None
+        if key is None:
+            return self.compute(scores)
+        result = self.entries[key]
+        if result is None:
+            result = self.entries[key] = self.compute(scores)
+        return result
+
+    def materialize(self) -> int:
+        """Compute every reachable entry; returns how many were filled"""
+        if self.entries is None:
+            return 0
+        filled = 0
+        for key in range(self.size):
+            if self.entries[key] is None:
+                scores = self.scores_for(key)
+                if scores is None:
+                    continue
+                self.entries[key] = self.compute(scores)
+            filled += 1
+        return filled
+
+def type_readiness_tables(assessment_type: str) -> Dict[str, ScoreLatticeTable]:
+    dimensions = tuple(dimension["id"] for dimension in ASSESSMENT_TYPES[assessment_type]["dimensions"])
+    return {
+        "readiness": ScoreLatticeTable(
+            dimensions, functools.partial(calculate_universal_readiness_analysis, assessment_type=assessment_type), by_mean=True
+        ),
+        "bonus": ScoreLatticeTable(
+            TYPE_BONUS_DIMENSIONS.get(assessment_type, ()), functools.partial(get_type_specific_bonus, assessment_type)
+        ),
+        # Type-specific risks do not depend on the scores, so this is a single entry
+        "risks": ScoreLatticeTable((), functools.partial(get_type_specific_risks, assessment_type)),
+    }
+
+readiness_tables = {assessment_type: type_readiness_tables(assessment_type) for assessment_type in ASSESSMENT_TYPES}
+newton_laws_table = ScoreLatticeTable(NEWTON_LAWS_DIMENSIONS, newton_laws_analysis, by_mean=True)
+
+def precompute_readiness_tables() -> int:
+    tables = [newton_laws_table, *(table for tables in readiness_tables.values() for table in tables.values())]
+    return sum(table.materialize() for table in tables)
+
+@app.on_event("startup")
+async def warm_readiness_tables():
+    if READINESS_TABLES_PRECOMPUTE:
+        logger.info("Precomputed %d readiness table entries", precompute_readiness_tables())
+
 def generate_comprehensive_tasks_for_phase(phase: str, project_id: str) -> List[Dict]:
     """Generate comprehensive tasks, deliverables, and milestones for a phase"""
     phase_config = IMPACT_PHASES.get(phase, {})
@@ -3781,6 +5180,762 @@ def calculate_phase_progress(project_data: Dict, phase: str) -> float:
     
     return (completed_phase_items / phase_items) * 100
 
+# ====================================================================================
+# ACTIVITY STORAGE - REGULAR OR TIME-SERIES COLLECTION FOR USER ACTIVITY EVENTS
+# ====================================================================================
+
+# "collection" keeps activity in user_activities; "timeseries" writes it to a MongoDB
+# time-series collection (5.0+, 7.0+ for the deletes retention and user deletion make)
+# bucketed by {user_id, project_id}, which stores far smaller and range-scans faster.
+# Existing activity moves over with migrate_activity_events.py; until it has, reads
+# cover both collections.
+ACTIVITY_STORAGE = os.getenv("ACTIVITY_STORAGE", "collection")
+ACTIVITY_EVENTS_COLLECTION = "user_activity_events"
+ACTIVITY_EVENTS_GRANULARITY = os.getenv("ACTIVITY_EVENTS_GRANULARITY", "minutes")
+ACTIVITY_META_FIELDS = ("user_id", "project_id")
+
+def activity_timeseries() -> bool:
+    return ACTIVITY_STORAGE == "timeseries"
+
+def activity_collection_name() -> str:
+    return ACTIVITY_EVENTS_COLLECTION if activity_timeseries() else "user_activities"
+
+def activity_collection():
+    return db[activity_collection_name()]
+
+def activity_field(field: str, timeseries: Optional[bool] = None) -> str:
+    """Stored path of an activity field; user_id and project_id live under meta in time-series collections"""
+    if timeseries is None:
+        timeseries = activity_timeseries()
+    return f"meta.{field}" if timeseries and field in ACTIVITY_META_FIELDS else field
+
+def activity_query(query: dict, timeseries: Optional[bool] = None) -> dict:
+    return {activity_field(field, timeseries): value for field, value in query.items()}
+
+def activity_event(activity: dict) -> dict:
+    """Time-series form of an activity record: user_id and project_id as the meta field"""
+    event = {key: value for key, value in activity.items() if key not in ACTIVITY_META_FIELDS and key != "_id"}
+    event["meta"] = {field: activity.get(field) for field in ACTIVITY_META_FIELDS}
+    return event
+
+def activity_document(activity: dict) -> dict:
+    """Stored form of an activity record in the current storage mode"""
+    return activity_event(activity) if activity_timeseries() else activity
+
+def activity_record(document: dict) -> dict:
+    """Activity record as the API returns it, whichever way it was stored"""
+    meta = document.pop("meta", None)
+    if isinstance(meta, dict):
+        document.update(meta)
+    return document
+
+# Deletes by _id on time-series collections (user deletion, retention) need 7.0
+ACTIVITY_TIMESERIES_MIN_SERVER_VERSION = (7, 0)
+
+async def check_activity_storage_support():
+    """Refuse timeseries mode on servers that cannot delete arbitrary time-series documents"""
+    if not activity_timeseries():
+        return
+    build_info = await client.admin.command("buildInfo")
+    version = tuple(build_info.get("versionArray", [0, 0])[:2])
+    if version < ACTIVITY_TIMESERIES_MIN_SERVER_VERSION:
+        raise RuntimeError(
+            f"ACTIVITY_STORAGE=timeseries needs MongoDB "
+            f"{'.'.join(map(str, ACTIVITY_TIMESERIES_MIN_SERVER_VERSION))}+, server is {build_info.get('version')}; "
+            f"use ACTIVITY_STORAGE=collection"
+        )
+
+async def ensure_activity_events_collection():
+    if not activity_timeseries():
+        return
+    if await db.list_collection_names(filter={"name": ACTIVITY_EVENTS_COLLECTION}):
+        return
+    try:
+        await db.create_collection(
+            ACTIVITY_EVENTS_COLLECTION,
+            timeseries={"timeField": "timestamp", "metaField": "meta", "granularity": ACTIVITY_EVENTS_GRANULARITY},
+        )
+    except OperationFailure as e:
+        # Another worker created it first
+        if e.code != 48:
+            raise
+
+# The time field is required; records without a date timestamp stay in user_activities
+MIGRATABLE_ACTIVITIES = {"timestamp": {"$type": "date"}}
+# How often time-series mode re-checks whether user_activities still holds unmigrated records
+ACTIVITY_LEGACY_CHECK_SECONDS = 60
+# Monotonic time of the next check; None once user_activities is drained, for good
+activity_legacy_check_at: Optional[float] = 0.0
+
+async def activity_sources() -> List[tuple]:
+    """(collection, is_timeseries) pairs activity is read from.
+
+    In time-series mode that is the events collection plus user_activities until
+    migrate_activity_events.py has moved everything over, so feeds and counters
+    keep older activity while the backfill runs.
+    """
+    global activity_legacy_check_at
+    if not activity_timeseries():
+        return [(db.user_activities, False)]
+    sources = [(db[ACTIVITY_EVENTS_COLLECTION], True)]
+    if activity_legacy_check_at is not None:
+        if time.monotonic() >= activity_legacy_check_at:
+            if await db.user_activities.find_one(MIGRATABLE_ACTIVITIES, {"_id": 1}) is None:
+                activity_legacy_check_at = None
+                return sources
+            activity_legacy_check_at = time.monotonic() + ACTIVITY_LEGACY_CHECK_SECONDS
+        sources.append((db.user_activities, False))
+    return sources
+
+def activity_sort_key(document: dict) -> datetime:
+    timestamp = document.get("timestamp")
+    return timestamp if isinstance(timestamp, datetime) else datetime.min
+
+async def find_activities(query: dict, limit: int, offset: int = 0) -> List[dict]:
+    """Newest-first activity records matching query (flat field names) from every source"""
+    sources = await activity_sources()
+    documents = []
+    for collection, timeseries in sources:
+        cursor = collection.find(activity_query(query, timeseries)).sort("timestamp", -1)
+        if len(sources) == 1:
+            documents = await cursor.skip(offset).limit(limit).to_list(limit)
+        else:
+            # Each source can contribute any of the first offset + limit records
+            documents += await cursor.limit(offset + limit).to_list(offset + limit)
+    if len(sources) > 1:
+        documents = sorted(documents, key=activity_sort_key, reverse=True)[offset:offset + limit]
+    return [activity_record(document) for document in documents]
+
+async def count_activities(query: dict) -> int:
+    return sum([
+        await collection.count_documents(activity_query(query, timeseries))
+        for collection, timeseries in await activity_sources()
+    ])
+
+async def migrate_activity_batch(batch_size: int) -> int:
+    """Move the oldest batch of user_activities into the time-series collection.
+
+    Copied, then removed from the source; a batch interrupted between the two
+    steps is copied again, so at most one batch can be duplicated.
+    """
+    documents = await db.user_activities.find(MIGRATABLE_ACTIVITIES).sort("timestamp", 1).limit(batch_size).to_list(batch_size)
+    if not documents:
+        return 0
+    await db[ACTIVITY_EVENTS_COLLECTION].insert_many([activity_event(document) for document in documents], ordered=False)
+    await db.user_activities.delete_many({"_id": {"$in": [document["_id"] for document in documents]}})
+    return len(documents)
+
+# ====================================================================================
+# WORK ITEM STORAGE - EMBEDDED ARRAYS OR PER-TYPE COLLECTIONS
+# ====================================================================================
+
+# "embedded" keeps tasks/deliverables/milestones/gate_reviews inside the project
+# document; "collections" stores them in their own collections so project reads
+# and writes stay constant-size. Applies to newly created projects; existing
+# ones move over with migrate_work_items.py. Each project records its own mode.
+WORK_ITEM_STORAGE = os.getenv("WORK_ITEM_STORAGE", "embedded")
+WORK_ITEM_COLLECTIONS = {
+    "tasks": "project_tasks",
+    "deliverables": "project_deliverables",
+    "milestones": "project_milestones",
+    "gate_reviews": "project_gate_reviews",
+}
+PROGRESS_ITEM_FIELDS = ("tasks", "deliverables", "milestones")
+COMPLETED_STATUSES = {
+    "tasks": ("completed",),
+    "deliverables": ("completed", "approved"),
+    "milestones": ("completed",),
+}
+# Fields added for storage only; stripped again so responses keep their embedded shape
+WORK_ITEM_STORAGE_FIELDS = {
+    "tasks": ("project_id", "organization", "position"),
+    "deliverables": ("project_id", "organization", "position", "phase"),
+    "milestones": ("project_id", "organization", "position"),
+    "gate_reviews": ("organization", "position"),
+}
+# Deliverables have no phase field; calculate_phase_progress matches them by name
+DELIVERABLE_PHASES = {
+    deliverable["name"]: phase
+    for phase, phase_config in IMPACT_PHASES.items()
+    for deliverable in phase_config.get("deliverables", [])
+}
+
+# Only the fields progress depends on, so recalculation never drags the full project
+PROGRESS_PROJECTION = {
+    "_id": 0,
+    "work_item_storage": 1,
+    "tasks.id": 1, "tasks.status": 1, "tasks.phase": 1,
+    "deliverables.id": 1, "deliverables.status": 1, "deliverables.name": 1,
+    "milestones.status": 1, "milestones.phase": 1,
+}
+
+def uses_work_item_collections(project: dict) -> bool:
+    return project.get("work_item_storage") == "collections"
+
+def work_item_documents(field: str, items: List[dict], project_id: str, organization: Optional[str], start_position: int = 0) -> List[dict]:
+    documents = []
+    for position, item in enumerate(items, start=start_position):
+        document = dict(item)
+        document["id"] = document.get("id") or str(uuid.uuid4())
+        document.update(project_id=project_id, organization=organization, position=position)
+        if field == "deliverables":
+            document["phase"] = DELIVERABLE_PHASES.get(document.get("name"))
+        documents.append(document)
+    return documents
+
+async def insert_project_document(project_doc: dict):
+    """Insert a new project, splitting its work items out when WORK_ITEM_STORAGE=collections"""
+    if WORK_ITEM_STORAGE != "collections":
+        await db.projects.insert_one(project_doc)
+        return
+    
+    stored = {key: value for key, value in project_doc.items() if key not in WORK_ITEM_COLLECTIONS}
+    stored["work_item_storage"] = "collections"
+    await db.projects.insert_one(stored)
+    project_doc["_id"] = stored["_id"]
+    project_doc["work_item_storage"] = "collections"
+    
+    for field, collection in WORK_ITEM_COLLECTIONS.items():
+        items = project_doc.get(field) or []
+        if items:
+            await db[collection].insert_many(
+                work_item_documents(field, items, project_doc["id"], project_doc.get("organization"))
+            )
+
+async def append_work_items(project: dict, field: str, items: List[dict]):
+    """Add work items to a project in whichever storage mode it uses and bump its updated_at"""
+    if not items:
+        return
+    now = datetime.utcnow()
+    if uses_work_item_collections(project):
+        collection = db[WORK_ITEM_COLLECTIONS[field]]
+        start_position = await collection.count_documents({"project_id": project["id"]})
+        await collection.insert_many(
+            work_item_documents(field, items, project["id"], project.get("organization"), start_position)
+        )
+        await db.projects.update_one({"id": project["id"]}, {"$set": {"updated_at": now}})
+    else:
+        # One write, so a migration guarding on updated_at sees the new items or a changed project
+        await db.projects.update_one({"id": project["id"]}, {"$push": {field: {"$each": items}}, "$set": {"updated_at": now}})
+
+async def attach_work_items(projects: List[dict], fields=tuple(WORK_ITEM_COLLECTIONS)) -> List[dict]:
+    """Compatibility layer: fill the embedded arrays of split projects from their collections"""
+    split_projects = {project["id"]: project for project in projects if project and uses_work_item_collections(project)}
+    if not split_projects:
+        return projects
+    
+    for field in fields:
+        for project in split_projects.values():
+            project[field] = []
+        cursor = db[WORK_ITEM_COLLECTIONS[field]].find(
+            {"project_id": {"$in": list(split_projects)}}, {"_id": 0}
+        ).sort([("project_id", 1), ("position", 1)])
+        async for item in cursor:
+            project = split_projects[item["project_id"]]
+            for storage_field in WORK_ITEM_STORAGE_FIELDS[field]:
+                item.pop(storage_field, None)
+            project[field].append(item)
+    return projects
+
+async def get_project_storage(project_id: str, organization: str) -> Optional[str]:
+    """Storage mode of a project the caller's organization owns, or None if not found"""
+    project = await db.projects.find_one(
+        {"id": project_id, "organization": organization}, {"_id": 0, "work_item_storage": 1}
+    )
+    if project is None:
+        return None
+    return project.get("work_item_storage", "embedded")
+
+async def set_work_item_fields(project_id: str, organization: str, field: str, item_id: str, values: Dict[str, Any]):
+    """Update one task/deliverable in place; a positional update for embedded projects"""
+    now = datetime.utcnow()
+    storage = await get_project_storage(project_id, organization)
+    if storage == "collections":
+        await db[WORK_ITEM_COLLECTIONS[field]].update_one(
+            {"project_id": project_id, "id": item_id}, {"$set": values}
+        )
+        await db.projects.update_one({"id": project_id}, {"$set": {"updated_at": now}})
+    elif storage is not None:
+        update_data = {f"{field}.$.{key}": value for key, value in values.items()}
+        update_data["updated_at"] = now
+        await db.projects.update_one(
+            {"id": project_id, f"{field}.id": item_id, "organization": organization},
+            {"$set": update_data}
+        )
+
+async def count_work_item_statuses(project_id: str) -> Dict[str, List[dict]]:
+    """(phase, status) counts per work item type, aggregated server-side"""
+    counts = {}
+    for field in PROGRESS_ITEM_FIELDS:
+        counts[field] = await db[WORK_ITEM_COLLECTIONS[field]].aggregate([
+            {"$match": {"project_id": project_id}},
+            {"$group": {"_id": {"phase": "$phase", "status": "$status"}, "count": {"$sum": 1}}},
+        ]).to_list(None)
+    return counts
+
+def progress_from_status_counts(counts: Dict[str, List[dict]]) -> tuple:
+    """Same results as calculate_project_progress/calculate_phase_progress, from grouped counts"""
+    total_items = completed_items = 0
+    phase_items: Dict[str, int] = {}
+    phase_completed: Dict[str, int] = {}
+    for field, groups in counts.items():
+        for group in groups:
+            phase = group["_id"].get("phase")
+            count = group["count"]
+            completed = count if group["_id"].get("status") in COMPLETED_STATUSES[field] else 0
+            total_items += count
+            completed_items += completed
+            phase_items[phase] = phase_items.get(phase, 0) + count
+            phase_completed[phase] = phase_completed.get(phase, 0) + completed
+    
+    progress = (completed_items / total_items) * 100 if total_items else 0.0
+    phase_progress = {
+        phase: (phase_completed[phase] / phase_items[phase]) * 100 if phase_items.get(phase) else 0.0
+        for phase in IMPACT_PHASES.keys()
+    }
+    return progress, phase_progress
+
+async def compute_project_progress(project: dict) -> tuple:
+    """(progress_percentage, phase_progress) for a project in either storage mode"""
+    if uses_work_item_collections(project):
+        return progress_from_status_counts(await count_work_item_statuses(project["id"]))
+    phase_progress = {phase: calculate_phase_progress(project, phase) for phase in IMPACT_PHASES.keys()}
+    return calculate_project_progress(project), phase_progress
+
+async def recalculate_project_progress(project_id: str) -> Optional[dict]:
+    """Recompute and store progress_percentage and phase_progress from one projected read"""
+    project = await db.projects.find_one({"id": project_id}, PROGRESS_PROJECTION)
+    if not project:
+        return None
+    project["id"] = project_id
+    project["progress_percentage"], project["phase_progress"] = await compute_project_progress(project)
+    await db.projects.update_one(
+        {"id": project_id},
+        {"$set": {"progress_percentage": project["progress_percentage"], "phase_progress": project["phase_progress"]}}
+    )
+    return project
+
+async def delete_project_work_items(project_ids: List[str]):
+    if not project_ids:
+        return
+    for collection in WORK_ITEM_COLLECTIONS.values():
+        await db[collection].delete_many({"project_id": {"$in": project_ids}})
+
+async def migrate_project_work_items(project: dict) -> bool:
+    """Move one embedded project's work items into the collections.
+
+    Items are upserted by (project_id, id), so re-running after a partial failure
+    is safe. The project is only flipped if it has not changed since it was read;
+    otherwise it is left embedded and False is returned so the caller can retry.
+    """
+    if uses_work_item_collections(project):
+        return True
+    
+    for field, collection in WORK_ITEM_COLLECTIONS.items():
+        documents = work_item_documents(field, project.get(field) or [], project["id"], project.get("organization"))
+        if documents:
+            await db[collection].bulk_write(
+                [ReplaceOne({"project_id": project["id"], "id": document["id"]}, document, upsert=True) for document in documents],
+                ordered=False
+            )
+    
+    result = await db.projects.update_one(
+        {"id": project["id"], "updated_at": project.get("updated_at"), "work_item_storage": {"$ne": "collections"}},
+        {
+            "$set": {"work_item_storage": "collections"},
+            "$unset": {field: "" for field in WORK_ITEM_COLLECTIONS}
+        }
+    )
+    return result.modified_count == 1
+
+# ====================================================================================
+# USER DELETION JOBS - BATCHED CASCADE IN THE BACKGROUND
+# ====================================================================================
+
+USER_DELETION_BATCH_SIZE = int(os.getenv("USER_DELETION_BATCH_SIZE", "500"))
+# Each batch runs in its own transaction when the deployment supports them
+USER_DELETION_TRANSACTIONS = os.getenv("USER_DELETION_TRANSACTIONS", "true").lower() in ("1", "true", "yes")
+USER_DELETION_LEASE_SECONDS = int(os.getenv("USER_DELETION_LEASE_SECONDS", "300"))
+DELETION_PENDING = "pending"
+DELETION_RUNNING = "running"
+DELETION_COMPLETE = "completed"
+DELETION_FAILED = "failed"
+UNFINISHED_DELETIONS = {"status": {"$in": [DELETION_PENDING, DELETION_RUNNING]}}
+
+# Removed with each batch of the user's projects, before the projects themselves
+PROJECT_DEPENDENT_COLLECTIONS = tuple(WORK_ITEM_COLLECTIONS.values()) + (
+    "project_alert_states", "project_analytics", "project_phases", "project_activities",
+    "project_assignments", "phase_transitions",
+)
+# Removed by owner after the projects and assessments, in this order
+USER_OWNED_FILTERS = (
+    ("idempotency_keys", "user_id"),
+    ("project_assignments", "user_id"),
+    ("phase_transitions", "user_id"),
+    ("user_notifications", "user_id"),
+    ("user_activities", "user_id"),
+    ("admin_notifications", "data.user_id"),
+    ("user_activities_archive", "user_id"),
+    ("user_notifications_archive", "user_id"),
+    ("admin_notifications_archive", "data.user_id"),
+)
+if activity_timeseries():
+    # Activity not yet migrated stays in user_activities
+    USER_OWNED_FILTERS += ((ACTIVITY_EVENTS_COLLECTION, "meta.user_id"),)
+# Time-series collections reject writes inside a transaction; their batches run without one
+NON_TRANSACTIONAL_COLLECTIONS = {ACTIVITY_EVENTS_COLLECTION}
+
+transactions_supported: Optional[bool] = None
+
+async def deletion_transactions_enabled() -> bool:
+    """Multi-document transactions need a replica set or mongos; checked once per process"""
+    global transactions_supported
+    if not USER_DELETION_TRANSACTIONS:
+        return False
+    if transactions_supported is None:
+        try:
+            hello = await client.admin.command("hello")
+            transactions_supported = bool(hello.get("setName")) or hello.get("msg") == "isdbgrid"
+        except Exception as e:
+            logger.info("Could not detect replica set, deleting without transactions: %s", e)
+            transactions_supported = False
+    return transactions_supported
+
+async def run_deletion_batch(work, transactional: bool = True) -> dict:
+    """Run work(session) -> {collection: deleted} atomically when transactions are available"""
+    if not transactional or not await deletion_transactions_enabled():
+        return await work(None)
+    async with await client.start_session() as session:
+        return await session.with_transaction(work)
+
+async def next_batch_ids(collection: str, query: dict, field: str, batch_size: int) -> list:
+    return [document[field] async for document in db[collection].find(query, {field: 1}).limit(batch_size)]
+
+async def delete_user_projects_batch(user_id: str, batch_size: int) -> Optional[dict]:
+    """Delete one batch of the user's projects and everything hanging off them; None when done"""
+    project_ids = await next_batch_ids("projects", {"user_id": user_id}, "id", batch_size)
+    if not project_ids:
+        return None
+
+    async def work(session):
+        deleted = {}
+        for collection in PROJECT_DEPENDENT_COLLECTIONS:
+            result = await db[collection].delete_many({"project_id": {"$in": project_ids}}, session=session)
+            deleted[collection] = result.deleted_count
+        # Children first, so a batch interrupted part-way is found again by the next pass
+        result = await db.projects.delete_many({"id": {"$in": project_ids}, "user_id": user_id}, session=session)
+        deleted["projects"] = result.deleted_count
+        return deleted
+
+    return await run_deletion_batch(work)
+
+async def delete_owned_batch(collection: str, query: dict, batch_size: int) -> Optional[dict]:
+    object_ids = await next_batch_ids(collection, query, "_id", batch_size)
+    if not object_ids:
+        return None
+
+    async def work(session):
+        result = await db[collection].delete_many({"_id": {"$in": object_ids}}, session=session)
+        return {collection: result.deleted_count}
+
+    return await run_deletion_batch(work, transactional=collection not in NON_TRANSACTIONAL_COLLECTIONS)
+
+async def record_deletion_progress(job_id: str, deleted: dict):
+    update = {"$set": {"locked_until": datetime.utcnow() + timedelta(seconds=USER_DELETION_LEASE_SECONDS)}}
+    counts = {f"deleted.{collection}": count for collection, count in deleted.items() if count}
+    if counts:
+        update["$inc"] = counts
+    await db.deletion_jobs.update_one({"id": job_id}, update)
+
+async def cascade_user_deletion(job: dict, batch_size: int = USER_DELETION_BATCH_SIZE):
+    """Every step is a re-runnable delete, so a resumed job simply starts over"""
+    user_id = job["user_id"]
+    while (deleted := await delete_user_projects_batch(user_id, batch_size)) is not None:
+        await record_deletion_progress(job["id"], deleted)
+
+    organizations = await db.assessments.distinct("organization", {"user_id": user_id})
+    owned_steps = [("assessments", {"user_id": user_id})] + [
+        (collection, {field: user_id}) for collection, field in USER_OWNED_FILTERS
+    ]
+    for collection, query in owned_steps:
+        while (deleted := await delete_owned_batch(collection, query, batch_size)) is not None:
+            await record_deletion_progress(job["id"], deleted)
+
+    # Assignments to other users' projects, in one multi-document update
+    result = await db.projects.update_many(
+        {"assigned_users.user_id": user_id},
+        {"$pull": {"assigned_users": {"user_id": user_id}}, "$set": {"updated_at": datetime.utcnow()}}
+    )
+    await record_deletion_progress(job["id"], {"assigned_users": result.modified_count})
+    await resolve_registration_notifications([user_id], job["requested_by"])
+
+    result = await db.users.delete_one({"id": user_id})
+    await record_deletion_progress(job["id"], {"users": result.deleted_count})
+    await cache.invalidate(f"user:{user_id}", *(f"org:{organization}" for organization in organizations))
+
+async def run_user_deletion(job_id: str):
+    now = datetime.utcnow()
+    # The lease keeps a resumed copy on another worker from running alongside this one
+    job = await db.deletion_jobs.find_one_and_update(
+        {"id": job_id, **UNFINISHED_DELETIONS, "$or": [{"locked_until": None}, {"locked_until": {"$lte": now}}]},
+        {"$set": {
+            "status": DELETION_RUNNING,
+            "started_at": now,
+            "locked_until": now + timedelta(seconds=USER_DELETION_LEASE_SECONDS),
+        }},
+        return_document=ReturnDocument.AFTER
+    )
+    if job is None:
+        return
+    try:
+        await cascade_user_deletion(job)
+        await db.deletion_jobs.update_one(
+            {"id": job_id},
+            {"$set": {"status": DELETION_COMPLETE, "finished_at": datetime.utcnow(), "locked_until": None}}
+        )
+        await log_user_activity(
+            job["requested_by"],
+            "user_deleted",
+            f"Admin {job['requested_by_name']} deleted user {job['user_full_name']} ({job['user_email']}) along with {job['counts']['projects']} projects and {job['counts']['assessments']} assessments"
+        )
+    except asyncio.CancelledError:
+        # Shutdown: release the lease so the next startup resumes it immediately
+        await db.deletion_jobs.update_one({"id": job_id}, {"$set": {"locked_until": None}})
+        raise
+    except Exception as e:
+        logger.exception("User Deletion Job Error: %s", e)
+        await db.deletion_jobs.update_one(
+            {"id": job_id},
+            {"$set": {"status": DELETION_FAILED, "error": str(e), "finished_at": datetime.utcnow(), "locked_until": None}}
+        )
+
+@app.on_event("startup")
+async def resume_user_deletions():
+    try:
+        async for job in db.deletion_jobs.find(UNFINISHED_DELETIONS, {"_id": 0, "id": 1}):
+            start_background_job(run_user_deletion(job["id"]))
+    except PyMongoError as e:
+        logger.warning("Could not resume user deletion jobs: %s", e)
+
+def deletion_job_response(job: dict) -> dict:
+    job.pop("_id", None)
+    job.pop("locked_until", None)
+    return job
+
+def deletion_started_response(job: dict, message: str = "User deletion started") -> dict:
+    """What DELETE /api/admin/users/{id} returns, for a new job or one already under way"""
+    return {
+        "message": message,
+        "job_id": job["id"],
+        "status": job["status"],
+        "deleted_user": {
+            "id": job["user_id"],
+            "email": job["user_email"],
+            "full_name": job["user_full_name"]
+        },
+        "cleanup_stats": {
+            "projects_deleted": job["counts"]["projects"],
+            "assessments_deleted": job["counts"]["assessments"]
+        },
+        "deleted_by": job["requested_by_name"],
+        "deleted_at": job["created_at"]
+    }
+
+@app.delete("/api/admin/users/{user_id}", status_code=202)
+async def delete_user(
+    user_id: str,
+    admin_user: User = Depends(get_admin_user)
+):
+    """Delete a user account (admin only); projects, assessments and logs are removed in the background"""
+    try:
+        # Prevent admin from deleting themselves
+        if user_id == admin_user.id:
+            raise HTTPException(status_code=400, detail="Cannot delete your own admin account")
+        
+        # Get user details before deletion for logging
+        user_to_delete = await db.users.find_one({"id": user_id})
+        if not user_to_delete:
+            raise HTTPException(status_code=404, detail="User not found")
+        
+        # A repeated request reports the deletion already under way
+        existing_job = await db.deletion_jobs.find_one({"user_id": user_id, **UNFINISHED_DELETIONS})
+        if existing_job:
+            return deletion_started_response(existing_job, "User deletion already in progress")
+        
+        # Check if this is the only admin (if user is admin)
+        if user_to_delete.get("is_admin", False):
+            admin_count = await db.users.count_documents({"is_admin": True})
+            if admin_count <= 1:
+                raise HTTPException(
+                    status_code=400, 
+                    detail="Cannot delete the only admin user. Promote another user to admin first."
+                )
+        
+        project_count = await db.projects.count_documents({"user_id": user_id})
+        assessment_count = await db.assessments.count_documents({"user_id": user_id})
+        
+        # Lock the account out now; the cascade removes it last
+        await db.users.update_one({"id": user_id}, {"$set": {"status": "deleting", "is_active": False}})
+        await cache.invalidate(f"user:{user_id}")
+        
+        now = datetime.utcnow()
+        job = {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "user_email": user_to_delete["email"],
+            "user_full_name": user_to_delete["full_name"],
+            "requested_by": admin_user.id,
+            "requested_by_name": admin_user.full_name,
+            "status": DELETION_PENDING,
+            "counts": {"projects": project_count, "assessments": assessment_count},
+            "deleted": {},
+            "created_at": now,
+            "locked_until": None,
+        }
+        await db.deletion_jobs.insert_one(dict(job))
+        start_background_job(run_user_deletion(job["id"]))
+        
+        return deletion_started_response(job)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("User Deletion Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to delete user: {str(e)}")
+
+@app.get("/api/admin/deletion-jobs/{job_id}")
+async def get_deletion_job(job_id: str, admin_user: User = Depends(get_admin_user)):
+    """Progress of a user deletion: documents removed so far per collection"""
+    try:
+        job = await db.deletion_jobs.find_one({"id": job_id})
+        if not job:
+            raise HTTPException(status_code=404, detail="Deletion job not found")
+        return deletion_job_response(job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Get Deletion Job Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get deletion job: {str(e)}")
+
+# ====================================================================================
+# PROJECT SUMMARIES - LIST VIEWS WITH CURSOR PAGINATION
+# ====================================================================================
+
+# Everything the project list and edit form show; work items stay on the detail route
+PROJECT_SUMMARY_FIELDS = (
+    "id", "name", "project_name", "description", "status", "health_status", "current_phase",
+    "progress_percentage", "overall_progress", "phase_progress", "budget", "total_budget",
+    "spent_budget", "start_date", "target_completion_date", "estimated_end_date", "objectives",
+    "scope", "organization", "client_organization", "project_type", "assessment_id",
+    "owner_id", "user_id", "created_at", "updated_at", "work_item_storage",
+)
+def _embedded_item_count(field: str, phase: Optional[str], completed: bool) -> dict:
+    """$size of the embedded items in a phase (all phases when None), optionally completed only"""
+    conditions = []
+    if phase is not None:
+        if field == "deliverables":
+            names = [deliverable["name"] for deliverable in IMPACT_PHASES[phase].get("deliverables", [])]
+            conditions.append({"$in": ["$$item.name", names]})
+        else:
+            conditions.append({"$eq": ["$$item.phase", phase]})
+    if completed:
+        conditions.append({"$in": ["$$item.status", list(COMPLETED_STATUSES[field])]})
+    return {"$size": {"$filter": {
+        "input": {"$ifNull": [f"${field}", []]},
+        "as": "item",
+        "cond": {"$and": conditions} if conditions else True,
+    }}}
+
+# Built once: counts for embedded projects are computed inside the $project stage
+EMBEDDED_COUNT_PROJECTION = {
+    "item_counts": {
+        field: {
+            phase_key: {
+                "total": _embedded_item_count(field, phase, False),
+                "completed": _embedded_item_count(field, phase, True),
+            }
+            for phase_key, phase in [("all", None)] + [(phase, phase) for phase in IMPACT_PHASES.keys()]
+        }
+        for field in PROGRESS_ITEM_FIELDS
+    }
+}
+
+def encode_project_cursor(project: dict) -> str:
+    created_at = project.get("created_at")
+    payload = [created_at.isoformat() if isinstance(created_at, datetime) else None, project["id"]]
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode()
+
+def project_cursor_filter(cursor: str) -> dict:
+    """Filter for projects after the cursor in (created_at desc, id desc) order"""
+    try:
+        created_at, project_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = datetime.fromisoformat(created_at) if created_at else None
+    except (ValueError, TypeError, binascii.Error, orjson.JSONDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if created_at is None:
+        # Projects without created_at sort last; page through them by id
+        return {"created_at": None, "id": {"$lt": project_id}}
+    return {"$or": [
+        {"created_at": {"$lt": created_at}},
+        {"created_at": created_at, "id": {"$lt": project_id}},
+        {"created_at": None},
+    ]}
+
+async def add_split_item_counts(rows: List[dict]):
+    """Fill item_counts for collection-backed projects with one $group per item type"""
+    split_rows = {row["id"]: row for row in rows if uses_work_item_collections(row)}
+    if not split_rows:
+        return
+    for row in split_rows.values():
+        row["item_counts"] = {
+            field: {key: {"total": 0, "completed": 0} for key in ["all", *IMPACT_PHASES.keys()]}
+            for field in PROGRESS_ITEM_FIELDS
+        }
+    for field in PROGRESS_ITEM_FIELDS:
+        cursor = db[WORK_ITEM_COLLECTIONS[field]].aggregate([
+            {"$match": {"project_id": {"$in": list(split_rows)}}},
+            {"$group": {"_id": {"project_id": "$project_id", "phase": "$phase", "status": "$status"}, "count": {"$sum": 1}}},
+        ])
+        async for group in cursor:
+            counts = split_rows[group["_id"]["project_id"]]["item_counts"][field]
+            completed = group["_id"].get("status") in COMPLETED_STATUSES[field]
+            for key in ("all", group["_id"].get("phase")):
+                if key in counts:
+                    counts[key]["total"] += group["count"]
+                    counts[key]["completed"] += group["count"] if completed else 0
+
+def finalize_project_summary(row: dict) -> dict:
+    item_counts = row.pop("item_counts", {})
+    row.pop("work_item_storage", None)
+    row["work_item_counts"] = {field: counts["all"] for field, counts in item_counts.items()}
+    row["phase_counts"] = {
+        phase: {field: counts[phase] for field, counts in item_counts.items()}
+        for phase in IMPACT_PHASES.keys()
+    }
+    return row
+
+async def list_project_summaries(match: dict, limit: int, cursor: Optional[str], extra_projection: Optional[dict] = None) -> dict:
+    """One page of project summaries, newest first, with per-phase work item counts"""
+    query = {"$and": [match, project_cursor_filter(cursor)]} if cursor else match
+    projection = {"_id": 0, **{field: 1 for field in PROJECT_SUMMARY_FIELDS}, **EMBEDDED_COUNT_PROJECTION}
+    projection.update(extra_projection or {})
+    
+    rows = await db.projects.aggregate([
+        {"$match": query},
+        {"$sort": {"created_at": -1, "id": -1}},
+        {"$limit": limit + 1},
+        {"$project": projection},
+    ]).to_list(None)
+    
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    await add_split_item_counts(rows)
+    return {
+        "projects": [finalize_project_summary(row) for row in rows],
+        "next_cursor": encode_project_cursor(rows[-1]) if has_more else None,
+        "has_more": has_more,
+    }
+
 async def get_enhanced_ai_analysis(assessment: ChangeReadinessAssessment) -> dict:
     """Get enhanced AI analysis from Claude with structured insights"""
     try:
@@ -3855,7 +6010,7 @@ async def get_enhanced_ai_analysis(assessment: ChangeReadinessAssessment) -> dic
         try:
             response = await asyncio.wait_for(chat.send_message(user_message), timeout=15.0)
         except asyncio.TimeoutError:
-            print("AI analysis timed out, using fallback analysis")
+            logger.warning("AI analysis timed out, using fallback analysis")
             # Use fallback analysis if AI times out
             response = f"""
             EXECUTIVE SUMMARY:
@@ -4004,7 +6159,7 @@ async def get_enhanced_ai_analysis(assessment: ChangeReadinessAssessment) -> dic
         }
     
     except asyncio.TimeoutError:
-        print("AI analysis timed out, using fallback analysis")
+        logger.warning("AI analysis timed out, using fallback analysis")
         # Fallback analysis with Newton's laws calculation
         newton_data = calculate_newton_laws_analysis(assessment)
         scores = [
@@ -4073,7 +6228,7 @@ async def get_enhanced_ai_analysis(assessment: ChangeReadinessAssessment) -> dic
             }
         }
     except Exception as e:
-        print(f"Enhanced AI Analysis Error: {str(e)}")
+        logger.exception("Enhanced AI Analysis Error: %s", e)
         # Fallback analysis with Newton's laws calculation
         newton_data = calculate_newton_laws_analysis(assessment)
         scores = [
@@ -4125,6 +6280,154 @@ async def get_enhanced_ai_analysis(assessment: ChangeReadinessAssessment) -> dic
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.utcnow()}
 
+# Username allocation - per-prefix counters instead of probing username1, username2, ...
+USERNAME_ALLOCATION_RETRIES = 5
+
+def username_for_suffix(prefix: str, suffix: int) -> str:
+    """Suffix 0 is the bare prefix, matching the original john, john1, john2 scheme"""
+    return prefix if suffix == 0 else f"{prefix}{suffix}"
+
+async def seed_username_counter(prefix: str):
+    """Initialise a prefix counter from the highest suffix already taken (one query)"""
+    highest = -1
+    pattern = f"^{re.escape(prefix)}([0-9]*)$"
+    async for existing in db.users.find({"username": {"$regex": pattern}}, {"_id": 0, "username": 1}):
+        digits = existing["username"][len(prefix):]
+        highest = max(highest, int(digits) if digits else 0)
+    try:
+        await db.username_counters.update_one({"_id": prefix}, {"$max": {"seq": highest}}, upsert=True)
+    except DuplicateKeyError:
+        pass  # another request seeded it first
+
+async def allocate_usernames(prefix: str, count: int = 1) -> List[str]:
+    """Reserve `count` consecutive usernames for an email prefix with one atomic $inc"""
+    for _ in range(2):
+        counter = await db.username_counters.find_one_and_update(
+            {"_id": prefix},
+            {"$inc": {"seq": count}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if counter:
+            last = counter["seq"]
+            return [username_for_suffix(prefix, suffix) for suffix in range(last - count + 1, last + 1)]
+        await seed_username_counter(prefix)
+    raise RuntimeError(f"Could not allocate username for prefix {prefix}")
+
+def is_duplicate_username(error: DuplicateKeyError) -> bool:
+    key_pattern = (error.details or {}).get("keyPattern") or {}
+    return "username" in key_pattern or "username" in str(error)
+
+async def insert_user_with_username(user_data: dict, prefix: str):
+    """Insert a user, allocating a fresh username if the unique index rejects the current one"""
+    for _ in range(USERNAME_ALLOCATION_RETRIES):
+        user_data["username"] = (await allocate_usernames(prefix))[0]
+        try:
+            await db.users.insert_one(user_data)
+            return
+        except DuplicateKeyError as e:
+            if not is_duplicate_username(e):
+                raise
+            user_data.pop("_id", None)
+    raise HTTPException(status_code=409, detail="Could not allocate a unique username, please retry")
+
+@app.on_event("startup")
+async def ensure_indexes():
+    """Create the indexes the allocators and lookups rely on"""
+    # Fails startup: on older servers user deletion and retention would break part-way
+    await check_activity_storage_support()
+    
+    try:
+        # Before anything below implicitly creates it as a regular collection
+        await ensure_activity_events_collection()
+    except Exception as e:
+        logger.warning("Could not create %s time-series collection: %s", ACTIVITY_EVENTS_COLLECTION, e)
+    
+    try:
+        await db.users.create_index(
+            "username",
+            unique=True,
+            partialFilterExpression={"username": {"$type": "string"}},
+            name="username_unique",
+        )
+    except Exception as e:
+        logger.warning("Could not create unique username index: %s", e)
+    
+    for collection in WORK_ITEM_COLLECTIONS.values():
+        try:
+            await db[collection].create_index([("project_id", 1), ("id", 1)], unique=True)
+            await db[collection].create_index([("project_id", 1), ("phase", 1), ("status", 1)])
+        except Exception as e:
+            logger.warning("Could not create %s indexes: %s", collection, e)
+    
+    try:
+        await db.project_alert_states.create_index([("project_id", 1), ("rule_key", 1)], unique=True)
+        await db.project_alert_states.create_index([("active", 1), ("project_id", 1)])
+    except Exception as e:
+        logger.warning("Could not create project_alert_states indexes: %s", e)
+    
+    try:
+        await db.project_analytics.create_index("project_id", unique=True)
+    except Exception as e:
+        logger.warning("Could not create project_analytics index: %s", e)
+
+    try:
+        await db.assessments.create_index(
+            "analysis_status",
+            partialFilterExpression={"analysis_status": ANALYSIS_PENDING},
+            name="analysis_pending",
+        )
+    except Exception as e:
+        logger.warning("Could not create assessment analysis index: %s", e)
+
+    try:
+        await db.idempotency_keys.create_index("created_at", expireAfterSeconds=IDEMPOTENCY_KEY_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("Could not create idempotency key TTL index: %s", e)
+
+    for collection in EXPORT_CSV_DEFAULT_FIELDS:
+        try:
+            await db[collection].create_index("organization")
+            await db[collection].create_index("user_id")
+        except Exception as e:
+            logger.warning("Could not create %s export indexes: %s", collection, e)
+
+    for table in SNAPSHOT_TABLES:
+        try:
+            await db[table].create_index("updated_at")
+        except Exception as e:
+            logger.warning("Could not create %s snapshot index: %s", table, e)
+
+    try:
+        await db.deletion_jobs.create_index("id", unique=True)
+        await db.deletion_jobs.create_index([("user_id", 1), ("status", 1)])
+    except Exception as e:
+        logger.warning("Could not create deletion_jobs indexes: %s", e)
+
+    # The deletion cascade pages through these by owner or project
+    for collection, field in USER_OWNED_FILTERS + tuple(
+        (collection, "project_id") for collection in ("project_phases", "project_activities", "project_assignments", "phase_transitions")
+    ):
+        try:
+            await db[collection].create_index(field)
+        except Exception as e:
+            logger.warning("Could not create %s.%s index: %s", collection, field, e)
+
+    try:
+        await activity_collection().create_index([("timestamp", -1)])
+        await activity_collection().create_index([("action", 1), ("timestamp", -1)])
+        await activity_collection().create_index([(activity_field("project_id"), 1), ("timestamp", -1)])
+        await db.user_notifications.create_index("created_at")
+        await db.admin_notifications.create_index([("resolved", 1), ("created_at", -1)])
+        await db.usage_daily_rollups.create_index("day")
+    except Exception as e:
+        logger.warning("Could not create activity retention indexes: %s", e)
+
+    for collection in RETENTION_POLICIES if ARCHIVE_TTL_DAYS > 0 else ():
+        try:
+            await db[archive_collection(collection)].create_index("archived_at", expireAfterSeconds=ARCHIVE_TTL_DAYS * 86400)
+        except Exception as e:
+            logger.warning("Could not create %s archive TTL index: %s", collection, e)
+
 # Authentication routes
 @app.post("/api/auth/register")
 async def register_user(user: UserRegistration):
@@ -4135,18 +6438,8 @@ async def register_user(user: UserRegistration):
         if existing_user:
             raise HTTPException(status_code=400, detail="Email already registered")
         
-        # Auto-generate username from email (before @ symbol)
-        username = user.email.split('@')[0]
-        
-        # If username already exists, append a number
-        existing_username = await db.users.find_one({"username": username})
-        if existing_username:
-            counter = 1
-            while existing_username:
-                new_username = f"{username}{counter}"
-                existing_username = await db.users.find_one({"username": new_username})
-                counter += 1
-            username = new_username
+        # Auto-generate username from email (before @ symbol), numbered on collision
+        username_prefix = user.email.split('@')[0]
         
         # Hash password
         hashed_password = get_password_hash(user.password)
@@ -4155,7 +6448,6 @@ async def register_user(user: UserRegistration):
         user_id = str(uuid.uuid4())
         user_data = {
             "id": user_id,
-            "username": username,  # Auto-generated from email
             "email": user.email,
             "hashed_password": hashed_password,
             "full_name": user.full_name,
@@ -4170,7 +6462,8 @@ async def register_user(user: UserRegistration):
             "is_active": False  # User cannot login until approved
         }
         
-        await db.users.insert_one(user_data)
+        # Username is auto-generated from the email prefix
+        await insert_user_with_username(user_data, username_prefix)
         
         # Create admin notification for approval
         await create_admin_notification(
@@ -4184,8 +6477,10 @@ async def register_user(user: UserRegistration):
             "user_id": user_id,
             "status": "pending_approval"
         }
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Registration error: {str(e)}")
+        logger.exception("Registration error: %s", e)
         raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
 
 @app.post("/api/auth/login")
@@ -4194,7 +6489,7 @@ async def login_user(user: UserLogin):
     try:
         # Find user by email
         user_data = await db.users.find_one({"email": user.email})
-        if not user_data:
+        if not user_data or user_data.get("status") == "deleting":
             raise HTTPException(status_code=401, detail="Invalid credentials")
         
         # Authentication check - allow login for all users with valid passwords
@@ -4270,12 +6565,319 @@ async def get_assessment_type(assessment_type: str):
         raise HTTPException(status_code=404, detail="Assessment type not found")
     return ASSESSMENT_TYPES[assessment_type]
 
+# ====================================================================================
+# ASSESSMENT ANALYSIS PIPELINE - DERIVED FIELDS COMPUTED AFTER INSERT
+# ====================================================================================
+
+ANALYSIS_PENDING = "pending"
+ANALYSIS_COMPLETE = "complete"
+ANALYSIS_FAILED = "failed"
+# Analyses computed at once per process; the rest wait their turn
+ASSESSMENT_ANALYSIS_CONCURRENCY = int(os.getenv("ASSESSMENT_ANALYSIS_CONCURRENCY", "4"))
+# Pending analyses are picked back up at startup (e.g. after a restart cancelled them),
+# this many per page; every worker pages through and claims what it runs
+ASSESSMENT_ANALYSIS_RECOVERY_BATCH_SIZE = int(os.getenv("ASSESSMENT_ANALYSIS_RECOVERY_BATCH_SIZE", "100"))
+# How long a claim keeps other workers off an analysis; a crashed worker's claim lapses
+ASSESSMENT_ANALYSIS_LEASE_SECONDS = int(os.getenv("ASSESSMENT_ANALYSIS_LEASE_SECONDS", "300"))
+# What the status endpoint returns once an analysis is complete
+ASSESSMENT_ANALYSIS_FIELDS = (
+    "ai_analysis", "recommendations", "success_probability", "newton_analysis",
+    "risk_factors", "phase_recommendations", "implementation_plan",
+)
+
+def readiness_level_for(overall_score: float) -> str:
+    if overall_score >= 4.5:
+        return "Excellent"
+    elif overall_score >= 3.5:
+        return "Good"
+    elif overall_score >= 2.5:
+        return "Fair"
+    elif overall_score >= 1.5:
+        return "Poor"
+    return "Critical"
+
+def derive_typed_assessment_fields(assessment: dict) -> dict:
+    """Analysis, recommendations, risks and plan for a stored typed assessment"""
+    assessment_type = assessment["assessment_type"]
+    type_config = ASSESSMENT_TYPES[assessment_type]
+    dimension_scores = ScoreVector.from_assessment(
+        assessment, [dimension["id"] for dimension in type_config["dimensions"]]
+    )
+    overall_score = dimension_scores.mean()
+    readiness_level = readiness_level_for(overall_score)
+    
+    # Calculate analysis based on assessment type
+    tables = readiness_tables[assessment_type]
+    analysis_data = tables["readiness"].lookup(dimension_scores)
+    
+    # Calculate success probability
+    base_probability = (overall_score / 5) * 100
+    success_probability = min(95, base_probability + tables["bonus"].lookup(dimension_scores))
+    
+    return {
+        "ai_analysis": generate_typed_ai_analysis(assessment, assessment_type, overall_score, readiness_level, analysis_data),
+        "recommendations": generate_typed_recommendations(assessment_type, dimension_scores, overall_score),
+        "success_probability": round(success_probability, 1),
+        "newton_analysis": analysis_data,
+        "risk_factors": tables["risks"].lookup(dimension_scores),
+        "phase_recommendations": get_phase_recommendations_for_type(assessment_type),
+        "implementation_plan": generate_implementation_plan(assessment_type, overall_score),
+    }
+
+assessment_analysis_slots = asyncio.Semaphore(ASSESSMENT_ANALYSIS_CONCURRENCY)
+
+def claimable_analyses(now: datetime) -> dict:
+    return {
+        "analysis_status": ANALYSIS_PENDING,
+        "$or": [{"analysis_locked_until": None}, {"analysis_locked_until": {"$lte": now}}],
+    }
+
+async def run_assessment_analysis(assessment_id: str):
+    """Fill in a pending assessment's derived fields; a no-op once it is complete, failed
+    or claimed by another worker"""
+    async with assessment_analysis_slots:
+        pending = {"id": assessment_id, "analysis_status": ANALYSIS_PENDING}
+        assessment = None
+        try:
+            now = datetime.utcnow()
+            assessment = await db.assessments.find_one_and_update(
+                {"id": assessment_id, **claimable_analyses(now)},
+                {"$set": {"analysis_locked_until": now + timedelta(seconds=ASSESSMENT_ANALYSIS_LEASE_SECONDS)}},
+                projection={"_id": 0}
+            )
+            if not assessment:
+                return
+            derived = await run_in_threadpool(derive_typed_assessment_fields, assessment)
+            update = {**derived, "analysis_status": ANALYSIS_COMPLETE}
+        except asyncio.CancelledError:
+            # Left pending for the next startup to pick up
+            raise
+        except Exception as e:
+            logger.exception("Assessment Analysis Error: %s", e)
+            update = {"analysis_status": ANALYSIS_FAILED, "analysis_error": str(e)}
+        now = datetime.utcnow()
+        await db.assessments.update_one(
+            pending,
+            {"$set": {**update, "analysis_completed_at": now, "updated_at": now}, "$unset": {"analysis_locked_until": ""}}
+        )
+        await cache.invalidate(f"assessment:{assessment_id}", f"org:{(assessment or {}).get('organization')}")
+
+def queue_assessment_analysis(assessment_id: str) -> asyncio.Task:
+    return start_background_job(run_assessment_analysis(assessment_id))
+
+@app.on_event("startup")
+async def resume_assessment_analyses():
+    start_background_job(recover_assessment_analyses())
+
+async def recover_assessment_analyses(batch_size: int = ASSESSMENT_ANALYSIS_RECOVERY_BATCH_SIZE):
+    """Run every unclaimed pending analysis, a page at a time in _id order"""
+    last_id = None
+    try:
+        while True:
+            query = claimable_analyses(datetime.utcnow())
+            if last_id is not None:
+                query["_id"] = {"$gt": last_id}
+            page = await db.assessments.find(query, {"_id": 1, "id": 1}).sort("_id", 1).limit(batch_size).to_list(batch_size)
+            if not page:
+                return
+            last_id = page[-1]["_id"]
+            await asyncio.gather(*(run_assessment_analysis(assessment["id"]) for assessment in page))
+    except PyMongoError as e:
+        logger.warning("Could not resume pending assessment analyses: %s", e)
+
+@app.get("/api/assessments/{assessment_id}/analysis")
+async def get_assessment_analysis(
+    assessment_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Analysis status of an assessment, with its derived fields once complete"""
+    try:
+        assessment = await db.assessments.find_one(
+            {"id": assessment_id, "user_id": current_user.id},
+            {"_id": 0, "analysis_status": 1, "analysis_error": 1, "analysis_completed_at": 1,
+             **{field: 1 for field in ASSESSMENT_ANALYSIS_FIELDS}}
+        )
+        if assessment is None:
+            raise HTTPException(status_code=404, detail="Assessment not found")
+        
+        # Assessments created before the pipeline were analysed on insert
+        analysis_status = assessment.pop("analysis_status", ANALYSIS_COMPLETE)
+        response = {"assessment_id": assessment_id, "analysis_status": analysis_status}
+        if analysis_status == ANALYSIS_COMPLETE:
+            response.update(assessment)
+        elif analysis_status == ANALYSIS_FAILED:
+            response["analysis_error"] = assessment.get("analysis_error")
+        return response
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Assessment Analysis Status Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get assessment analysis: {str(e)}")
+
+# ====================================================================================
+# IDEMPOTENT SUBMISSIONS - REPLAY THE FIRST RESULT FOR A REPEATED REQUEST KEY
+# ====================================================================================
+
+# How long a key and its stored result are kept (TTL index on created_at)
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", str(24 * 3600)))
+# A pending key not renewed for this long is assumed abandoned by a crashed request and
+# can be retaken; a running handler renews it every third of this interval
+IDEMPOTENCY_PENDING_SECONDS = int(os.getenv("IDEMPOTENCY_PENDING_SECONDS", "60"))
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+# Attempts at storing a finished request's result, backing off from this many seconds
+IDEMPOTENCY_COMPLETE_ATTEMPTS = 3
+IDEMPOTENCY_COMPLETE_BACKOFF_SECONDS = 0.1
+
+# Record id -> (request fingerprint, future) for requests running in this process
+idempotency_inflight: Dict[str, tuple] = {}
+
+def replayed_response(result) -> MongoJSONResponse:
+    return MongoJSONResponse(result, headers={"Idempotent-Replayed": "true"})
+
+def request_fingerprint(payload: dict) -> str:
+    return hashlib.sha256(orjson.dumps(payload, default=_orjson_default, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+async def claim_idempotency_key(record_id: str, user_id: str, scope: str, fingerprint: str) -> Optional[dict]:
+    """Reserve a key for this request; returns the stored record instead if it already finished"""
+    now = datetime.utcnow()
+    record = {
+        "_id": record_id, "user_id": user_id, "scope": scope, "request_hash": fingerprint,
+        "status": "pending", "locked_until": now + timedelta(seconds=IDEMPOTENCY_PENDING_SECONDS), "created_at": now,
+    }
+    try:
+        await db.idempotency_keys.insert_one(record)
+        return None
+    except DuplicateKeyError:
+        existing = await db.idempotency_keys.find_one({"_id": record_id})
+    
+    if existing is None:
+        # Expired between the insert and the read; this request takes it over
+        await db.idempotency_keys.replace_one({"_id": record_id}, record, upsert=True)
+        return None
+    if existing.get("request_hash") != fingerprint:
+        raise HTTPException(status_code=422, detail="Idempotency key was already used with a different request")
+    if existing.get("status") == "complete":
+        return existing
+    taken_over = await db.idempotency_keys.update_one(
+        {"_id": record_id, "status": "pending", "locked_until": {"$lte": now}},
+        {"$set": {"locked_until": record["locked_until"]}}
+    )
+    if not taken_over.modified_count:
+        raise HTTPException(status_code=409, detail="A request with this idempotency key is still being processed")
+    return None
+
+async def renew_idempotency_lock(record_id: str):
+    """Keep a pending key locked for as long as its handler runs"""
+    while True:
+        await asyncio.sleep(IDEMPOTENCY_PENDING_SECONDS / 3)
+        try:
+            await db.idempotency_keys.update_one(
+                {"_id": record_id, "status": "pending"},
+                {"$set": {"locked_until": datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_PENDING_SECONDS)}}
+            )
+        except Exception as e:
+            logger.warning("Could not renew idempotency key %s: %s", record_id, e)
+
+async def complete_idempotency_key(record_id: str, result):
+    """Store a finished request's result against its key.
+
+    If that keeps failing, the key is still marked complete, without the result,
+    so a retry is refused with 409 instead of running the handler a second time.
+    """
+    for attempt in range(IDEMPOTENCY_COMPLETE_ATTEMPTS):
+        try:
+            await db.idempotency_keys.update_one(
+                {"_id": record_id},
+                {"$set": {"status": "complete", "response": result, "completed_at": datetime.utcnow()}}
+            )
+            return
+        except Exception as e:
+            logger.warning("Could not store result for idempotency key %s (attempt %d): %s", record_id, attempt + 1, e)
+            await asyncio.sleep(IDEMPOTENCY_COMPLETE_BACKOFF_SECONDS * 2 ** attempt)
+    try:
+        await db.idempotency_keys.update_one(
+            {"_id": record_id},
+            {"$set": {"status": "complete", "response_lost": True, "completed_at": datetime.utcnow()}}
+        )
+    except Exception as e:
+        logger.error("Idempotency key %s stays pending after its request succeeded: %s", record_id, e)
+
+async def run_idempotent(user_id: str, scope: str, key: Optional[str], payload: dict, handler):
+    """Run ``handler`` once per (user, scope, key); retries get the first result back.
+
+    The key comes from the Idempotency-Key header or an ``idempotency_key`` body
+    field, which is removed from ``payload`` before it is fingerprinted or stored.
+    Requests without a key always run. Replays carry an Idempotent-Replayed header.
+    """
+    key = key or payload.pop("idempotency_key", None)
+    payload.pop("idempotency_key", None)
+    if not key:
+        return await handler()
+    if not isinstance(key, str) or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency key must be a string of at most {IDEMPOTENCY_KEY_MAX_LENGTH} characters")
+    
+    record_id = f"{user_id}:{scope}:{key}"
+    fingerprint = request_fingerprint(payload)
+    inflight = idempotency_inflight.get(record_id)
+    if inflight is not None:
+        # A duplicate of a request this process is still running: wait for its result
+        if inflight[0] != fingerprint:
+            raise HTTPException(status_code=422, detail="Idempotency key was already used with a different request")
+        return replayed_response(await asyncio.shield(inflight[1]))
+    
+    future = asyncio.get_running_loop().create_future()
+    idempotency_inflight[record_id] = (fingerprint, future)
+    try:
+        stored = await claim_idempotency_key(record_id, user_id, scope, fingerprint)
+        if stored is not None:
+            if stored.get("response_lost"):
+                raise HTTPException(
+                    status_code=409,
+                    detail="A request with this idempotency key already succeeded but its result was not stored"
+                )
+            result = stored.get("response")
+            future.set_result(result)
+            return replayed_response(result)
+        renewal = asyncio.create_task(renew_idempotency_lock(record_id))
+        try:
+            result = await handler()
+        except BaseException:
+            renewal.cancel()
+            # Let a retry run the request again
+            await db.idempotency_keys.delete_one({"_id": record_id, "status": "pending"})
+            raise
+        try:
+            await complete_idempotency_key(record_id, result)
+        finally:
+            renewal.cancel()
+        future.set_result(result)
+        return result
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Waiters re-raise it; mark it retrieved so an unawaited future is not logged
+        future.exception()
+        raise
+    finally:
+        idempotency_inflight.pop(record_id, None)
+
 # Enhanced assessment creation with type support
 @app.post("/api/assessments/create")
 async def create_typed_assessment(
     assessment_data: dict,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None)
 ):
+    """Create a typed assessment; retries with the same Idempotency-Key replay the first result"""
+    return await run_idempotent(
+        current_user.id, "assessments.create", idempotency_key, assessment_data,
+        lambda: insert_typed_assessment(assessment_data, current_user)
+    )
+
+async def insert_typed_assessment(assessment_data: dict, current_user: User) -> dict:
     try:
         assessment_type = assessment_data.get("assessment_type", "general_readiness")
         
@@ -4290,45 +6892,12 @@ async def create_typed_assessment(
         type_config = ASSESSMENT_TYPES[assessment_type]
         
         # Calculate overall score from submitted dimensions
-        all_scores = []
-        dimension_scores = {}
-        
-        for dimension in type_config["dimensions"]:
-            dim_id = dimension["id"]
-            if dim_id in assessment_data and "score" in assessment_data[dim_id]:
-                score = assessment_data[dim_id]["score"]
-                all_scores.append(score)
-                dimension_scores[dim_id] = score
-        
-        overall_score = sum(all_scores) / len(all_scores) if all_scores else 0
-        
-        # Determine readiness level
-        if overall_score >= 4.5:
-            readiness_level = "Excellent"
-        elif overall_score >= 3.5:
-            readiness_level = "Good"
-        elif overall_score >= 2.5:
-            readiness_level = "Fair"
-        elif overall_score >= 1.5:
-            readiness_level = "Poor"
-        else:
-            readiness_level = "Critical"
-        
-        # Calculate analysis based on assessment type
-        analysis_data = calculate_universal_readiness_analysis(assessment_data, assessment_type)
-        
-        # Generate AI analysis based on type
-        ai_analysis = generate_typed_ai_analysis(assessment_data, assessment_type, overall_score, readiness_level, analysis_data)
-        
-        # Generate recommendations based on type
-        recommendations = generate_typed_recommendations(assessment_type, dimension_scores, overall_score)
-        
-        # Calculate success probability
-        base_probability = (overall_score / 5) * 100
-        type_bonus = get_type_specific_bonus(assessment_type, dimension_scores)
-        success_probability = min(95, base_probability + type_bonus)
+        dimension_scores = ScoreVector.from_assessment(
+            assessment_data, [dimension["id"] for dimension in type_config["dimensions"]]
+        )
+        overall_score = dimension_scores.mean()
         
-        # Create assessment document
+        # Create the scored assessment; derived fields are filled in by the analysis pipeline
         assessment_doc = {
             "id": assessment_id,
             "user_id": current_user.id,
@@ -4339,27 +6908,24 @@ async def create_typed_assessment(
             "assessment_version": "3.0",
             **assessment_data,  # Include all dimension data
             "overall_score": round(overall_score, 2),
-            "readiness_level": readiness_level,
-            "ai_analysis": ai_analysis,
-            "recommendations": recommendations,
-            "success_probability": round(success_probability, 1),
-            "newton_analysis": analysis_data,
-            "risk_factors": get_type_specific_risks(assessment_type, dimension_scores),
-            "phase_recommendations": get_phase_recommendations_for_type(assessment_type),
-            "implementation_plan": generate_implementation_plan(assessment_type, overall_score),
+            "readiness_level": readiness_level_for(overall_score),
             "guarantee_eligibility": overall_score >= 3.0,
+            "analysis_status": ANALYSIS_PENDING,
             "created_at": now,
             "updated_at": now
         }
         
         # Save to database
-        result = await db.assessments.insert_one(assessment_doc)
-        assessment_doc["_id"] = str(result.inserted_id)
+        await db.assessments.insert_one(assessment_doc)
+        await cache.invalidate(f"org:{current_user.organization}")
+        queue_assessment_analysis(assessment_id)
         
         return assessment_doc
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Assessment Creation Error: {str(e)}")
+        logger.exception("Assessment Creation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create assessment: {str(e)}")
 
 # Projects endpoints
@@ -4430,25 +6996,27 @@ async def create_project(
             "updated_at": now
         }
         
-        result = await db.projects.insert_one(project_doc)
-        project_doc["_id"] = str(result.inserted_id)
+        await insert_project_document(project_doc)
         
         return project_doc
         
     except Exception as e:
-        print(f"Project Creation Error: {str(e)}")
+        logger.exception("Project Creation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create project: {str(e)}")
 
 @app.get("/api/projects")
-async def get_user_projects(current_user: User = Depends(get_current_user)):
+async def get_user_projects(
+    limit: int = Query(PROJECT_PAGE_DEFAULT_LIMIT, ge=1, le=PROJECT_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """Project summaries for the list view; fetch /api/projects/{id} for tasks and deliverables"""
     try:
-        projects = []
-        async for project in db.projects.find({"user_id": current_user.id}):
-            project["_id"] = str(project["_id"])
-            projects.append(project)
-        return {"projects": projects}
+        return await list_project_summaries({"user_id": current_user.id}, limit, cursor)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Get Projects Error: {str(e)}")
+        logger.exception("Get Projects Error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve projects")
 
 @app.get("/api/projects/{project_id}")
@@ -4457,10 +7025,10 @@ async def get_project(project_id: str, current_user: User = Depends(get_current_
         project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        project["_id"] = str(project["_id"])
+        await attach_work_items([project])
         return project
     except Exception as e:
-        print(f"Get Project Error: {str(e)}")
+        logger.exception("Get Project Error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to retrieve project")
 
 @app.post("/api/assessments/{assessment_id}/implementation-plan")
@@ -4476,13 +7044,7 @@ async def generate_implementation_plan_endpoint(
             raise HTTPException(status_code=404, detail="Assessment not found")
         
         # Extract assessment data for plan generation
-        assessment_data = {
-            "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-            "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-            "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-            "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-            "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3)
-        }
+        assessment_data = cached_assessment_scores(assessment).subset(READINESS_PLAN_DIMENSIONS)
         
         assessment_type = assessment.get("assessment_type", "general_readiness")
         overall_score = assessment.get("overall_score", 3.0)
@@ -4505,7 +7067,7 @@ async def generate_implementation_plan_endpoint(
         return implementation_plan
         
     except Exception as e:
-        print(f"Implementation Plan Generation Error: {str(e)}")
+        logger.exception("Implementation Plan Generation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate implementation plan: {str(e)}")
 
 @app.post("/api/assessments/{assessment_id}/customized-playbook")
@@ -4544,13 +7106,7 @@ async def generate_customized_playbook(
         ).with_model("anthropic", "claude-sonnet-4-20250514")
         
         # Create detailed prompt for playbook generation
-        assessment_data = {
-            "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-            "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-            "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-            "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-            "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3)
-        }
+        assessment_data = cached_assessment_scores(assessment).subset(READINESS_PLAN_DIMENSIONS)
         
         prompt = f"""
         Generate a comprehensive, customized change management playbook for the following organization:
@@ -4582,9 +7138,17 @@ async def generate_customized_playbook(
         The playbook should be approximately 2000-3000 words and include specific tactics, tools, and strategies tailored to this organization's unique profile.
         """
         
-        # Generate playbook content
-        response = await chat.send_message(UserMessage(prompt))
-        playbook_content = response if isinstance(response, str) else response.text
+        # Generate playbook content; concurrent requests for one assessment share the call
+        async def generate_content():
+            response = await chat.send_message(UserMessage(prompt))
+            return response if isinstance(response, str) else response.text
+        
+        playbook_content = await cache.get_or_set(
+            f"playbook:{assessment_id}",
+            generate_content,
+            ttl=PLAYBOOK_CACHE_TTL_SECONDS,
+            tags=(f"assessment:{assessment_id}",),
+        )
         
         # Structure the playbook response
         playbook = {
@@ -4611,7 +7175,7 @@ async def generate_customized_playbook(
         return playbook
         
     except Exception as e:
-        print(f"Customized Playbook Generation Error: {str(e)}")
+        logger.exception("Customized Playbook Generation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate customized playbook: {str(e)}")
 
 @app.post("/api/assessments/{assessment_id}/predictive-analytics")
@@ -4626,16 +7190,13 @@ async def generate_predictive_analytics(
         if not assessment:
             raise HTTPException(status_code=404, detail="Assessment not found")
         
+        cache_key = f"predictive:{assessment_id}"
+        cached = await cache.lookup(cache_key)
+        if cached is not CACHE_MISS:
+            return cached
+        
         # Extract assessment data for analytics
-        assessment_data = {
-            "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-            "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-            "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-            "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-            "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-            "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-            "stakeholder_engagement": assessment.get("stakeholder_engagement", {}).get("score", 3)
-        }
+        assessment_data = cached_assessment_scores(assessment).subset(PHASE_ANALYSIS_DIMENSIONS)
         
         assessment_type = assessment.get("assessment_type", "general_readiness")
         overall_score = assessment.get("overall_score", 3.0)
@@ -4693,354 +7254,1115 @@ async def generate_predictive_analytics(
             }
         }
         
+        await cache.set(cache_key, predictive_analytics, ttl=PREDICTIVE_ANALYTICS_CACHE_TTL_SECONDS, tags=(f"assessment:{assessment_id}",))
         return predictive_analytics
         
     except Exception as e:
-        print(f"Predictive Analytics Generation Error: {str(e)}")
+        logger.exception("Predictive Analytics Generation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate predictive analytics: {str(e)}")
 
-@app.post("/api/projects/{project_id}/risk-monitoring")
-async def generate_real_time_risk_monitoring(
-    project_id: str,
-    current_user: User = Depends(get_current_user)
+# ====================================================================================
+# RISK ALERT RULES - REGISTRY, INCREMENTAL EVALUATION AND PERSISTED FIRING STATE
+# ====================================================================================
+
+# (threshold %, severity, message, recommended action), checked highest first
+BUDGET_UTILIZATION_ALERT_LEVELS = (
+    (80, "High", "Budget utilization at {value:.1f}% - immediate attention required",
+     "Review remaining activities and implement cost controls"),
+    (60, "Medium", "Budget utilization at {value:.1f}% - monitor closely",
+     "Review upcoming expenses and optimize resource allocation"),
+)
+SCHEDULE_RISK_MAX_PROGRESS = 60
+SCHEDULE_RISK_MIN_BUDGET_UTILIZATION = 70
+
+RISK_SWEEP_BATCH_SIZE = int(os.getenv("RISK_SWEEP_BATCH_SIZE", "1000"))
+ACTIVE_PROJECTS_FILTER = {"status": "active"}
+
+def risk_progress(project: dict) -> float:
+    """Overall progress for alerting: from embedded work items, else the stored percentage"""
+    if any(project.get(field) for field in PROGRESS_ITEM_FIELDS):
+        return calculate_project_progress(project)
+    return project.get("progress_percentage") or 0.0
+
+def budget_utilization_percent(project: dict) -> float:
+    spent_budget = project.get("spent_budget", 0)
+    total_budget = project.get("total_budget", 90000)
+    return (spent_budget / total_budget * 100) if total_budget > 0 else 0
+
+def alert_level(value: float, levels: tuple) -> Optional[tuple]:
+    """First (threshold, ...) level that value exceeds, or None"""
+    for level in levels:
+        if value > level[0]:
+            return level
+    return None
+
+class RiskContext:
+    """A project plus its derived metrics, each computed at most once per evaluation"""
+
+    def __init__(self, project: dict):
+        self.project = project
+
+    @functools.cached_property
+    def progress(self) -> float:
+        return risk_progress(self.project)
+
+    @functools.cached_property
+    def budget_utilization(self) -> float:
+        return budget_utilization_percent(self.project)
+
+class RiskRule:
+    __slots__ = ("key", "type", "fields", "check")
+
+    def __init__(self, key: str, alert_type: str, fields: tuple, check):
+        self.key = key
+        self.type = alert_type
+        self.fields = fields
+        self.check = check
+
+class RiskRuleRegistry:
+    """Alert rules keyed by name, each declaring the project fields it reads.
+
+    ``fields`` are projection paths ("tasks.status"); their top-level names decide
+    which rules an update re-evaluates. The field index and the projection that
+    loads every rule's inputs are built once, on first use after registration.
+    """
+
+    def __init__(self):
+        self.rules: Dict[str, RiskRule] = {}
+        self._rules_by_field: Optional[Dict[str, tuple]] = None
+        self._projection: Optional[dict] = None
+
+    def register(self, key: str, alert_type: str, fields: tuple):
+        def decorator(check):
+            self.rules[key] = RiskRule(key, alert_type, tuple(fields), check)
+            self._rules_by_field = self._projection = None
+            return check
+        return decorator
+
+    def compile(self):
+        rules_by_field: Dict[str, list] = {}
+        projection = {"_id": 1, "id": 1, "project_name": 1}
+        for rule in self.rules.values():
+            for path in rule.fields:
+                projection[path] = 1
+                rules_by_field.setdefault(path.split(".", 1)[0], []).append(rule)
+        self._rules_by_field = {field: tuple(rules) for field, rules in rules_by_field.items()}
+        self._projection = projection
+
+    @property
+    def projection(self) -> dict:
+        if self._projection is None:
+            self.compile()
+        return self._projection
+
+    @property
+    def fields(self) -> frozenset:
+        if self._rules_by_field is None:
+            self.compile()
+        return frozenset(self._rules_by_field)
+
+    def rules_for(self, changed_fields: Optional[set] = None) -> List[RiskRule]:
+        """Rules depending on any of changed_fields (top-level names), in registration order"""
+        if changed_fields is None:
+            return list(self.rules.values())
+        if self._rules_by_field is None:
+            self.compile()
+        affected = {rule.key for field in changed_fields for rule in self._rules_by_field.get(field, ())}
+        return [rule for rule in self.rules.values() if rule.key in affected]
+
+    def evaluate(self, context: RiskContext, changed_fields: Optional[set] = None) -> Dict[str, Optional[dict]]:
+        """Alert per affected rule key, None where the rule is not firing"""
+        results = {}
+        for rule in self.rules_for(changed_fields):
+            alert = rule.check(context)
+            results[rule.key] = {"key": rule.key, "type": rule.type, **alert} if alert else None
+        return results
+
+risk_rules = RiskRuleRegistry()
+
+@risk_rules.register("budget", "Budget", fields=("spent_budget", "total_budget"))
+def budget_utilization_rule(context: RiskContext) -> Optional[dict]:
+    level = alert_level(context.budget_utilization, BUDGET_UTILIZATION_ALERT_LEVELS)
+    if level is None:
+        return None
+    _, severity, message, recommended_action = level
+    return {
+        "severity": severity,
+        "message": message.format(value=context.budget_utilization),
+        "recommended_action": recommended_action
+    }
+
+@risk_rules.register(
+    "schedule", "Schedule",
+    fields=("spent_budget", "total_budget", "progress_percentage") + tuple(f"{field}.status" for field in PROGRESS_ITEM_FIELDS)
+)
+def schedule_risk_rule(context: RiskContext) -> Optional[dict]:
+    if context.progress < SCHEDULE_RISK_MAX_PROGRESS and context.budget_utilization > SCHEDULE_RISK_MIN_BUDGET_UTILIZATION:
+        return {
+            "severity": "High",
+            "message": "Project behind schedule with high budget utilization",
+            "recommended_action": "Accelerate critical path activities and review scope"
+        }
+    return None
+
+async def record_alert_transitions(evaluations: Dict[str, Dict[str, Optional[dict]]]) -> Dict[str, Dict[str, List[str]]]:
+    """Persist firing state for evaluated rules; returns raised/updated/cleared rule keys per project.
+
+    An alert that keeps firing at the same severity is not written again, so
+    repeated evaluations never duplicate it. Rules absent from an evaluation
+    keep their stored state.
+    """
+    if not evaluations:
+        return {}
+    
+    firing = {}
+    async for state in db.project_alert_states.find(
+        {"project_id": {"$in": list(evaluations)}, "active": True},
+        {"_id": 0, "project_id": 1, "rule_key": 1, "severity": 1}
+    ):
+        firing[(state["project_id"], state["rule_key"])] = state["severity"]
+    
+    now = datetime.utcnow()
+    operations = []
+    transitions: Dict[str, Dict[str, List[str]]] = {}
+    for project_id, results in evaluations.items():
+        for rule_key, alert in results.items():
+            severity = firing.get((project_id, rule_key))
+            if alert is not None and severity is None:
+                transition = "raised"
+                update = {
+                    "$set": {"active": True, "severity": alert["severity"], "alert": alert, "fired_at": now, "updated_at": now},
+                    "$unset": {"cleared_at": ""}
+                }
+            elif alert is not None and alert["severity"] != severity:
+                transition = "updated"
+                update = {"$set": {"severity": alert["severity"], "alert": alert, "updated_at": now}}
+            elif alert is None and severity is not None:
+                transition = "cleared"
+                update = {"$set": {"active": False, "cleared_at": now, "updated_at": now}}
+            else:
+                continue
+            operations.append(UpdateOne({"project_id": project_id, "rule_key": rule_key}, update, upsert=True))
+            transitions.setdefault(project_id, {}).setdefault(transition, []).append(rule_key)
+    
+    if operations:
+        await db.project_alert_states.bulk_write(operations, ordered=False)
+    return transitions
+
+async def sweep_risk_alerts(batch_size: int = RISK_SWEEP_BATCH_SIZE) -> dict:
+    """Evaluate every rule against every active project.
+
+    Rules run in-process on projected documents; each batch costs one read of
+    the current firing state and at most one bulk write of transitions.
+    """
+    start = time.perf_counter()
+    summary = {"projects_evaluated": 0, "raised": 0, "updated": 0, "cleared": 0}
+    
+    async def evaluate_batch(projects: List[dict]):
+        transitions = await record_alert_transitions(
+            {project["id"]: risk_rules.evaluate(RiskContext(project)) for project in projects}
+        )
+        summary["projects_evaluated"] += len(projects)
+        for project_transitions in transitions.values():
+            for transition, rule_keys in project_transitions.items():
+                summary[transition] += len(rule_keys)
+    
+    batch = []
+    async for project in db.projects.find(ACTIVE_PROJECTS_FILTER, risk_rules.projection).batch_size(batch_size):
+        batch.append(project)
+        if len(batch) >= batch_size:
+            await evaluate_batch(batch)
+            batch = []
+    if batch:
+        await evaluate_batch(batch)
+    
+    elapsed = time.perf_counter() - start
+    summary["duration_seconds"] = round(elapsed, 3)
+    summary["projects_per_second"] = round(summary["projects_evaluated"] / elapsed) if elapsed > 0 else 0
+    return summary
+
+@app.post("/api/admin/risk-alerts/sweep")
+async def run_risk_alert_sweep(
+    batch_size: int = Query(RISK_SWEEP_BATCH_SIZE, ge=1, le=10000),
+    admin_user: User = Depends(get_admin_user)
 ):
-    """Generate real-time risk monitoring dashboard for active projects"""
+    """Re-evaluate all risk rules for every active project (the nightly check, on demand)"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment if available
-        assessment_id = project.get("assessment_id")
-        assessment_data = {}
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3)
-                }
-        
-        # Calculate current project metrics
-        overall_progress = calculate_project_progress(project)
-        spent_budget = project.get("spent_budget", 0)
-        total_budget = project.get("total_budget", 90000)
-        budget_utilization = (spent_budget / total_budget * 100) if total_budget > 0 else 0
-        
-        # Generate risk alerts
-        risk_alerts = []
-        
-        # Budget risk alerts
-        if budget_utilization > 80:
-            risk_alerts.append({
-                "type": "Budget",
-                "severity": "High",
-                "message": f"Budget utilization at {budget_utilization:.1f}% - immediate attention required",
-                "recommended_action": "Review remaining activities and implement cost controls"
-            })
-        elif budget_utilization > 60:
-            risk_alerts.append({
-                "type": "Budget",
-                "severity": "Medium",
-                "message": f"Budget utilization at {budget_utilization:.1f}% - monitor closely",
-                "recommended_action": "Review upcoming expenses and optimize resource allocation"
-            })
+        summary = await sweep_risk_alerts(batch_size)
+        logger.info("Risk alert sweep: %s", summary)
+        return summary
+    except Exception as e:
+        logger.exception("Risk Alert Sweep Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to sweep risk alerts: {str(e)}")
+
+# ====================================================================================
+# REAL-TIME RISK STREAM - PUSH ALERT CHANGES TO SUBSCRIBERS
+# ====================================================================================
+
+RISK_POLL_INTERVAL_SECONDS = float(os.getenv("RISK_POLL_INTERVAL_SECONDS", "5"))
+RISK_SUBSCRIBER_QUEUE_SIZE = 100
+
+# Fields shown in a subscriber's current status, on top of those the rules read
+RISK_STATUS_FIELDS = ("health_status",)
+
+def risk_stream_projection() -> dict:
+    return {**risk_rules.projection, **{field: 1 for field in RISK_STATUS_FIELDS}}
+
+def risk_state(context: RiskContext, previous: Optional[dict] = None, changed_fields: Optional[set] = None) -> tuple:
+    """(state, evaluated rules); with a previous state only rules reading changed_fields run"""
+    if previous is None:
+        changed_fields = None
+    evaluated = risk_rules.evaluate(context, changed_fields)
+    risk_alerts = dict(previous["risk_alerts"]) if changed_fields is not None else {}
+    for key, alert in evaluated.items():
+        if alert:
+            risk_alerts[key] = alert
+        else:
+            risk_alerts.pop(key, None)
+    state = {
+        "current_status": {
+            "overall_progress": round(context.progress, 1),
+            "budget_utilization": round(context.budget_utilization, 1),
+            "health_status": context.project.get("health_status", "green")
+        },
+        "risk_alerts": risk_alerts,
+    }
+    return state, evaluated
+
+def diff_risk_state(previous: dict, current: dict) -> dict:
+    """Alerts raised, updated and cleared between two states, plus status if it moved"""
+    diff = {}
+    raised = [alert for key, alert in current["risk_alerts"].items() if key not in previous["risk_alerts"]]
+    updated = [
+        alert for key, alert in current["risk_alerts"].items()
+        if key in previous["risk_alerts"] and previous["risk_alerts"][key] != alert
+    ]
+    cleared = [key for key in previous["risk_alerts"] if key not in current["risk_alerts"]]
+    if raised:
+        diff["raised"] = raised
+    if updated:
+        diff["updated"] = updated
+    if cleared:
+        diff["cleared"] = cleared
+    if current["current_status"] != previous["current_status"]:
+        diff["current_status"] = current["current_status"]
+    return diff
+
+def risk_snapshot_message(project_id: str, state: dict) -> dict:
+    return {
+        "type": "snapshot",
+        "project_id": project_id,
+        "current_status": state["current_status"],
+        "risk_alerts": list(state["risk_alerts"].values()),
+        "generated_at": datetime.utcnow()
+    }
+
+def changed_top_level_fields(change: dict) -> Optional[set]:
+    """Top-level fields an update touched; None for replaces, where anything may have changed"""
+    if change["operationType"] != "update":
+        return None
+    description = change.get("updateDescription") or {}
+    paths = list(description.get("updatedFields") or {}) + list(description.get("removedFields") or [])
+    return {path.split(".", 1)[0] for path in paths}
+
+class ProjectRiskHub:
+    """Fans risk alert changes out to subscribed sockets, with one watcher per process.
+
+    A change stream on ``projects`` wakes the hub when a subscribed project's
+    budget, progress or work items change, and only the rules reading the
+    changed fields are re-evaluated for that project. Standalone MongoDB has no change streams, so the hub falls
+    back to polling the subscribed projects with one ``$in`` query per interval.
+    Subscribers only receive differences from the last evaluated state.
+    """
+
+    def __init__(self, poll_interval: float):
+        self.poll_interval = poll_interval
+        self.subscribers: Dict[str, set] = {}
+        self.states: Dict[str, dict] = {}
+        # Change events only carry the Mongo _id
+        self.project_ids_by_oid: Dict[Any, str] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.mode: Optional[str] = None
+
+    def subscribe(self, project: dict) -> tuple:
+        project_id = project["id"]
+        if project_id not in self.states:
+            self.states[project_id], _ = risk_state(RiskContext(project))
+        state = self.states[project_id]
+        self.project_ids_by_oid[project["_id"]] = project_id
+        subscriber = asyncio.Queue(maxsize=RISK_SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.setdefault(project_id, set()).add(subscriber)
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        return subscriber, state
+
+    def unsubscribe(self, project_id: str, subscriber: asyncio.Queue):
+        subscribers = self.subscribers.get(project_id, set())
+        subscribers.discard(subscriber)
+        if not subscribers:
+            self.subscribers.pop(project_id, None)
+            self.states.pop(project_id, None)
+            self.project_ids_by_oid = {oid: pid for oid, pid in self.project_ids_by_oid.items() if pid != project_id}
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def run(self):
+        while True:
+            try:
+                await self.watch_changes()
+            except OperationFailure as e:
+                # Change streams need a replica set or sharded cluster
+                logger.info("Risk stream change streams unavailable, polling instead: %s", e)
+                await self.poll()
+            except PyMongoError as e:
+                logger.warning("Risk stream change stream interrupted, reopening: %s", e)
+                await asyncio.sleep(self.poll_interval)
+
+    async def watch_changes(self):
+        pipeline = [{"$match": {"operationType": {"$in": ["update", "replace", "delete"]}}}]
+        async with db.projects.watch(pipeline) as stream:
+            self.mode = "change_stream"
+            async for change in stream:
+                project_id = self.project_ids_by_oid.get(change["documentKey"]["_id"])
+                if not project_id:
+                    continue
+                changed_fields = changed_top_level_fields(change)
+                if changed_fields is None or changed_fields & self.watched_fields:
+                    await self.refresh([project_id], changed_fields)
+
+    async def poll(self):
+        self.mode = "polling"
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            if self.subscribers:
+                await self.refresh(list(self.subscribers))
+
+    @property
+    def watched_fields(self) -> frozenset:
+        return risk_rules.fields | frozenset(RISK_STATUS_FIELDS)
+
+    async def refresh(self, project_ids: List[str], changed_fields: Optional[set] = None):
+        """Re-evaluate rules reading changed_fields (all when None) and publish differences"""
+        projects = {
+            project["id"]: project
+            async for project in db.projects.find({"id": {"$in": project_ids}}, risk_stream_projection())
+        }
+        updates, evaluations = {}, {}
+        for project_id in project_ids:
+            previous = self.states.get(project_id)
+            if previous is None:
+                continue
+            project = projects.get(project_id)
+            if project is None:
+                self.publish(project_id, {"type": "project_deleted", "project_id": project_id}, previous)
+                continue
+            updates[project_id], evaluations[project_id] = risk_state(RiskContext(project), previous, changed_fields)
+        
+        await record_alert_transitions(evaluations)
+        for project_id, state in updates.items():
+            previous = self.states.get(project_id)
+            if previous is None:
+                continue
+            diff = diff_risk_state(previous, state)
+            if diff:
+                self.states[project_id] = state
+                self.publish(
+                    project_id,
+                    {"type": "risk_update", "project_id": project_id, **diff, "generated_at": datetime.utcnow()},
+                    state
+                )
+
+    def publish(self, project_id: str, message: dict, state: dict):
+        snapshot = None
+        for subscriber in self.subscribers.get(project_id, ()):
+            queued = message
+            if subscriber.full():
+                # Slow consumer: replace its backlog with a full snapshot so it still converges
+                while not subscriber.empty():
+                    subscriber.get_nowait()
+                if message["type"] == "risk_update":
+                    if snapshot is None:
+                        snapshot = risk_snapshot_message(project_id, state)
+                    queued = snapshot
+            subscriber.put_nowait(queued)
+
+risk_hub = ProjectRiskHub(RISK_POLL_INTERVAL_SECONDS)
+
+@app.on_event("shutdown")
+async def stop_risk_stream():
+    await risk_hub.stop()
+
+async def send_risk_message(websocket: WebSocket, message: dict):
+    await websocket.send_text(orjson.dumps(message, default=_orjson_default, option=ORJSON_OPTIONS).decode())
+
+@app.websocket("/api/projects/{project_id}/risk-stream")
+async def project_risk_stream(websocket: WebSocket, project_id: str, token: str = Query(...)):
+    """Push budget and schedule alert changes for a project.
+
+    Browsers cannot set headers on WebSockets, so the JWT is passed as ?token=.
+    The first message is a full snapshot; later ones are risk_update diffs.
+    """
+    try:
+        user = await authenticate_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    project = await db.projects.find_one({"id": project_id, "user_id": user.id}, risk_stream_projection())
+    if not project:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    await websocket.accept()
+    subscriber, state = risk_hub.subscribe(project)
+    receiver = asyncio.create_task(websocket.receive())
+    try:
+        await send_risk_message(websocket, risk_snapshot_message(project_id, state))
+        while True:
+            getter = asyncio.create_task(subscriber.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                if receiver.result()["type"] == "websocket.disconnect":
+                    return
+                # Client messages carry nothing; keep listening for the disconnect
+                receiver = asyncio.create_task(websocket.receive())
+                continue
+            message = getter.result()
+            await send_risk_message(websocket, message)
+            if message["type"] == "project_deleted":
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        risk_hub.unsubscribe(project_id, subscriber)
+
+# ====================================================================================
+# PROJECT ANALYTICS INPUTS - PROJECT AND ASSESSMENT SCORES IN ONE ROUND TRIP
+# ====================================================================================
+
+# Every dimension score a project analytic reads from its linked assessment
+ANALYTICS_ASSESSMENT_DIMENSIONS = (
+    "leadership_support", "resource_availability", "change_management_maturity",
+    "communication_effectiveness", "workforce_adaptability", "technical_readiness",
+    "stakeholder_engagement", "maintenance_operations_alignment", "safety_compliance",
+    "shift_work_considerations",
+)
+# ...under either of their names, since typed assessments score leadership_commitment
+ANALYTICS_ASSESSMENT_FIELDS = tuple(
+    name for name, index in SCORE_DIMENSION_INDEX.items()
+    if index in score_columns(ANALYTICS_ASSESSMENT_DIMENSIONS)
+)
+ANALYTICS_ASSESSMENT_PROJECTION = {
+    "_id": 0, "id": 1, "user_id": 1, "overall_score": 1, "assessment_type": 1,
+    **{f"{dimension}.score": 1 for dimension in ANALYTICS_ASSESSMENT_FIELDS},
+}
+# The same shape as ANALYTICS_ASSESSMENT_PROJECTION, as a $map expression over $$assessment
+ANALYTICS_ASSESSMENT_EXPRESSION = {
+    "id": "$$assessment.id",
+    "overall_score": "$$assessment.overall_score",
+    "assessment_type": "$$assessment.assessment_type",
+    **{dimension: {"score": f"$$assessment.{dimension}.score"} for dimension in ANALYTICS_ASSESSMENT_FIELDS},
+}
+# Scores the implementation plan and playbook read
+READINESS_PLAN_DIMENSIONS = (
+    "leadership_support", "resource_availability", "change_management_maturity",
+    "communication_effectiveness", "workforce_adaptability",
+)
+# Scores the predictive analytics, phase intelligence and phase completion analyses read
+PHASE_ANALYSIS_DIMENSIONS = READINESS_PLAN_DIMENSIONS + ("technical_readiness", "stakeholder_engagement")
+# Dimension scores and overall_score are never edited after creation, so they can be
+# cached by id; a change that edits those fields must invalidate this LRU
+ASSESSMENT_SCORES_CACHE_SIZE = 1024
+
+class AssessmentScores:
+    """Dimension scores of one assessment, read once from a projected document.
+
+    Missing dimensions score 3, as everywhere else. ``subset`` returns the
+    ScoreVector the analytics helpers take, built once per dimension tuple and
+    shared between callers, so treat it as read-only.
+    """
+    __slots__ = ("assessment_id", "assessment_type", "overall_score", "scores", "_subsets")
+
+    def __init__(self, assessment_id: str, assessment_type: str, overall_score: float, scores: ScoreVector):
+        self.assessment_id = assessment_id
+        self.assessment_type = assessment_type
+        self.overall_score = overall_score
+        self.scores = scores
+        self._subsets: Dict[tuple, ScoreVector] = {}
+
+    @classmethod
+    def from_document(cls, assessment: dict) -> "AssessmentScores":
+        return cls(
+            assessment.get("id"),
+            assessment.get("assessment_type") or "general_readiness",
+            assessment.get("overall_score", 3.0),
+            ScoreVector.from_assessment(assessment, ANALYTICS_ASSESSMENT_FIELDS)
+        )
+
+    def score(self, dimension: str, default: float = 3) -> float:
+        return self.scores.get(dimension, default)
+
+    def subset(self, dimensions: tuple, with_overall: bool = False) -> ScoreVector:
+        key = (dimensions, with_overall)
+        subset = self._subsets.get(key)
+        if subset is None:
+            subset = self.scores.restrict(dimensions, fill=3, with_overall=False)
+            if with_overall:
+                subset.overall_score = self.overall_score
+            self._subsets[key] = subset
+        return subset
+
+assessment_scores_cache: "OrderedDict[str, AssessmentScores]" = OrderedDict()
+
+def cached_assessment_scores(assessment: dict) -> AssessmentScores:
+    assessment_id = assessment.get("id")
+    scores = assessment_scores_cache.get(assessment_id)
+    if scores is not None:
+        assessment_scores_cache.move_to_end(assessment_id)
+        return scores
+    scores = AssessmentScores.from_document(assessment)
+    if assessment_id:
+        assessment_scores_cache[assessment_id] = scores
+        if len(assessment_scores_cache) > ASSESSMENT_SCORES_CACHE_SIZE:
+            assessment_scores_cache.popitem(last=False)
+    return scores
+
+def project_with_scores_pipeline(project_id: str, user_id: str, projection: Optional[dict] = None,
+                                 snapshot: Optional[str] = None) -> List[dict]:
+    """The project and, via $lookup, just the score fields of its assessment if the same user owns it.
+
+    With ``snapshot``, the stored project_analytics entry of that name rides along as
+    ``stored_snapshot`` so serving a precomputed snapshot is the same single round trip.
+    """
+    pipeline = [{"$match": {"id": project_id, "user_id": user_id}}, {"$limit": 1}]
+    if projection:
+        pipeline.append({"$project": {**projection, "assessment_id": 1}})
+    pipeline += [
+        {"$lookup": {"from": "assessments", "localField": "assessment_id", "foreignField": "id", "as": "linked_assessment"}},
+        {"$addFields": {"linked_assessment": {"$map": {
+            "input": {"$filter": {
+                "input": "$linked_assessment", "as": "assessment",
+                "cond": {"$eq": ["$$assessment.user_id", user_id]}
+            }},
+            "as": "assessment",
+            "in": ANALYTICS_ASSESSMENT_EXPRESSION
+        }}}},
+    ]
+    if snapshot:
+        pipeline += [
+            {"$lookup": {"from": "project_analytics", "localField": "id", "foreignField": "project_id", "as": "stored_snapshot"}},
+            {"$addFields": {"stored_snapshot": {"$map": {
+                "input": "$stored_snapshot", "as": "stored",
+                "in": {"snapshot": f"$$stored.analytics.{snapshot}", "computed_at": f"$$stored.computed_at.{snapshot}"}
+            }}}},
+        ]
+    return pipeline
+
+def split_project_scores(project: Optional[dict]) -> tuple:
+    if not project:
+        return None, None
+    linked = project.pop("linked_assessment", None) or []
+    return project, (cached_assessment_scores(linked[0]) if linked else None)
+
+async def load_project_with_scores(project_id: str, user_id: str, projection: Optional[dict] = None,
+                                   snapshot: Optional[str] = None) -> tuple:
+    """(project, AssessmentScores or None) in one aggregation; (None, None) if not found"""
+    pipeline = project_with_scores_pipeline(project_id, user_id, projection, snapshot)
+    projects = await db.projects.aggregate(pipeline).to_list(1)
+    return split_project_scores(projects[0] if projects else None)
+
+def build_risk_monitoring(project: dict, scores: Optional[AssessmentScores]) -> dict:
+    """Real-time risk monitoring dashboard for an active project"""
+    # Calculate current project metrics
+    context = RiskContext(project)
+    overall_progress = context.progress
+    budget_utilization = context.budget_utilization
+    
+    # Evaluate the alert rules
+    risk_alerts = [alert for alert in risk_rules.evaluate(context).values() if alert]
+    
+    # Generate trending analysis
+    current_week = min(10, max(1, int(overall_progress / 10) + 1))
+    
+    return {
+        "project_id": project["id"],
+        "project_name": project.get("project_name", ""),
+        "current_status": {
+            "overall_progress": round(overall_progress, 1),
+            "current_week": current_week,
+            "budget_utilization": round(budget_utilization, 1),
+            "health_status": project.get("health_status", "green")
+        },
+        "risk_alerts": risk_alerts,
+        "trend_analysis": {
+            "budget_trend": "On Track" if budget_utilization <= overall_progress else "Over Budget",
+            "schedule_trend": "On Track" if overall_progress >= (current_week * 10) else "Behind Schedule",
+            "scope_trend": "Stable" if len(risk_alerts) == 0 else "At Risk"
+        },
+        "predictive_insights": {
+            "completion_probability": min(95, max(30, 100 - len(risk_alerts) * 20)),
+            "budget_overrun_risk": "Low" if budget_utilization < 80 else "High",
+            "timeline_risk": "Low" if overall_progress >= (current_week * 8) else "High"
+        },
+        "recommendations": generate_real_time_recommendations(risk_alerts, overall_progress, budget_utilization),
+        "generated_at": datetime.utcnow()
+    }
+
+def build_detailed_budget_tracking(project: dict, scores: Optional[AssessmentScores]) -> dict:
+    """Task-level and phase-level budget tracking from the assessment's implementation plan"""
+    assessment_data = scores.subset((
+        "leadership_support", "resource_availability", "change_management_maturity",
+        "communication_effectiveness", "workforce_adaptability", "technical_readiness", "stakeholder_engagement"
+    )) if scores else {}
+    implementation_plan = {}
+    if scores:
+        # Generate implementation plan for budget tracking
+        overall_score = scores.overall_score
+        assessment_type = scores.assessment_type
+        implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
+    
+    return generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
+
+def build_advanced_forecasting(project: dict, scores: Optional[AssessmentScores]) -> dict:
+    """Advanced project outcome forecasting"""
+    assessment_data = scores.subset((
+        "leadership_support", "resource_availability", "change_management_maturity",
+        "communication_effectiveness", "workforce_adaptability", "technical_readiness",
+        "stakeholder_engagement", "maintenance_operations_alignment"
+    ), with_overall=True) if scores else {}
+    predictive_analytics = {}
+    budget_tracking = {}
+    
+    if scores:
+        assessment_type = scores.assessment_type
+        overall_score = scores.overall_score
         
-        # Schedule risk alerts
-        if overall_progress < 60 and budget_utilization > 70:
-            risk_alerts.append({
-                "type": "Schedule",
-                "severity": "High",
-                "message": "Project behind schedule with high budget utilization",
-                "recommended_action": "Accelerate critical path activities and review scope"
-            })
+        # Simulate predictive analytics data
+        predictive_analytics = {
+            "project_outlook": {
+                "success_probability": min(95, max(15, overall_score * 18))
+            }
+        }
         
-        # Generate trending analysis
-        current_week = min(10, max(1, int(overall_progress / 10) + 1))
+        # Simulate budget tracking data
+        implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
+        budget_tracking = generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
+    
+    return generate_advanced_project_forecasting(project, assessment_data, predictive_analytics, budget_tracking)
+
+def build_stakeholder_communications(project: dict, scores: Optional[AssessmentScores]) -> dict:
+    """Automated stakeholder communication content"""
+    assessment_data = scores.subset((
+        "leadership_support", "resource_availability", "change_management_maturity",
+        "communication_effectiveness", "workforce_adaptability", "technical_readiness"
+    )) if scores else {}
+    budget_tracking = {}
+    project_forecasting = {}
+    
+    if scores:
+        # Generate supporting data
+        overall_score = scores.overall_score
+        assessment_type = scores.assessment_type
+        implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
+        budget_tracking = generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
         
-        risk_monitoring = {
-            "project_id": project_id,
-            "project_name": project.get("project_name", ""),
-            "current_status": {
-                "overall_progress": round(overall_progress, 1),
-                "current_week": current_week,
-                "budget_utilization": round(budget_utilization, 1),
-                "health_status": project.get("health_status", "green")
-            },
-            "risk_alerts": risk_alerts,
-            "trend_analysis": {
-                "budget_trend": "On Track" if budget_utilization <= overall_progress else "Over Budget",
-                "schedule_trend": "On Track" if overall_progress >= (current_week * 10) else "Behind Schedule",
-                "scope_trend": "Stable" if len(risk_alerts) == 0 else "At Risk"
-            },
-            "predictive_insights": {
-                "completion_probability": min(95, max(30, 100 - len(risk_alerts) * 20)),
-                "budget_overrun_risk": "Low" if budget_utilization < 80 else "High",
-                "timeline_risk": "Low" if overall_progress >= (current_week * 8) else "High"
-            },
-            "recommendations": generate_real_time_recommendations(risk_alerts, overall_progress, budget_utilization),
-            "generated_at": datetime.utcnow()
+        predictive_analytics = {
+            "project_outlook": {
+                "success_probability": min(95, max(15, overall_score * 18))
+            }
         }
         
-        return risk_monitoring
-        
+        project_forecasting = generate_advanced_project_forecasting(project, assessment_data, predictive_analytics, budget_tracking)
+    
+    return generate_stakeholder_communications(project, budget_tracking, project_forecasting, assessment_data)
+
+def build_manufacturing_excellence_tracking(project: dict, scores: Optional[AssessmentScores]) -> dict:
+    """Manufacturing excellence correlation tracking"""
+    assessment_data = scores.subset((
+        "maintenance_operations_alignment", "technical_readiness", "workforce_adaptability",
+        "safety_compliance", "shift_work_considerations"
+    )) if scores else {}
+    
+    # Calculate manufacturing excellence metrics
+    maintenance_excellence_score = assessment_data.get("maintenance_operations_alignment", 3.0)
+    operational_efficiency_potential = (
+        assessment_data.get("technical_readiness", 3.0) +
+        assessment_data.get("workforce_adaptability", 3.0) +
+        assessment_data.get("safety_compliance", 3.0)
+    ) / 3
+    
+    # Manufacturing performance predictions
+    performance_improvements = {
+        "unplanned_downtime_reduction": min(60, max(10, maintenance_excellence_score * 12)),
+        "overall_equipment_effectiveness": min(35, max(5, maintenance_excellence_score * 7)),
+        "maintenance_cost_reduction": min(30, max(5, maintenance_excellence_score * 6)),
+        "safety_performance_improvement": min(25, max(5, assessment_data.get("safety_compliance", 3.0) * 5)),
+        "operational_efficiency_gain": min(40, max(5, operational_efficiency_potential * 8))
+    }
+    
+    # ROI calculations
+    estimated_annual_savings = sum(performance_improvements.values()) * 1000  # Simplified calculation
+    implementation_cost = project.get("total_budget", 90000)
+    roi_percentage = ((estimated_annual_savings - implementation_cost) / implementation_cost * 100) if implementation_cost > 0 else 0
+    
+    return {
+        "project_id": project["id"],
+        "project_name": project.get("project_name", ""),
+        "maintenance_excellence": {
+            "current_score": round(maintenance_excellence_score, 1),
+            "potential_score": min(5.0, maintenance_excellence_score + 1.5),
+            "improvement_pathway": generate_excellence_pathway(maintenance_excellence_score, operational_efficiency_potential * 20),
+            "critical_success_factors": [
+                "Maintenance-operations alignment",
+                "Technical readiness and adoption",
+                "Workforce adaptability and training",
+                "Safety and compliance integration"
+            ]
+        },
+        "performance_predictions": {
+            "unplanned_downtime_reduction": f"{performance_improvements['unplanned_downtime_reduction']:.1f}%",
+            "oee_improvement": f"{performance_improvements['overall_equipment_effectiveness']:.1f}%",
+            "maintenance_cost_reduction": f"{performance_improvements['maintenance_cost_reduction']:.1f}%",
+            "safety_improvement": f"{performance_improvements['safety_performance_improvement']:.1f}%",
+            "operational_efficiency": f"{performance_improvements['operational_efficiency_gain']:.1f}%"
+        },
+        "roi_analysis": {
+            "estimated_annual_savings": round(estimated_annual_savings, 0),
+            "implementation_investment": implementation_cost,
+            "roi_percentage": round(roi_percentage, 1),
+            "payback_period_months": max(6, min(36, 12 / (roi_percentage / 100))) if roi_percentage > 0 else 36,
+            "business_case_strength": "Strong" if roi_percentage > 50 else "Moderate" if roi_percentage > 20 else "Developing"
+        },
+        "correlation_metrics": {
+            "maintenance_operations_correlation": round(assessment_data.get("maintenance_operations_alignment", 3.0) / 5.0, 2),
+            "technology_adoption_correlation": round(assessment_data.get("technical_readiness", 3.0) / 5.0, 2),
+            "workforce_readiness_correlation": round(assessment_data.get("workforce_adaptability", 3.0) / 5.0, 2)
+        },
+        "manufacturing_kpis": {
+            "equipment_reliability": f"{60 + maintenance_excellence_score * 8:.1f}%",
+            "planned_maintenance_ratio": f"{40 + maintenance_excellence_score * 12:.1f}%",
+            "mean_time_to_repair": f"{24 - maintenance_excellence_score * 4:.1f} hours",
+            "maintenance_productivity": f"{70 + operational_efficiency_potential * 6:.1f}%"
+        },
+        "generated_at": datetime.utcnow()
+    }
+
+# ====================================================================================
+# PROJECT ANALYTICS SNAPSHOTS - NIGHTLY PRECOMPUTE WITH ON-DEMAND REFRESH
+# ====================================================================================
+
+# Snapshot name -> builder(project, scores); builders are pure so they can run in worker processes
+PROJECT_ANALYTICS_BUILDERS = {
+    "risk_monitoring": build_risk_monitoring,
+    "detailed_budget_tracking": build_detailed_budget_tracking,
+    "advanced_forecasting": build_advanced_forecasting,
+    "stakeholder_communications": build_stakeholder_communications,
+    "manufacturing_excellence_tracking": build_manufacturing_excellence_tracking,
+}
+
+ANALYTICS_SWEEP_CHUNK_SIZE = int(os.getenv("ANALYTICS_SWEEP_CHUNK_SIZE", "200"))
+# Worker processes for the nightly sweep; 0 computes in the default thread pool instead
+ANALYTICS_WORKERS = int(os.getenv("ANALYTICS_WORKERS", "2"))
+ANALYTICS_SCHEDULER_ENABLED = os.getenv("ANALYTICS_SCHEDULER_ENABLED", "true").lower() in ("1", "true", "yes")
+ANALYTICS_SWEEP_HOUR_UTC = int(os.getenv("ANALYTICS_SWEEP_HOUR_UTC", "2"))
+ANALYTICS_SWEEP_LEASE_SECONDS = int(os.getenv("ANALYTICS_SWEEP_LEASE_SECONDS", "3600"))
+
+# Identifies this process as a job lease holder
+JOB_OWNER_ID = uuid.uuid4().hex
+
+def analytics_project_projection() -> dict:
+    return {**risk_stream_projection(), "user_id": 1, "assessment_id": 1, "updated_at": 1}
+
+def alert_evaluation(risk_alerts: List[dict]) -> Dict[str, Optional[dict]]:
+    """Rebuild a rule evaluation from the alerts a risk snapshot reports as firing"""
+    evaluation = {key: None for key in risk_rules.rules}
+    evaluation.update((alert["key"], alert) for alert in risk_alerts)
+    return evaluation
+
+def compute_analytics_batch(pairs: List[tuple]) -> List[dict]:
+    """Every snapshot for each (project, scores) pair; the unit of work sent to a worker"""
+    return [
+        {name: builder(project, scores) for name, builder in PROJECT_ANALYTICS_BUILDERS.items()}
+        for project, scores in pairs
+    ]
+
+async def load_project_assessments(projects: List[dict]) -> Dict[str, AssessmentScores]:
+    """Linked assessment scores for a batch of projects with one $in query, keyed by project id"""
+    assessment_ids = list({project["assessment_id"] for project in projects if project.get("assessment_id")})
+    if not assessment_ids:
+        return {}
+    assessments = {
+        assessment["id"]: assessment
+        async for assessment in db.assessments.find({"id": {"$in": assessment_ids}}, ANALYTICS_ASSESSMENT_PROJECTION)
+    }
+    linked = {}
+    for project in projects:
+        assessment = assessments.get(project.get("assessment_id"))
+        # Same ownership rule as the per-request endpoints
+        if assessment and assessment.get("user_id") == project.get("user_id"):
+            linked[project["id"]] = cached_assessment_scores(assessment)
+    return linked
+
+async def save_analytics_snapshots(projects: List[dict], results: List[dict], computed_at: datetime):
+    operations = []
+    evaluations = {}
+    for project, analytics in zip(projects, results):
+        operations.append(UpdateOne(
+            {"project_id": project["id"]},
+            {"$set": {
+                "user_id": project.get("user_id"),
+                **{f"analytics.{name}": snapshot for name, snapshot in analytics.items()},
+                **{f"computed_at.{name}": computed_at for name in analytics},
+            }},
+            upsert=True
+        ))
+        if "risk_monitoring" in analytics:
+            evaluations[project["id"]] = alert_evaluation(analytics["risk_monitoring"]["risk_alerts"])
+    if operations:
+        await db.project_analytics.bulk_write(operations, ordered=False)
+    return await record_alert_transitions(evaluations)
+
+async def sweep_project_analytics(chunk_size: int = ANALYTICS_SWEEP_CHUNK_SIZE, workers: int = ANALYTICS_WORKERS) -> dict:
+    """Precompute every analytics snapshot for all active projects.
+
+    Projects are read in chunks; each chunk's assessments come from one $in
+    query, the builders run across the worker pool, and results are written
+    with one bulk upsert per chunk.
+    """
+    start = time.perf_counter()
+    summary = {"projects": 0, "alerts_raised": 0, "alerts_cleared": 0}
+    loop = asyncio.get_running_loop()
+    executor = None
+    if workers > 0:
+        # spawn, not fork: the parent has the event loop, Mongo and logging threads running
+        executor = concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+    
+    async def process_chunk(projects: List[dict]):
+        assessments = await load_project_assessments(projects)
+        pairs = [(project, assessments.get(project["id"])) for project in projects]
+        parts = max(1, workers)
+        slices = [pairs[index::parts] for index in range(parts) if pairs[index::parts]]
+        computed = await asyncio.gather(*(loop.run_in_executor(executor, compute_analytics_batch, part) for part in slices))
+        ordered_projects = [project for part in slices for project, _ in part]
+        results = [analytics for part in computed for analytics in part]
+        transitions = await save_analytics_snapshots(ordered_projects, results, datetime.utcnow())
+        summary["projects"] += len(projects)
+        for project_transitions in transitions.values():
+            summary["alerts_raised"] += len(project_transitions.get("raised", []))
+            summary["alerts_cleared"] += len(project_transitions.get("cleared", []))
+    
+    try:
+        chunk = []
+        async for project in db.projects.find(ACTIVE_PROJECTS_FILTER, analytics_project_projection()).batch_size(chunk_size):
+            chunk.append(project)
+            if len(chunk) >= chunk_size:
+                await process_chunk(chunk)
+                chunk = []
+        if chunk:
+            await process_chunk(chunk)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    summary["duration_seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+async def serve_project_analytics(name: str, project_id: str, user: User, fresh: bool) -> dict:
+    """Stored snapshot unless fresh=true or the project changed since it was computed"""
+    project, scores = await load_project_with_scores(
+        project_id, user.id, analytics_project_projection(), snapshot=None if fresh else name
+    )
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    
+    stored = project.pop("stored_snapshot", None) or []
+    if stored:
+        snapshot = stored[0].get("snapshot")
+        computed_at = stored[0].get("computed_at")
+        updated_at = project.get("updated_at")
+        if snapshot is not None and (updated_at is None or (computed_at and computed_at >= updated_at)):
+            return snapshot
+    
+    snapshot = PROJECT_ANALYTICS_BUILDERS[name](project, scores)
+    await save_analytics_snapshots([project], [{name: snapshot}], datetime.utcnow())
+    return snapshot
+
+async def acquire_job_lease(name: str, ttl_seconds: int) -> bool:
+    """Take a named lease in scheduled_jobs so only one process runs a job at a time"""
+    now = datetime.utcnow()
+    try:
+        await db.scheduled_jobs.update_one(
+            {"_id": name, "$or": [{"locked_until": None}, {"locked_until": {"$lte": now}}]},
+            {"$set": {"locked_until": now + timedelta(seconds=ttl_seconds), "locked_by": JOB_OWNER_ID, "last_started_at": now}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # The job document exists and its lease has not expired
+        return False
+    return True
+
+async def release_job_lease(name: str, summary: dict):
+    now = datetime.utcnow()
+    await db.scheduled_jobs.update_one(
+        {"_id": name, "locked_by": JOB_OWNER_ID},
+        {"$set": {"locked_until": now, "last_finished_at": now, "last_summary": summary}}
+    )
+
+async def run_analytics_sweep_job() -> dict:
+    summary = {}
+    try:
+        summary = await sweep_project_analytics()
+        logger.info("Analytics sweep finished: %s", summary)
+    except Exception as e:
+        logger.exception("Analytics Sweep Error: %s", e)
+        summary = {"error": str(e)}
+    finally:
+        await release_job_lease("analytics_sweep", summary)
+    return summary
+
+def seconds_until_hour(now: datetime, hour: int) -> float:
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+# Strong references to scheduler and manually started job tasks
+background_jobs: set = set()
+
+def start_background_job(coroutine) -> asyncio.Task:
+    task = asyncio.create_task(coroutine)
+    background_jobs.add(task)
+    task.add_done_callback(background_jobs.discard)
+    return task
+
+async def nightly_analytics_loop():
+    while True:
+        await asyncio.sleep(seconds_until_hour(datetime.utcnow(), ANALYTICS_SWEEP_HOUR_UTC))
+        if await acquire_job_lease("analytics_sweep", ANALYTICS_SWEEP_LEASE_SECONDS):
+            await run_analytics_sweep_job()
+
+@app.on_event("startup")
+async def start_analytics_scheduler():
+    if ANALYTICS_SCHEDULER_ENABLED:
+        start_background_job(nightly_analytics_loop())
+
+@app.on_event("shutdown")
+async def stop_background_jobs():
+    for task in list(background_jobs):
+        task.cancel()
+
+@app.post("/api/admin/analytics/sweep", status_code=202)
+async def start_analytics_sweep(admin_user: User = Depends(get_admin_user)):
+    """Run the nightly analytics sweep now, in the background"""
+    if not await acquire_job_lease("analytics_sweep", ANALYTICS_SWEEP_LEASE_SECONDS):
+        raise HTTPException(status_code=409, detail="Analytics sweep already running")
+    start_background_job(run_analytics_sweep_job())
+    return {"message": "Analytics sweep started"}
+
+@app.get("/api/admin/analytics/sweep")
+async def get_analytics_sweep_status(admin_user: User = Depends(get_admin_user)):
+    """Last analytics sweep run, and whether one is running now"""
+    try:
+        now = datetime.utcnow()
+        job = await db.scheduled_jobs.find_one({"_id": "analytics_sweep"}) or {}
+        job.pop("_id", None)
+        locked_until = job.get("locked_until")
+        job["running"] = bool(locked_until and locked_until > now)
+        job["next_scheduled_run"] = (
+            now + timedelta(seconds=seconds_until_hour(now, ANALYTICS_SWEEP_HOUR_UTC))
+            if ANALYTICS_SCHEDULER_ENABLED else None
+        )
+        return job
     except Exception as e:
-        print(f"Risk Monitoring Generation Error: {str(e)}")
+        logger.exception("Analytics Sweep Status Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get analytics sweep status: {str(e)}")
+
+@app.post("/api/projects/{project_id}/risk-monitoring")
+async def generate_real_time_risk_monitoring(
+    project_id: str,
+    fresh: bool = False,
+    current_user: User = Depends(get_current_user)
+):
+    """Generate real-time risk monitoring dashboard for active projects"""
+    try:
+        return await serve_project_analytics("risk_monitoring", project_id, current_user, fresh)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Risk Monitoring Generation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate risk monitoring: {str(e)}")
 
 @app.post("/api/projects/{project_id}/detailed-budget-tracking")
 async def generate_detailed_budget_tracking_endpoint(
     project_id: str,
+    fresh: bool = False,
     current_user: User = Depends(get_current_user)
 ):
     """Generate detailed task-level and phase-level budget tracking"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment and implementation plan
-        assessment_id = project.get("assessment_id")
-        assessment_data = {}
-        implementation_plan = {}
-        
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-                    "stakeholder_engagement": assessment.get("stakeholder_engagement", {}).get("score", 3)
-                }
-                
-                # Generate implementation plan for budget tracking
-                overall_score = assessment.get("overall_score", 3.0)
-                assessment_type = assessment.get("assessment_type", "general_readiness")
-                implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
-        
-        # Generate detailed budget tracking
-        budget_tracking = generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
-        
-        return budget_tracking
-        
+        return await serve_project_analytics("detailed_budget_tracking", project_id, current_user, fresh)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Detailed Budget Tracking Error: {str(e)}")
+        logger.exception("Detailed Budget Tracking Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate detailed budget tracking: {str(e)}")
 
 @app.post("/api/projects/{project_id}/advanced-forecasting")
 async def generate_advanced_project_forecasting_endpoint(
     project_id: str,
+    fresh: bool = False,
     current_user: User = Depends(get_current_user)
 ):
     """Generate advanced project outcome forecasting"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment and analytics
-        assessment_id = project.get("assessment_id")
-        assessment_data = {}
-        predictive_analytics = {}
-        budget_tracking = {}
-        
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "overall_score": assessment.get("overall_score", 3.0),
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-                    "stakeholder_engagement": assessment.get("stakeholder_engagement", {}).get("score", 3),
-                    "maintenance_operations_alignment": assessment.get("maintenance_operations_alignment", {}).get("score", 3)
-                }
-                
-                # Generate predictive analytics for forecasting
-                assessment_type = assessment.get("assessment_type", "general_readiness")
-                overall_score = assessment.get("overall_score", 3.0)
-                
-                # Simulate predictive analytics data
-                predictive_analytics = {
-                    "project_outlook": {
-                        "success_probability": min(95, max(15, overall_score * 18))
-                    }
-                }
-                
-                # Simulate budget tracking data
-                implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
-                budget_tracking = generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
-        
-        # Generate advanced forecasting
-        forecasting = generate_advanced_project_forecasting(project, assessment_data, predictive_analytics, budget_tracking)
-        
-        return forecasting
-        
+        return await serve_project_analytics("advanced_forecasting", project_id, current_user, fresh)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Advanced Forecasting Error: {str(e)}")
+        logger.exception("Advanced Forecasting Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate advanced forecasting: {str(e)}")
 
 @app.post("/api/projects/{project_id}/stakeholder-communications")
 async def generate_stakeholder_communications_endpoint(
     project_id: str,
+    fresh: bool = False,
     current_user: User = Depends(get_current_user)
 ):
     """Generate automated stakeholder communication content"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment
-        assessment_id = project.get("assessment_id")
-        assessment_data = {}
-        budget_tracking = {}
-        project_forecasting = {}
-        
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3)
-                }
-                
-                # Generate supporting data
-                overall_score = assessment.get("overall_score", 3.0)
-                assessment_type = assessment.get("assessment_type", "general_readiness")
-                implementation_plan = generate_week_by_week_plan(assessment_data, assessment_type, overall_score)
-                budget_tracking = generate_detailed_budget_tracking(project, assessment_data, implementation_plan)
-                
-                predictive_analytics = {
-                    "project_outlook": {
-                        "success_probability": min(95, max(15, overall_score * 18))
-                    }
-                }
-                
-                project_forecasting = generate_advanced_project_forecasting(project, assessment_data, predictive_analytics, budget_tracking)
-        
-        # Generate stakeholder communications
-        communications = generate_stakeholder_communications(project, budget_tracking, project_forecasting, assessment_data)
-        
-        return communications
-        
+        return await serve_project_analytics("stakeholder_communications", project_id, current_user, fresh)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Stakeholder Communications Error: {str(e)}")
+        logger.exception("Stakeholder Communications Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate stakeholder communications: {str(e)}")
 
 @app.post("/api/projects/{project_id}/manufacturing-excellence-tracking")
 async def generate_manufacturing_excellence_tracking(
     project_id: str,
+    fresh: bool = False,
     current_user: User = Depends(get_current_user)
 ):
     """Generate manufacturing excellence correlation tracking"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        if not project:
-            raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment
-        assessment_id = project.get("assessment_id")
-        assessment_data = {}
-        
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "maintenance_operations_alignment": assessment.get("maintenance_operations_alignment", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "safety_compliance": assessment.get("safety_compliance", {}).get("score", 3),
-                    "shift_work_considerations": assessment.get("shift_work_considerations", {}).get("score", 3)
-                }
-        
-        # Calculate manufacturing excellence metrics
-        maintenance_excellence_score = assessment_data.get("maintenance_operations_alignment", 3.0)
-        operational_efficiency_potential = (
-            assessment_data.get("technical_readiness", 3.0) +
-            assessment_data.get("workforce_adaptability", 3.0) +
-            assessment_data.get("safety_compliance", 3.0)
-        ) / 3
-        
-        # Manufacturing performance predictions
-        performance_improvements = {
-            "unplanned_downtime_reduction": min(60, max(10, maintenance_excellence_score * 12)),
-            "overall_equipment_effectiveness": min(35, max(5, maintenance_excellence_score * 7)),
-            "maintenance_cost_reduction": min(30, max(5, maintenance_excellence_score * 6)),
-            "safety_performance_improvement": min(25, max(5, assessment_data.get("safety_compliance", 3.0) * 5)),
-            "operational_efficiency_gain": min(40, max(5, operational_efficiency_potential * 8))
-        }
-        
-        # ROI calculations
-        estimated_annual_savings = sum(performance_improvements.values()) * 1000  # Simplified calculation
-        implementation_cost = project.get("total_budget", 90000)
-        roi_percentage = ((estimated_annual_savings - implementation_cost) / implementation_cost * 100) if implementation_cost > 0 else 0
-        
-        excellence_tracking = {
-            "project_id": project_id,
-            "project_name": project.get("project_name", ""),
-            "maintenance_excellence": {
-                "current_score": round(maintenance_excellence_score, 1),
-                "potential_score": min(5.0, maintenance_excellence_score + 1.5),
-                "improvement_pathway": generate_excellence_pathway(maintenance_excellence_score, operational_efficiency_potential * 20),
-                "critical_success_factors": [
-                    "Maintenance-operations alignment",
-                    "Technical readiness and adoption",
-                    "Workforce adaptability and training",
-                    "Safety and compliance integration"
-                ]
-            },
-            "performance_predictions": {
-                "unplanned_downtime_reduction": f"{performance_improvements['unplanned_downtime_reduction']:.1f}%",
-                "oee_improvement": f"{performance_improvements['overall_equipment_effectiveness']:.1f}%",
-                "maintenance_cost_reduction": f"{performance_improvements['maintenance_cost_reduction']:.1f}%",
-                "safety_improvement": f"{performance_improvements['safety_performance_improvement']:.1f}%",
-                "operational_efficiency": f"{performance_improvements['operational_efficiency_gain']:.1f}%"
-            },
-            "roi_analysis": {
-                "estimated_annual_savings": round(estimated_annual_savings, 0),
-                "implementation_investment": implementation_cost,
-                "roi_percentage": round(roi_percentage, 1),
-                "payback_period_months": max(6, min(36, 12 / (roi_percentage / 100))) if roi_percentage > 0 else 36,
-                "business_case_strength": "Strong" if roi_percentage > 50 else "Moderate" if roi_percentage > 20 else "Developing"
-            },
-            "correlation_metrics": {
-                "maintenance_operations_correlation": round(assessment_data.get("maintenance_operations_alignment", 3.0) / 5.0, 2),
-                "technology_adoption_correlation": round(assessment_data.get("technical_readiness", 3.0) / 5.0, 2),
-                "workforce_readiness_correlation": round(assessment_data.get("workforce_adaptability", 3.0) / 5.0, 2)
-            },
-            "manufacturing_kpis": {
-                "equipment_reliability": f"{60 + maintenance_excellence_score * 8:.1f}%",
-                "planned_maintenance_ratio": f"{40 + maintenance_excellence_score * 12:.1f}%",
-                "mean_time_to_repair": f"{24 - maintenance_excellence_score * 4:.1f} hours",
-                "maintenance_productivity": f"{70 + operational_efficiency_potential * 6:.1f}%"
-            },
-            "generated_at": datetime.utcnow()
-        }
-        
-        return excellence_tracking
-        
+        return await serve_project_analytics("manufacturing_excellence_tracking", project_id, current_user, fresh)
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Manufacturing Excellence Tracking Error: {str(e)}")
+        logger.exception("Manufacturing Excellence Tracking Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate manufacturing excellence tracking: {str(e)}")
 
 @app.post("/api/projects/{project_id}/phases/{phase_name}/intelligence")
@@ -5051,27 +8373,11 @@ async def generate_phase_intelligence(
 ):
     """Generate phase-based intelligence and recommendations"""
     try:
-        # Get project data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
+        # Get project data with its assessment scores
+        project, scores = await load_project_with_scores(project_id, current_user.id)
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        
-        # Get associated assessment data
-        assessment_data = {}
-        assessment_id = project.get("assessment_id")
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "overall_score": assessment.get("overall_score", 3.0),
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-                    "stakeholder_engagement": assessment.get("stakeholder_engagement", {}).get("score", 3)
-                }
+        assessment_data = scores.subset(PHASE_ANALYSIS_DIMENSIONS, with_overall=True) if scores else {}
         
         # Get completed phases for lessons learned
         completed_phases = []
@@ -5085,8 +8391,10 @@ async def generate_phase_intelligence(
         
         return phase_intelligence
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Phase Intelligence Error: {str(e)}")
+        logger.exception("Phase Intelligence Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to generate phase intelligence: {str(e)}")
 
 @app.put("/api/projects/{project_id}/phases/{phase_name}/progress")
@@ -5152,12 +8460,12 @@ async def update_phase_progress(
         
         # Get updated project
         updated_project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        updated_project["_id"] = str(updated_project["_id"])
+        await attach_work_items([updated_project])
         
         return updated_project
         
     except Exception as e:
-        print(f"Phase Progress Update Error: {str(e)}")
+        logger.exception("Phase Progress Update Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to update phase progress: {str(e)}")
 
 @app.post("/api/projects/{project_id}/phases/{phase_name}/complete")
@@ -5173,23 +8481,10 @@ async def complete_phase_with_analysis(
         await update_phase_progress(project_id, phase_name, completion_data, current_user)
         
         # Get updated project and assessment data
-        project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        assessment_data = {}
-        
-        assessment_id = project.get("assessment_id")
-        if assessment_id:
-            assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
-            if assessment:
-                assessment_data = {
-                    "overall_score": assessment.get("overall_score", 3.0),
-                    "leadership_support": assessment.get("leadership_support", {}).get("score", 3),
-                    "resource_availability": assessment.get("resource_availability", {}).get("score", 3),
-                    "change_management_maturity": assessment.get("change_management_maturity", {}).get("score", 3),
-                    "communication_effectiveness": assessment.get("communication_effectiveness", {}).get("score", 3),
-                    "workforce_adaptability": assessment.get("workforce_adaptability", {}).get("score", 3),
-                    "technical_readiness": assessment.get("technical_readiness", {}).get("score", 3),
-                    "stakeholder_engagement": assessment.get("stakeholder_engagement", {}).get("score", 3)
-                }
+        project, scores = await load_project_with_scores(project_id, current_user.id)
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+        assessment_data = scores.subset(PHASE_ANALYSIS_DIMENSIONS, with_overall=True) if scores else {}
         
         # Find the completed phase data
         completed_phase_data = None
@@ -5226,8 +8521,10 @@ async def complete_phase_with_analysis(
             "generated_at": datetime.utcnow()
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"Phase Completion Analysis Error: {str(e)}")
+        logger.exception("Phase Completion Analysis Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to complete phase with analysis: {str(e)}")
 
 @app.get("/api/projects/{project_id}/workflow-status")
@@ -5297,7 +8594,7 @@ async def get_project_workflow_status(
         }
         
     except Exception as e:
-        print(f"Workflow Status Error: {str(e)}")
+        logger.exception("Workflow Status Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to get workflow status: {str(e)}")
 
 def generate_recommended_actions(task_predictions: List[dict], budget_risk: dict, scope_creep_risk: dict) -> List[str]:
@@ -5370,12 +8667,12 @@ async def update_project(
         
         # Get updated project
         updated_project = await db.projects.find_one({"id": project_id, "user_id": current_user.id})
-        updated_project["_id"] = str(updated_project["_id"])
+        await attach_work_items([updated_project])
         
         return updated_project
         
     except Exception as e:
-        print(f"Update Project Error: {str(e)}")
+        logger.exception("Update Project Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to update project: {str(e)}")
 
 @app.post("/api/bootstrap/make-admin")
@@ -5397,7 +8694,7 @@ async def bootstrap_make_admin(
             target_email = current_user.email  # Default to current user
         
         # Update the user to be admin
-        result = await db.users.update_one(
+        promoted = await db.users.find_one_and_update(
             {"email": target_email},
             {
                 "$set": {
@@ -5408,11 +8705,13 @@ async def bootstrap_make_admin(
                     "approved_at": datetime.utcnow(),
                     "approved_by": "bootstrap"
                 }
-            }
+            },
+            projection={"id": 1}
         )
         
-        if result.matched_count == 0:
+        if promoted is None:
             raise HTTPException(status_code=404, detail="User not found")
+        await cache.invalidate(f"user:{promoted['id']}")
         
         # Log the admin promotion
         await log_user_activity(
@@ -5430,7 +8729,7 @@ async def bootstrap_make_admin(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Bootstrap Admin Error: {str(e)}")
+        logger.exception("Bootstrap Admin Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to promote user: {str(e)}")
 
 @app.delete("/api/projects/{project_id}")
@@ -5458,7 +8757,10 @@ async def delete_project(
         if delete_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Project not found or could not be deleted")
         
-        # Also delete related data (phases, activities, etc.)
+        # Also delete related data (phases, activities, work items, etc.)
+        await delete_project_work_items([project_id])
+        await db.project_alert_states.delete_many({"project_id": project_id})
+        await db.project_analytics.delete_many({"project_id": project_id})
         await db.project_phases.delete_many({"project_id": project_id})
         await db.project_activities.delete_many({"project_id": project_id})
         await db.project_assignments.delete_many({"project_id": project_id})
@@ -5472,45 +8774,31 @@ async def delete_project(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"Delete Project Error: {str(e)}")
+        logger.exception("Delete Project Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to delete project: {str(e)}")
 
 # Assessment routes - Enhanced for Manufacturing EAM
 @app.post("/api/assessments")
 async def create_enhanced_assessment(
     assessment_data: dict,
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    idempotency_key: Optional[str] = Header(None)
 ):
+    """Create a manufacturing EAM assessment; retries with the same Idempotency-Key replay the first result"""
+    return await run_idempotent(
+        current_user.id, "assessments.create_enhanced", idempotency_key, assessment_data,
+        lambda: insert_enhanced_assessment(assessment_data, current_user)
+    )
+
+async def insert_enhanced_assessment(assessment_data: dict, current_user: User) -> dict:
     try:
         # Generate ID and timestamps
         assessment_id = str(uuid.uuid4())
         now = datetime.utcnow()
         
         # Calculate overall score from all dimensions
-        all_scores = []
-        dimension_scores = {}
-        
-        # Core dimensions
-        core_dimensions = [
-            'leadership_commitment', 'organizational_culture', 'resource_availability',
-            'stakeholder_engagement', 'training_capability'
-        ]
-        
-        # Manufacturing-specific dimensions  
-        manufacturing_dimensions = [
-            'manufacturing_constraints', 'maintenance_operations_alignment', 
-            'shift_work_considerations', 'technical_readiness', 'safety_compliance'
-        ]
-        
-        all_dimensions = core_dimensions + manufacturing_dimensions
-        
-        for dim in all_dimensions:
-            if dim in assessment_data and 'score' in assessment_data[dim]:
-                score = assessment_data[dim]['score']
-                all_scores.append(score)
-                dimension_scores[dim] = score
-        
-        overall_score = sum(all_scores) / len(all_scores) if all_scores else 0
+        dimension_scores = ScoreVector.from_assessment(assessment_data, MANUFACTURING_EAM_DIMENSIONS)
+        overall_score = dimension_scores.mean()
         
         # Determine readiness level
         if overall_score >= 4.5:
@@ -5525,7 +8813,7 @@ async def create_enhanced_assessment(
             readiness_level = "Critical"
         
         # Calculate manufacturing readiness analysis
-        manufacturing_analysis = calculate_manufacturing_readiness_analysis(assessment_data)
+        manufacturing_analysis = calculate_manufacturing_readiness_analysis(dimension_scores)
         
         # Quick manufacturing-focused AI analysis
         ai_analysis = f"""# Manufacturing EAM Implementation Readiness Analysis
@@ -5620,13 +8908,13 @@ This assessment provides the foundation for your DigitalThinker Manufacturing EA
         }
         
         # Save to database
-        result = await db.assessments.insert_one(assessment_doc)
-        assessment_doc["_id"] = str(result.inserted_id)
+        await db.assessments.insert_one(assessment_doc)
+        await cache.invalidate(f"org:{current_user.organization}")
         
         return assessment_doc
         
     except Exception as e:
-        print(f"Enhanced Assessment Creation Error: {str(e)}")
+        logger.exception("Enhanced Assessment Creation Error: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to create assessment: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Assessment creation failed: {str(e)}")
@@ -5634,11 +8922,7 @@ This assessment provides the foundation for your DigitalThinker Manufacturing EA
 @app.get("/api/assessments")
 async def get_assessments(current_user: User = Depends(get_current_user)):
     try:
-        assessments = await db.assessments.find({"user_id": current_user.id}).to_list(100)
-        # Convert ObjectId to string and remove _id field
-        for assessment in assessments:
-            if "_id" in assessment:
-                del assessment["_id"]
+        assessments = await db.assessments.find({"user_id": current_user.id}, {"_id": 0}).to_list(100)
         return assessments
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to retrieve assessments: {str(e)}")
@@ -5646,11 +8930,9 @@ async def get_assessments(current_user: User = Depends(get_current_user)):
 @app.get("/api/assessments/{assessment_id}")
 async def get_assessment(assessment_id: str, current_user: User = Depends(get_current_user)):
     try:
-        assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id})
+        assessment = await db.assessments.find_one({"id": assessment_id, "user_id": current_user.id}, {"_id": 0})
         if not assessment:
             raise HTTPException(status_code=404, detail="Assessment not found")
-        if "_id" in assessment:
-            del assessment["_id"]
         return assessment
     except HTTPException:
         raise
@@ -5702,8 +8984,7 @@ async def create_project(project: Project, current_user: User = Depends(get_curr
         project.phase_progress["identify"] = calculate_phase_progress(project.dict(), "identify")
         
         # Save to database
-        project_dict = project.dict()
-        await db.projects.insert_one(project_dict)
+        await insert_project_document(project.dict())
         
         return project
     except Exception as e:
@@ -5772,8 +9053,7 @@ async def create_project_from_assessment(
             project.phase_progress[phase_name] = calculate_phase_progress(project.dict(), phase_name)
         
         # Save to database
-        project_dict = project.dict()
-        await db.projects.insert_one(project_dict)
+        await insert_project_document(project.dict())
         
         return project
     except Exception as e:
@@ -5782,23 +9062,18 @@ async def create_project_from_assessment(
 @app.get("/api/projects")
 async def get_projects(current_user: User = Depends(get_current_user)):
     try:
-        projects = await db.projects.find({"organization": current_user.organization}).to_list(100)
-        # Convert ObjectId to string and remove _id field
-        for project in projects:
-            if "_id" in project:
-                del project["_id"]
-        return projects
+        projects = await db.projects.find({"organization": current_user.organization}, {"_id": 0}).to_list(100)
+        return await attach_work_items(projects)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to retrieve projects: {str(e)}")
 
 @app.get("/api/projects/{project_id}")
 async def get_project(project_id: str, current_user: User = Depends(get_current_user)):
     try:
-        project = await db.projects.find_one({"id": project_id, "organization": current_user.organization})
+        project = await db.projects.find_one({"id": project_id, "organization": current_user.organization}, {"_id": 0})
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
-        if "_id" in project:
-            del project["_id"]
+        await attach_work_items([project])
         return project
     except HTTPException:
         raise
@@ -5825,7 +9100,8 @@ async def transition_project_phase(
             raise HTTPException(status_code=400, detail="Invalid phase transition - phases must be completed sequentially")
         
         # Check if current phase is ready for transition (optional validation)
-        current_phase_progress = calculate_phase_progress(project, transition.from_phase)
+        _, phase_progress = await compute_project_progress(project)
+        current_phase_progress = phase_progress.get(transition.from_phase, 0.0)
         if current_phase_progress < 80:  # Require 80% completion before transition
             raise HTTPException(status_code=400, detail=f"Current phase is only {current_phase_progress:.1f}% complete. Minimum 80% required for transition.")
         
@@ -5841,20 +9117,18 @@ async def transition_project_phase(
         )
         
         # Generate tasks and deliverables for new phase if not already exists
-        existing_phase_tasks = [task for task in project.get("tasks", []) if task.get("phase") == transition.to_phase]
-        if not existing_phase_tasks:
+        if uses_work_item_collections(project):
+            has_phase_tasks = await db[WORK_ITEM_COLLECTIONS["tasks"]].count_documents(
+                {"project_id": project_id, "phase": transition.to_phase}, limit=1
+            ) > 0
+        else:
+            has_phase_tasks = any(task.get("phase") == transition.to_phase for task in project.get("tasks", []))
+        if not has_phase_tasks:
             new_tasks = generate_comprehensive_tasks_for_phase(transition.to_phase, project_id)
             new_deliverables = generate_deliverables_for_phase(transition.to_phase, project_id)
             
-            await db.projects.update_one(
-                {"id": project_id},
-                {
-                    "$push": {
-                        "tasks": {"$each": [Task(**task).dict() for task in new_tasks]},
-                        "deliverables": {"$each": [Deliverable(**deliv).dict() for deliv in new_deliverables]}
-                    }
-                }
-            )
+            await append_work_items(project, "tasks", [Task(**task).dict() for task in new_tasks])
+            await append_work_items(project, "deliverables", [Deliverable(**deliv).dict() for deliv in new_deliverables])
         
         # Log phase transition
         transition_log = {
@@ -5885,39 +9159,15 @@ async def update_task(
 ):
     try:
         # Update task in project
-        update_data = {
-            "tasks.$.status": task_update.get("status"),
-            "tasks.$.assigned_to": task_update.get("assigned_to"),
-            "tasks.$.notes": task_update.get("notes"),
-            "tasks.$.priority": task_update.get("priority"),
-            "updated_at": datetime.utcnow()
-        }
+        update_data = {field: task_update.get(field) for field in TASK_UPDATE_FIELDS}
         
         if task_update.get("status") == "completed":
-            update_data["tasks.$.completed_date"] = datetime.utcnow()
+            update_data["completed_date"] = datetime.utcnow()
         
-        await db.projects.update_one(
-            {"id": project_id, "tasks.id": task_id, "organization": current_user.organization},
-            {"$set": update_data}
-        )
+        await set_work_item_fields(project_id, current_user.organization, "tasks", task_id, update_data)
         
         # Recalculate project and phase progress
-        project = await db.projects.find_one({"id": project_id})
-        if project:
-            new_progress = calculate_project_progress(project)
-            phase_progress = {}
-            for phase in IMPACT_PHASES.keys():
-                phase_progress[phase] = calculate_phase_progress(project, phase)
-            
-            await db.projects.update_one(
-                {"id": project_id},
-                {
-                    "$set": {
-                        "progress_percentage": new_progress,
-                        "phase_progress": phase_progress
-                    }
-                }
-            )
+        await recalculate_project_progress(project_id)
         
         return {"message": "Task updated successfully"}
     except Exception as e:
@@ -5932,45 +9182,108 @@ async def update_deliverable(
 ):
     try:
         # Update deliverable in project
-        update_data = {
-            "deliverables.$.status": deliverable_update.get("status"),
-            "deliverables.$.assigned_to": deliverable_update.get("assigned_to"),
-            "deliverables.$.content": deliverable_update.get("content"),
-            "deliverables.$.file_url": deliverable_update.get("file_url"),
-            "deliverables.$.approval_notes": deliverable_update.get("approval_notes"),
-            "updated_at": datetime.utcnow()
-        }
+        update_data = {field: deliverable_update.get(field) for field in DELIVERABLE_UPDATE_FIELDS}
         
         if deliverable_update.get("status") in ["completed", "approved"]:
-            update_data["deliverables.$.completed_date"] = datetime.utcnow()
+            update_data["completed_date"] = datetime.utcnow()
         
-        await db.projects.update_one(
-            {"id": project_id, "deliverables.id": deliverable_id, "organization": current_user.organization},
-            {"$set": update_data}
-        )
+        await set_work_item_fields(project_id, current_user.organization, "deliverables", deliverable_id, update_data)
         
         # Recalculate progress
-        project = await db.projects.find_one({"id": project_id})
-        if project:
-            new_progress = calculate_project_progress(project)
-            phase_progress = {}
-            for phase in IMPACT_PHASES.keys():
-                phase_progress[phase] = calculate_phase_progress(project, phase)
-            
-            await db.projects.update_one(
-                {"id": project_id},
-                {
-                    "$set": {
-                        "progress_percentage": new_progress,
-                        "phase_progress": phase_progress
-                    }
-                }
-            )
+        await recalculate_project_progress(project_id)
         
         return {"message": "Deliverable updated successfully"}
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Deliverable update failed: {str(e)}")
 
+@app.patch("/api/projects/{project_id}/work-items")
+async def bulk_update_work_items(
+    project_id: str,
+    bulk_update: BulkWorkItemUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """Apply many task and deliverable changes, then recompute progress once"""
+    try:
+        storage = await get_project_storage(project_id, current_user.organization)
+        if storage is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        now = datetime.utcnow()
+        changes_by_field = {}
+        for field, items, allowed_fields in (
+            ("tasks", bulk_update.tasks, TASK_UPDATE_FIELDS),
+            ("deliverables", bulk_update.deliverables, DELIVERABLE_UPDATE_FIELDS),
+        ):
+            # Two array filters matching the same element would conflict, so merge repeats (last wins)
+            merged: Dict[str, Dict[str, Any]] = {}
+            for item in items:
+                merged.setdefault(item.id, {}).update(
+                    {key: value for key, value in item.changes.items() if key in allowed_fields}
+                )
+            changes_by_field[field] = [(item_id, changes) for item_id, changes in merged.items() if changes]
+            for _, changes in changes_by_field[field]:
+                if changes.get("status") in COMPLETED_STATUSES[field]:
+                    changes["completed_date"] = now
+        
+        if not any(changes_by_field.values()):
+            raise HTTPException(status_code=400, detail="No supported task or deliverable changes supplied")
+        
+        known_ids = {}
+        if storage == "collections":
+            for field, changes_by_id in changes_by_field.items():
+                if not changes_by_id:
+                    known_ids[field] = set()
+                    continue
+                collection = db[WORK_ITEM_COLLECTIONS[field]]
+                await collection.bulk_write(
+                    [UpdateOne({"project_id": project_id, "id": item_id}, {"$set": changes}) for item_id, changes in changes_by_id],
+                    ordered=False
+                )
+                known_ids[field] = {
+                    item["id"] async for item in collection.find(
+                        {"project_id": project_id, "id": {"$in": [item_id for item_id, _ in changes_by_id]}},
+                        {"_id": 0, "id": 1}
+                    )
+                }
+            await db.projects.update_one({"id": project_id}, {"$set": {"updated_at": now}})
+            project = await recalculate_project_progress(project_id)
+        else:
+            operations = []
+            for field, changes_by_id in changes_by_field.items():
+                for start in range(0, len(changes_by_id), WORK_ITEM_FILTERS_PER_UPDATE):
+                    update_data = {"updated_at": now}
+                    array_filters = []
+                    for offset, (item_id, changes) in enumerate(changes_by_id[start:start + WORK_ITEM_FILTERS_PER_UPDATE]):
+                        identifier = f"{field[0]}{start + offset}"
+                        for key, value in changes.items():
+                            update_data[f"{field}.$[{identifier}].{key}"] = value
+                        array_filters.append({f"{identifier}.id": item_id})
+                    operations.append(UpdateOne(
+                        {"id": project_id, "organization": current_user.organization},
+                        {"$set": update_data},
+                        array_filters=array_filters
+                    ))
+            await db.projects.bulk_write(operations, ordered=True)
+            project = await recalculate_project_progress(project_id)
+            known_ids = {field: {item["id"] for item in project.get(field, [])} for field in changes_by_field}
+        
+        requested = {field: [item_id for item_id, _ in changes_by_id] for field, changes_by_id in changes_by_field.items()}
+        return {
+            "message": "Work items updated successfully",
+            "updated_tasks": [item_id for item_id in requested["tasks"] if item_id in known_ids["tasks"]],
+            "updated_deliverables": [item_id for item_id in requested["deliverables"] if item_id in known_ids["deliverables"]],
+            "not_found": {
+                field: [item_id for item_id in requested[field] if item_id not in known_ids[field]]
+                for field in ("tasks", "deliverables")
+            },
+            "progress_percentage": project["progress_percentage"],
+            "phase_progress": project["phase_progress"]
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Bulk work item update failed: {str(e)}")
+
 @app.post("/api/projects/{project_id}/gate-review")
 async def create_gate_review(
     project_id: str,
@@ -5989,146 +9302,686 @@ async def create_gate_review(
         if not project:
             raise HTTPException(status_code=404, detail="Project not found")
         
-        gate_review.completion_percentage = calculate_phase_progress(project, gate_review.phase)
+        _, phase_progress = await compute_project_progress(project)
+        gate_review.completion_percentage = phase_progress.get(gate_review.phase, 0.0)
         
         # Add gate review to project
-        await db.projects.update_one(
-            {"id": project_id},
-            {
-                "$push": {"gate_reviews": gate_review.dict()},
-                "$set": {"updated_at": datetime.utcnow()}
-            }
-        )
+        await append_work_items(project, "gate_reviews", [gate_review.dict()])
         
         return gate_review
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Gate review creation failed: {str(e)}")
 
-@app.get("/api/analytics/advanced")
-async def get_advanced_analytics(current_user: User = Depends(get_current_user)):
+# ====================================================================================
+# DATA EXPORTS - STREAM AN ORGANIZATION'S ASSESSMENTS AND PROJECTS AS NDJSON OR CSV
+# ====================================================================================
+
+# Documents are pulled one cursor batch at a time and written out before the next
+# batch is fetched, so an export holds at most one batch regardless of its size
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+EXPORT_MAX_BATCH_SIZE = 5000
+EXPORT_MAX_FIELDS = 200
+EXPORT_FIELD_PATTERN = re.compile(r"^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$")
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+# CSV needs a fixed header; NDJSON exports whole documents unless fields are given
+EXPORT_CSV_DEFAULT_FIELDS = {
+    "assessments": (
+        "id", "user_id", "organization", "project_name", "assessment_type", "overall_score",
+        "readiness_level", "success_probability", "analysis_status", "created_at", "updated_at",
+    ) + tuple(f"{dimension}.score" for dimension in SCORE_DIMENSIONS),
+    "projects": tuple(field for field in PROJECT_SUMMARY_FIELDS if field != "work_item_storage"),
+}
+
+def parse_export_fields(collection: str, fields: Optional[str], export_format: str) -> Optional[List[str]]:
+    """Requested field paths, the CSV defaults, or None for whole NDJSON documents"""
+    if not fields:
+        return list(EXPORT_CSV_DEFAULT_FIELDS[collection]) if export_format == "csv" else None
+    selected = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+    invalid = [field for field in selected if not EXPORT_FIELD_PATTERN.match(field)]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Invalid export fields: {', '.join(invalid[:10])}")
+    if not selected or len(selected) > EXPORT_MAX_FIELDS:
+        raise HTTPException(status_code=400, detail=f"Select between 1 and {EXPORT_MAX_FIELDS} fields")
+    # Mongo rejects a projection holding a path and its parent, but only once the
+    # stream has started; catch it while an error status can still be sent
+    prefixes = set(selected)
+    overlapping = [
+        field for field in selected
+        if any(".".join(field.split(".")[:depth]) in prefixes for depth in range(1, field.count(".") + 1))
+    ]
+    if overlapping:
+        raise HTTPException(status_code=400, detail=f"Export fields overlap a selected parent field: {', '.join(overlapping[:10])}")
+    return selected
+
+def export_field_value(document: dict, path: str) -> Any:
+    value: Any = document
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+def export_csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, default=_orjson_default, option=ORJSON_OPTIONS).decode()
+    return value
+
+def encode_ndjson_batch(documents: List[dict]) -> bytes:
+    return b"".join(
+        orjson.dumps(document, default=_orjson_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        for document in documents
+    )
+
+def encode_csv_rows(rows) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+async def organization_export_filter(organization: str) -> dict:
+    """Documents tagged with the organization or owned by one of its members"""
+    member_ids = await db.users.distinct("id", {"organization": organization})
+    return {"$or": [{"organization": organization}, {"user_id": {"$in": member_ids}}]}
+
+async def stream_export(collection: str, query: dict, fields: Optional[List[str]], export_format: str, batch_size: int):
+    projection = {"_id": 0}
+    if fields:
+        projection.update((field, 1) for field in fields)
+    cursor = db[collection].find(query, projection).batch_size(batch_size)
+    exported = 0
+    try:
+        if export_format == "csv":
+            yield encode_csv_rows([fields])
+        while True:
+            documents = await cursor.to_list(batch_size)
+            if not documents:
+                break
+            exported += len(documents)
+            if export_format == "csv":
+                yield encode_csv_rows(
+                    [export_csv_cell(export_field_value(document, field)) for field in fields]
+                    for document in documents
+                )
+            else:
+                yield encode_ndjson_batch(documents)
+    except Exception as e:
+        # Headers are already sent; the client sees a truncated body
+        logger.exception("Export Stream Error after %d %s: %s", exported, collection, e)
+        raise
+    finally:
+        await cursor.close()
+
+@app.get("/api/exports/{collection}")
+async def export_organization_data(
+    collection: str,
+    export_format: str = Query("ndjson", alias="format", pattern="^(csv|ndjson)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated field paths, e.g. id,overall_score,leadership_commitment.score"),
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=EXPORT_MAX_BATCH_SIZE),
+    organization: Optional[str] = Query(None, description="Admins only: export another organization"),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream every assessment or project of the caller's organization"""
+    try:
+        if collection not in EXPORT_CSV_DEFAULT_FIELDS:
+            raise HTTPException(status_code=404, detail="Unknown export collection")
+        if organization and organization != current_user.organization and not current_user.is_admin:
+            raise HTTPException(status_code=403, detail="Admin access required to export another organization")
+        organization = organization or current_user.organization
+        selected_fields = parse_export_fields(collection, fields, export_format)
+        query = await organization_export_filter(organization)
+
+        filename = f"{collection}-{datetime.utcnow():%Y%m%d}.{export_format}"
+        return StreamingResponse(
+            stream_export(collection, query, selected_fields, export_format, batch_size),
+            media_type=EXPORT_MEDIA_TYPES[export_format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Data Export Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to start export: {str(e)}")
+
+# ====================================================================================
+# ANALYTICS SNAPSHOTS - INCREMENTAL PARQUET TABLES FOR OFFLINE ANALYSIS
+# ====================================================================================
+
+# Hive-partitioned Parquet datasets, <dir>/<table>/organization=<org>/month=<YYYY-MM>/,
+# readable with pandas.read_parquet(<dir>/<table>). Each run appends the documents
+# created or updated since the previous run's watermark, so a changed document has one
+# row per version; keep the latest snapshot_at per id for the current state.
+ANALYTICS_SNAPSHOT_DIR = os.getenv("ANALYTICS_SNAPSHOT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots"))
+ANALYTICS_SNAPSHOT_BATCH_SIZE = int(os.getenv("ANALYTICS_SNAPSHOT_BATCH_SIZE", "5000"))
+ANALYTICS_SNAPSHOT_ENABLED = os.getenv("ANALYTICS_SNAPSHOT_ENABLED", "true").lower() in ("1", "true", "yes")
+ANALYTICS_SNAPSHOT_HOUR_UTC = int(os.getenv("ANALYTICS_SNAPSHOT_HOUR_UTC", "3"))
+ANALYTICS_SNAPSHOT_LEASE_SECONDS = int(os.getenv("ANALYTICS_SNAPSHOT_LEASE_SECONDS", "3600"))
+# Writes stamped just before a run may not be visible to it yet; the next run picks them up
+ANALYTICS_SNAPSHOT_SETTLE_SECONDS = int(os.getenv("ANALYTICS_SNAPSHOT_SETTLE_SECONDS", "60"))
+
+def assessment_snapshot_row(assessment: dict) -> dict:
+    newton = assessment.get("newton_analysis") or {}
+    row = {
+        field: assessment.get(field)
+        for field in ("id", "user_id", "project_name", "assessment_type", "overall_score", "readiness_level",
+                      "success_probability", "analysis_status", "created_at", "updated_at")
+    }
+    row.update(
+        newton_inertia=export_field_value(newton, "inertia.value"),
+        newton_force_required=export_field_value(newton, "force.required"),
+        newton_acceleration=export_field_value(newton, "force.acceleration"),
+        newton_resistance=export_field_value(newton, "reaction.resistance"),
+    )
+    row.update(zip((f"score_{dimension}" for dimension in SCORE_DIMENSIONS), ScoreVector.from_assessment(assessment).values.tolist()))
+    return row
+
+def project_snapshot_row(project: dict) -> dict:
+    row = {
+        field: project.get(field)
+        for field in ("id", "user_id", "project_name", "project_type", "client_organization", "status", "current_phase",
+                      "health_status", "overall_progress", "spent_budget", "assessment_id", "start_date",
+                      "estimated_end_date", "created_at", "updated_at")
+    }
+    total_budget = project.get("total_budget", project.get("budget"))
+    spent_budget = project.get("spent_budget")
+    row["total_budget"] = total_budget
+    if isinstance(total_budget, (int, float)) and isinstance(spent_budget, (int, float)):
+        row["budget_remaining"] = total_budget - spent_budget
+        row["budget_utilization"] = spent_budget / total_budget * 100 if total_budget > 0 else None
+    return row
+
+# Column kinds are fixed so every file in a dataset shares one schema
+SNAPSHOT_TABLES = {
+    "assessments": {
+        "row": assessment_snapshot_row,
+        "columns": {
+            "id": "string", "user_id": "string", "project_name": "string", "assessment_type": "string",
+            "overall_score": "float", "readiness_level": "string", "success_probability": "float",
+            "analysis_status": "string", "created_at": "datetime", "updated_at": "datetime",
+            "newton_inertia": "float", "newton_force_required": "float", "newton_acceleration": "float",
+            "newton_resistance": "float",
+            **{f"score_{dimension}": "float" for dimension in SCORE_DIMENSIONS},
+        },
+        "projection": {
+            "_id": 0, "newton_analysis": 1, "organization": 1,
+            **{field: 1 for field in ("id", "user_id", "project_name", "assessment_type", "overall_score", "readiness_level",
+                                      "success_probability", "analysis_status", "created_at", "updated_at")},
+            **{f"{dimension}.score": 1 for dimension in SCORE_DIMENSION_INDEX},
+        },
+    },
+    "projects": {
+        "row": project_snapshot_row,
+        "columns": {
+            "id": "string", "user_id": "string", "project_name": "string", "project_type": "string",
+            "client_organization": "string", "status": "string", "current_phase": "string",
+            "health_status": "string", "overall_progress": "float", "total_budget": "float",
+            "spent_budget": "float", "budget_remaining": "float", "budget_utilization": "float",
+            "assessment_id": "string", "start_date": "datetime", "estimated_end_date": "datetime",
+            "created_at": "datetime", "updated_at": "datetime",
+        },
+        "projection": {
+            "_id": 0,
+            **{field: 1 for field in ("id", "user_id", "organization", "project_name", "project_type", "client_organization",
+                                      "status", "current_phase", "health_status", "overall_progress", "total_budget",
+                                      "budget", "spent_budget", "assessment_id", "start_date", "estimated_end_date",
+                                      "created_at", "updated_at")},
+        },
+    },
+}
+SNAPSHOT_PARTITION_COLUMNS = ["organization", "month"]
+
+def snapshot_change_filter(since: Optional[datetime], until: datetime) -> dict:
+    """Documents last written in (since, until]; everything up to until on the first run"""
+    if since is None:
+        return {"$nor": [{"updated_at": {"$gt": until}}, {"created_at": {"$gt": until}}]}
+    window = {"$gt": since, "$lte": until}
+    return {"$or": [{"updated_at": window}, {"updated_at": None, "created_at": window}]}
+
+def snapshot_frame(rows: List[dict], columns: Dict[str, str]) -> pd.DataFrame:
+    frame = pd.DataFrame.from_records(rows, columns=list(columns) + SNAPSHOT_PARTITION_COLUMNS + ["snapshot_at"])
+    for column, kind in columns.items():
+        if kind == "float":
+            frame[column] = pd.to_numeric(frame[column], errors="coerce").astype("float64")
+        elif kind == "datetime":
+            frame[column] = pd.to_datetime(frame[column], errors="coerce", utc=True).dt.tz_localize(None).astype("datetime64[us]")
+        else:
+            frame[column] = frame[column].astype("string")
+    frame["snapshot_at"] = frame["snapshot_at"].astype("datetime64[us]")
+    return frame
+
+def write_snapshot_batch(table: str, rows: List[dict], basename: str):
+    snapshot_frame(rows, SNAPSHOT_TABLES[table]["columns"]).to_parquet(
+        os.path.join(ANALYTICS_SNAPSHOT_DIR, table),
+        engine="pyarrow",
+        index=False,
+        partition_cols=SNAPSHOT_PARTITION_COLUMNS,
+        basename_template=f"part-{basename}-{{i}}.parquet",
+    )
+
+async def snapshot_table(table: str, since: Optional[datetime], until: datetime, run_id: str, batch_size: int) -> int:
+    """Append one table's changed documents; returns the number of rows written"""
+    config = SNAPSHOT_TABLES[table]
+    cursor = db[table].find(snapshot_change_filter(since, until), config["projection"]).batch_size(batch_size)
+    written = 0
+    try:
+        for batch_number in itertools.count():
+            documents = await cursor.to_list(batch_size)
+            if not documents:
+                break
+            # Projects created through /api/projects carry no organization; use their owner's
+            owner_ids = list({document.get("user_id") for document in documents if not document.get("organization")})
+            owner_organizations = {
+                user["id"]: user.get("organization")
+                async for user in db.users.find({"id": {"$in": owner_ids}}, {"_id": 0, "id": 1, "organization": 1})
+            } if owner_ids else {}
+            rows = []
+            for document in documents:
+                row = config["row"](document)
+                stamped_at = document.get("created_at") or document.get("updated_at")
+                row["organization"] = str(document.get("organization") or owner_organizations.get(document.get("user_id")) or "unknown")
+                row["month"] = f"{stamped_at:%Y-%m}" if isinstance(stamped_at, datetime) else "unknown"
+                row["snapshot_at"] = until
+                rows.append(row)
+            await run_in_threadpool(write_snapshot_batch, table, rows, f"{run_id}-{batch_number}")
+            written += len(rows)
+    finally:
+        await cursor.close()
+    return written
+
+async def snapshot_analytics_tables(batch_size: int = ANALYTICS_SNAPSHOT_BATCH_SIZE) -> dict:
+    """Append every table's changes since its watermark, then advance the watermark"""
+    start = time.perf_counter()
+    until = datetime.utcnow() - timedelta(seconds=ANALYTICS_SNAPSHOT_SETTLE_SECONDS)
+    run_id = f"{until:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+    job = await db.scheduled_jobs.find_one({"_id": "analytics_snapshot"}, {"watermarks": 1}) or {}
+    watermarks = job.get("watermarks") or {}
+    summary = {"rows": {}, "watermark": until}
+    for table in SNAPSHOT_TABLES:
+        since = watermarks.get(table)
+        if since is not None and since >= until:
+            summary["rows"][table] = 0
+            continue
+        summary["rows"][table] = await snapshot_table(table, since, until, run_id, batch_size)
+        # Per table, so a failure later in the run does not re-export this one
+        await db.scheduled_jobs.update_one({"_id": "analytics_snapshot"}, {"$set": {f"watermarks.{table}": until}}, upsert=True)
+    summary["duration_seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+async def run_analytics_snapshot_job() -> dict:
+    summary = {}
+    try:
+        summary = await snapshot_analytics_tables()
+        logger.info("Analytics snapshot finished: %s", summary)
+    except Exception as e:
+        logger.exception("Analytics Snapshot Error: %s", e)
+        summary = {"error": str(e)}
+    finally:
+        await release_job_lease("analytics_snapshot", summary)
+    return summary
+
+async def daily_snapshot_loop():
+    while True:
+        await asyncio.sleep(seconds_until_hour(datetime.utcnow(), ANALYTICS_SNAPSHOT_HOUR_UTC))
+        if await acquire_job_lease("analytics_snapshot", ANALYTICS_SNAPSHOT_LEASE_SECONDS):
+            await run_analytics_snapshot_job()
+
+@app.on_event("startup")
+async def start_snapshot_scheduler():
+    if ANALYTICS_SNAPSHOT_ENABLED:
+        start_background_job(daily_snapshot_loop())
+
+@app.post("/api/admin/analytics/snapshot", status_code=202)
+async def start_analytics_snapshot(admin_user: User = Depends(get_admin_user)):
+    """Append the changes since the last snapshot now, in the background"""
+    if not await acquire_job_lease("analytics_snapshot", ANALYTICS_SNAPSHOT_LEASE_SECONDS):
+        raise HTTPException(status_code=409, detail="Analytics snapshot already running")
+    start_background_job(run_analytics_snapshot_job())
+    return {"message": "Analytics snapshot started"}
+
+@app.get("/api/admin/analytics/snapshot")
+async def get_analytics_snapshot_status(admin_user: User = Depends(get_admin_user)):
+    """Last snapshot run, per-table watermarks, and whether one is running now"""
+    try:
+        now = datetime.utcnow()
+        job = await db.scheduled_jobs.find_one({"_id": "analytics_snapshot"}) or {}
+        job.pop("_id", None)
+        locked_until = job.get("locked_until")
+        job["running"] = bool(locked_until and locked_until > now)
+        job["snapshot_dir"] = ANALYTICS_SNAPSHOT_DIR
+        job["next_scheduled_run"] = (
+            now + timedelta(seconds=seconds_until_hour(now, ANALYTICS_SNAPSHOT_HOUR_UTC))
+            if ANALYTICS_SNAPSHOT_ENABLED else None
+        )
+        return job
+    except Exception as e:
+        logger.exception("Analytics Snapshot Status Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get analytics snapshot status: {str(e)}")
+
+# ====================================================================================
+# ACTIVITY RETENTION - DAILY USAGE ROLLUPS AND ARCHIVAL OF OLD LOG DOCUMENTS
+# ====================================================================================
+
+# Documents older than the hot window move to <collection>_archive, keeping the
+# collections the dashboard and activity feeds query small. Usage is first rolled up
+# per day into usage_daily_rollups, which is never archived or expired.
+# The active user counters read the last 30 days of user_activities, so it stays hot longer
+ACTIVITY_HOT_DAYS = max(int(os.getenv("ACTIVITY_HOT_DAYS", "90")), 31)
+NOTIFICATION_HOT_DAYS = int(os.getenv("NOTIFICATION_HOT_DAYS", "90"))
+# 0 keeps archived documents forever; otherwise a TTL index expires them
+ARCHIVE_TTL_DAYS = int(os.getenv("ARCHIVE_TTL_DAYS", "0"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "1000"))
+RETENTION_ENABLED = os.getenv("RETENTION_ENABLED", "true").lower() in ("1", "true", "yes")
+RETENTION_HOUR_UTC = int(os.getenv("RETENTION_HOUR_UTC", "4"))
+RETENTION_LEASE_SECONDS = int(os.getenv("RETENTION_LEASE_SECONDS", "3600"))
+
+RETENTION_POLICIES = {
+    # Archived in the flat user_activities shape whichever way it is stored
+    "user_activities": {"field": "timestamp", "days": ACTIVITY_HOT_DAYS, "filter": {},
+                        "source": activity_collection_name(), "record": activity_record},
+    "user_notifications": {"field": "created_at", "days": NOTIFICATION_HOT_DAYS, "filter": {}},
+    # Unresolved admin notifications are the approval queue; they stay until resolved
+    "admin_notifications": {"field": "created_at", "days": NOTIFICATION_HOT_DAYS, "filter": {"resolved": True}},
+}
+
+def archive_collection(collection: str) -> str:
+    return f"{collection}_archive"
+
+async def roll_up_activity_day(day: datetime) -> dict:
+    """Event counts per action and distinct active users for one UTC day"""
+    actions, active_users, login_users = {}, set(), set()
+    for collection, timeseries in await activity_sources():
+        pipeline = [
+            {"$match": {"timestamp": {"$gte": day, "$lt": day + timedelta(days=1)}}},
+            {"$group": {"_id": "$action", "events": {"$sum": 1}, "users": {"$addToSet": f"${activity_field('user_id', timeseries)}"}}},
+        ]
+        async for group in collection.aggregate(pipeline):
+            actions[str(group["_id"])] = actions.get(str(group["_id"]), 0) + group["events"]
+            active_users.update(group["users"])
+            if group["_id"] == "login":
+                login_users.update(group["users"])
+    rollup = {
+        "day": day,
+        "events": sum(actions.values()),
+        "actions": actions,
+        "active_users": len(active_users),
+        "logins": actions.get("login", 0),
+        "login_users": len(login_users),
+        "computed_at": datetime.utcnow(),
+    }
+    await db.usage_daily_rollups.update_one({"_id": f"{day:%Y-%m-%d}"}, {"$set": rollup}, upsert=True)
+    return rollup
+
+async def roll_up_activity_days() -> Optional[datetime]:
+    """Roll up each finished day since the last run; returns the first day not yet rolled up"""
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    job = await db.scheduled_jobs.find_one({"_id": "activity_retention"}, {"rolled_up_through": 1}) or {}
+    day = job.get("rolled_up_through")
+    if day is None:
+        oldest = [
+            document["timestamp"]
+            for collection, _ in await activity_sources()
+            if (document := await collection.find_one(MIGRATABLE_ACTIVITIES, {"timestamp": 1}, sort=[("timestamp", 1)]))
+        ]
+        if not oldest:
+            return None
+        day = min(oldest).replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < today:
+        await roll_up_activity_day(day)
+        day += timedelta(days=1)
+        await db.scheduled_jobs.update_one({"_id": "activity_retention"}, {"$set": {"rolled_up_through": day}}, upsert=True)
+    return day
+
+async def archive_expired_documents(collection: str, cutoff: datetime, batch_size: int) -> int:
+    """Copy documents older than cutoff to the archive collection, then remove them"""
+    policy = RETENTION_POLICIES[collection]
+    source = policy.get("source", collection)
+    record = policy.get("record", dict)
+    query = {**policy["filter"], policy["field"]: {"$lt": cutoff}}
+    archived = 0
+    while True:
+        documents = await db[source].find(query).sort(policy["field"], 1).limit(batch_size).to_list(batch_size)
+        if not documents:
+            return archived
+        archived_at = datetime.utcnow()
+        # Replacing by _id makes a batch interrupted between the two steps safe to redo
+        await db[archive_collection(collection)].bulk_write(
+            [ReplaceOne({"_id": document["_id"]}, {**record(document), "archived_at": archived_at}, upsert=True) for document in documents],
+            ordered=False
+        )
+        await db[source].delete_many({"_id": {"$in": [document["_id"] for document in documents]}})
+        archived += len(documents)
+
+async def apply_retention(batch_size: int = RETENTION_BATCH_SIZE) -> dict:
+    start = time.perf_counter()
+    now = datetime.utcnow()
+    rolled_up_through = await roll_up_activity_days()
+    summary = {"rolled_up_through": rolled_up_through, "archived": {}}
+    for collection, policy in RETENTION_POLICIES.items():
+        cutoff = now - timedelta(days=policy["days"])
+        if collection == "user_activities" and rolled_up_through is not None:
+            # Never archive activity that is not in a rollup yet
+            cutoff = min(cutoff, rolled_up_through)
+        summary["archived"][collection] = await archive_expired_documents(collection, cutoff, batch_size)
+    summary["duration_seconds"] = round(time.perf_counter() - start, 3)
+    return summary
+
+async def run_retention_job() -> dict:
+    summary = {}
+    try:
+        summary = await apply_retention()
+        logger.info("Retention run finished: %s", summary)
+    except Exception as e:
+        logger.exception("Retention Error: %s", e)
+        summary = {"error": str(e)}
+    finally:
+        await release_job_lease("activity_retention", summary)
+    return summary
+
+async def daily_retention_loop():
+    while True:
+        await asyncio.sleep(seconds_until_hour(datetime.utcnow(), RETENTION_HOUR_UTC))
+        if await acquire_job_lease("activity_retention", RETENTION_LEASE_SECONDS):
+            await run_retention_job()
+
+@app.on_event("startup")
+async def start_retention_scheduler():
+    if RETENTION_ENABLED:
+        start_background_job(daily_retention_loop())
+
+@app.post("/api/admin/retention/run", status_code=202)
+async def start_retention_run(admin_user: User = Depends(get_admin_user)):
+    """Roll up usage and archive old activity and notifications now, in the background"""
+    if not await acquire_job_lease("activity_retention", RETENTION_LEASE_SECONDS):
+        raise HTTPException(status_code=409, detail="Retention run already in progress")
+    start_background_job(run_retention_job())
+    return {"message": "Retention run started"}
+
+@app.get("/api/admin/retention")
+async def get_retention_status(admin_user: User = Depends(get_admin_user)):
+    """Retention policies, the last run, and hot/archived document counts"""
     try:
-        # Get all assessments for the organization
-        assessments = await db.assessments.find({"organization": current_user.organization}).to_list(100)
-        
-        # Clean up ObjectId fields
-        for assessment in assessments:
-            if "_id" in assessment:
-                del assessment["_id"]
-        
-        if not assessments:
-            return {
-                "trend_analysis": {"message": "No data available for trend analysis"},
-                "newton_laws_data": {"message": "No assessments to analyze"},
-                "predictive_insights": {"message": "Insufficient data for predictions"},
-                "dimension_breakdown": {"message": "No dimension data available"},
-                "organizational_benchmarks": {"message": "No benchmark data available"}
+        now = datetime.utcnow()
+        job = await db.scheduled_jobs.find_one({"_id": "activity_retention"}) or {}
+        job.pop("_id", None)
+        locked_until = job.get("locked_until")
+        job["running"] = bool(locked_until and locked_until > now)
+        job["next_scheduled_run"] = (
+            now + timedelta(seconds=seconds_until_hour(now, RETENTION_HOUR_UTC))
+            if RETENTION_ENABLED else None
+        )
+        collections = list(RETENTION_POLICIES)
+        counts = await asyncio.gather(*(
+            db[name].estimated_document_count()
+            for collection in collections
+            for name in (RETENTION_POLICIES[collection].get("source", collection), archive_collection(collection))
+        ))
+        job["policies"] = {
+            collection: {
+                "hot_days": RETENTION_POLICIES[collection]["days"],
+                "archive_ttl_days": ARCHIVE_TTL_DAYS or None,
+                "hot_documents": counts[2 * index],
+                "archived_documents": counts[2 * index + 1],
             }
-        
-        # Trend Analysis
-        trend_data = []
-        for assessment in sorted(assessments, key=lambda x: x.get('created_at', datetime.utcnow())):
-            trend_data.append({
-                "date": assessment.get('created_at', datetime.utcnow()).isoformat(),
-                "overall_score": assessment.get('overall_score', 0),
-                "success_probability": assessment.get('success_probability', 0),
-                "project_name": assessment.get('project_name', 'Unknown')
-            })
-        
-        # Newton's Laws Aggregate Data
-        total_inertia = 0
-        total_force = 0
-        total_resistance = 0
-        newton_count = 0
-        
-        for assessment in assessments:
-            newton_data = assessment.get('newton_analysis', {})
-            if newton_data:
-                total_inertia += newton_data.get('inertia', {}).get('value', 0)
-                total_force += newton_data.get('force', {}).get('required', 0)
-                total_resistance += newton_data.get('reaction', {}).get('resistance', 0)
-                newton_count += 1
-        
-        avg_newton_data = {
-            "average_inertia": round(total_inertia / newton_count, 1) if newton_count > 0 else 0,
-            "average_force_required": round(total_force / newton_count, 1) if newton_count > 0 else 0,
-            "average_resistance": round(total_resistance / newton_count, 1) if newton_count > 0 else 0,
-            "assessments_count": newton_count
-        }
-        
-        # Dimension Breakdown
-        dimensions = {
-            "change_management_maturity": [],
-            "communication_effectiveness": [],
-            "leadership_support": [],
-            "workforce_adaptability": [],
-            "resource_adequacy": []
+            for index, collection in enumerate(collections)
         }
-        
-        for assessment in assessments:
-            dimensions["change_management_maturity"].append(assessment.get('change_management_maturity', {}).get('score', 0))
-            dimensions["communication_effectiveness"].append(assessment.get('communication_effectiveness', {}).get('score', 0))
-            dimensions["leadership_support"].append(assessment.get('leadership_support', {}).get('score', 0))
-            dimensions["workforce_adaptability"].append(assessment.get('workforce_adaptability', {}).get('score', 0))
-            dimensions["resource_adequacy"].append(assessment.get('resource_adequacy', {}).get('score', 0))
-        
-        dimension_averages = {
-            dim: round(sum(scores) / len(scores), 2) if scores else 0
-            for dim, scores in dimensions.items()
-        }
-        
-        # Predictive Insights
-        recent_assessments = sorted(assessments, key=lambda x: x.get('created_at', datetime.utcnow()))[-5:]
-        avg_recent_score = sum(a.get('overall_score', 0) for a in recent_assessments) / len(recent_assessments) if recent_assessments else 0
-        
-        predictive_insights = {
-            "trajectory": "improving" if len(assessments) > 1 and assessments[-1].get('overall_score', 0) > assessments[0].get('overall_score', 0) else "stable",
-            "predicted_next_score": min(5.0, avg_recent_score + 0.2),
-            "confidence_level": min(95, len(assessments) * 10),
-            "recommendations": [
-                "Continue focus on lowest-scoring dimensions",
-                "Maintain momentum in high-performing areas",
-                "Consider advanced change management training",
-                "Implement regular assessment cycles"
-            ]
-        }
-        
-        # Organizational Benchmarks
-        org_benchmarks = {
-            "industry_comparison": {
-                "your_average": round(sum(a.get('overall_score', 0) for a in assessments) / len(assessments), 2),
-                "industry_average": 3.2,  # Simulated benchmark
-                "top_quartile": 4.1,
-                "performance_percentile": min(95, max(5, (sum(a.get('overall_score', 0) for a in assessments) / len(assessments)) * 25))
-            },
-            "maturity_level": "Developing" if avg_recent_score < 3 else "Proficient" if avg_recent_score < 4 else "Advanced",
-            "areas_of_strength": [dim for dim, avg in dimension_averages.items() if avg >= 4],
-            "improvement_opportunities": [dim for dim, avg in dimension_averages.items() if avg < 3]
-        }
-        
+        return job
+    except Exception as e:
+        logger.exception("Retention Status Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get retention status: {str(e)}")
+
+@app.get("/api/admin/usage/daily")
+async def get_daily_usage(
+    days: int = Query(30, ge=1, le=3660),
+    admin_user: User = Depends(get_admin_user)
+):
+    """Daily usage rollups, newest first; they outlive the archived activity they summarise"""
+    try:
+        since = datetime.utcnow() - timedelta(days=days)
+        rollups = await db.usage_daily_rollups.find({"day": {"$gte": since}}).sort("day", -1).to_list(days)
+        for rollup in rollups:
+            rollup["date"] = rollup.pop("_id")
+        return {"days": days, "rollups": rollups}
+    except Exception as e:
+        logger.exception("Daily Usage Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to get daily usage: {str(e)}")
+
+# Analytics and dashboard metrics are computed from one fetch of the organization's
+# assessments so the bootstrap endpoint can share it between both sections
+ANALYTICS_ASSESSMENT_LIMIT = 100
+
+async def fetch_organization_assessments(organization: str) -> list:
+    return await cache.get_or_set(
+        f"org_assessments:{organization}",
+        lambda: db.assessments.find({"organization": organization}, {"_id": 0}).to_list(ANALYTICS_ASSESSMENT_LIMIT),
+        ttl=ORGANIZATION_ASSESSMENTS_CACHE_TTL_SECONDS,
+        tags=(f"org:{organization}",),
+    )
+
+def build_advanced_analytics(assessments: list) -> dict:
+    """Trend, Newton's laws, dimension and benchmark analytics over an organization's assessments"""
+    if not assessments:
         return {
-            "trend_analysis": {
-                "data": trend_data,
-                "summary": f"Analyzed {len(assessments)} assessments showing {predictive_insights['trajectory']} trend"
-            },
-            "newton_laws_data": avg_newton_data,
-            "predictive_insights": predictive_insights,
-            "dimension_breakdown": dimension_averages,
-            "organizational_benchmarks": org_benchmarks
+            "trend_analysis": {"message": "No data available for trend analysis"},
+            "newton_laws_data": {"message": "No assessments to analyze"},
+            "predictive_insights": {"message": "Insufficient data for predictions"},
+            "dimension_breakdown": {"message": "No dimension data available"},
+            "organizational_benchmarks": {"message": "No benchmark data available"}
         }
-        
+    
+    # Trend Analysis
+    trend_data = []
+    for assessment in sorted(assessments, key=lambda x: x.get('created_at', datetime.utcnow())):
+        trend_data.append({
+            "date": assessment.get('created_at', datetime.utcnow()).isoformat(),
+            "overall_score": assessment.get('overall_score', 0),
+            "success_probability": assessment.get('success_probability', 0),
+            "project_name": assessment.get('project_name', 'Unknown')
+        })
+    
+    # Newton's Laws Aggregate Data
+    total_inertia = 0
+    total_force = 0
+    total_resistance = 0
+    newton_count = 0
+    
+    for assessment in assessments:
+        newton_data = assessment.get('newton_analysis', {})
+        if newton_data:
+            total_inertia += newton_data.get('inertia', {}).get('value', 0)
+            total_force += newton_data.get('force', {}).get('required', 0)
+            total_resistance += newton_data.get('reaction', {}).get('resistance', 0)
+            newton_count += 1
+    
+    avg_newton_data = {
+        "average_inertia": round(total_inertia / newton_count, 1) if newton_count > 0 else 0,
+        "average_force_required": round(total_force / newton_count, 1) if newton_count > 0 else 0,
+        "average_resistance": round(total_resistance / newton_count, 1) if newton_count > 0 else 0,
+        "assessments_count": newton_count
+    }
+    
+    # Dimension Breakdown; unscored dimensions count as 0
+    dimensions = (
+        "change_management_maturity", "communication_effectiveness", "leadership_support",
+        "workforce_adaptability", "resource_adequacy"
+    )
+    score_matrix = ScoreVector.stack([ScoreVector.from_assessment(assessment) for assessment in assessments])
+    column_means = np.nan_to_num(score_matrix[:, score_columns(dimensions)]).mean(axis=0)
+    dimension_averages = {dim: round(float(mean), 2) for dim, mean in zip(dimensions, column_means)}
+    
+    # Predictive Insights
+    recent_assessments = sorted(assessments, key=lambda x: x.get('created_at', datetime.utcnow()))[-5:]
+    avg_recent_score = sum(a.get('overall_score', 0) for a in recent_assessments) / len(recent_assessments) if recent_assessments else 0
+    
+    predictive_insights = {
+        "trajectory": "improving" if len(assessments) > 1 and assessments[-1].get('overall_score', 0) > assessments[0].get('overall_score', 0) else "stable",
+        "predicted_next_score": min(5.0, avg_recent_score + 0.2),
+        "confidence_level": min(95, len(assessments) * 10),
+        "recommendations": [
+            "Continue focus on lowest-scoring dimensions",
+            "Maintain momentum in high-performing areas",
+            "Consider advanced change management training",
+            "Implement regular assessment cycles"
+        ]
+    }
+    
+    # Organizational Benchmarks
+    org_benchmarks = {
+        "industry_comparison": {
+            "your_average": round(sum(a.get('overall_score', 0) for a in assessments) / len(assessments), 2),
+            "industry_average": 3.2,  # Simulated benchmark
+            "top_quartile": 4.1,
+            "performance_percentile": min(95, max(5, (sum(a.get('overall_score', 0) for a in assessments) / len(assessments)) * 25))
+        },
+        "maturity_level": "Developing" if avg_recent_score < 3 else "Proficient" if avg_recent_score < 4 else "Advanced",
+        "areas_of_strength": [dim for dim, avg in dimension_averages.items() if avg >= 4],
+        "improvement_opportunities": [dim for dim, avg in dimension_averages.items() if avg < 3]
+    }
+    
+    return {
+        "trend_analysis": {
+            "data": trend_data,
+            "summary": f"Analyzed {len(assessments)} assessments showing {predictive_insights['trajectory']} trend"
+        },
+        "newton_laws_data": avg_newton_data,
+        "predictive_insights": predictive_insights,
+        "dimension_breakdown": dimension_averages,
+        "organizational_benchmarks": org_benchmarks
+    }
+
+@app.get("/api/analytics/advanced")
+async def get_advanced_analytics(current_user: User = Depends(get_current_user)):
+    try:
+        assessments = await fetch_organization_assessments(current_user.organization)
+        return build_advanced_analytics(assessments)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to retrieve advanced analytics: {str(e)}")
 
-@app.get("/api/dashboard/metrics")
-async def get_dashboard_metrics(current_user: User = Depends(get_current_user)):
-    try:
-        # Get organization metrics
-        total_assessments = await db.assessments.count_documents({"organization": current_user.organization})
-        total_projects = await db.projects.count_documents({"organization": current_user.organization})
-        
+async def build_dashboard_metrics(organization: str, assessments: Optional[list] = None) -> dict:
+    """Organization counts, average scores and recent assessments.
+
+    When ``assessments`` already holds every assessment for the organization the
+    averages and recent list are computed from it instead of querying again.
+    """
+    total_assessments, total_projects = await asyncio.gather(
+        db.assessments.count_documents({"organization": organization}),
+        db.projects.count_documents({"organization": organization})
+    )
+    
+    if assessments is not None and len(assessments) >= total_assessments:
+        scores = [a["overall_score"] for a in assessments if isinstance(a.get("overall_score"), (int, float))]
+        probabilities = [a["success_probability"] for a in assessments if isinstance(a.get("success_probability"), (int, float))]
+        avg_score = sum(scores) / len(scores) if scores else 0
+        avg_success_probability = sum(probabilities) / len(probabilities) if probabilities else 0
+        recent_assessments = sorted(
+            assessments, key=lambda a: a.get("created_at") or datetime.min, reverse=True
+        )[:5]
+    else:
         # Get average scores
         pipeline = [
-            {"$match": {"organization": current_user.organization}},
+            {"$match": {"organization": organization}},
             {"$group": {
                 "_id": None,
                 "avg_score": {"$avg": "$overall_score"},
@@ -6136,30 +9989,96 @@ async def get_dashboard_metrics(current_user: User = Depends(get_current_user)):
             }}
         ]
         
-        avg_data = await db.assessments.aggregate(pipeline).to_list(1)
-        avg_score = avg_data[0]["avg_score"] if avg_data else 0
-        avg_success_probability = avg_data[0]["avg_success_probability"] if avg_data else 0
-        
-        # Get recent assessments
-        recent_assessments = await db.assessments.find(
-            {"organization": current_user.organization}
-        ).sort("created_at", -1).limit(5).to_list(5)
-        
-        # Clean up ObjectId fields
-        for assessment in recent_assessments:
-            if "_id" in assessment:
-                del assessment["_id"]
-        
-        return {
-            "total_assessments": total_assessments,
-            "total_projects": total_projects,
-            "average_readiness_score": round(avg_score, 2),
-            "average_success_probability": round(avg_success_probability, 2),
-            "recent_assessments": recent_assessments
-        }
+        avg_data, recent_assessments = await asyncio.gather(
+            db.assessments.aggregate(pipeline).to_list(1),
+            db.assessments.find({"organization": organization}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
+        )
+        avg_score = (avg_data[0]["avg_score"] or 0) if avg_data else 0
+        avg_success_probability = (avg_data[0]["avg_success_probability"] or 0) if avg_data else 0
+    
+    return {
+        "total_assessments": total_assessments,
+        "total_projects": total_projects,
+        "average_readiness_score": round(avg_score, 2),
+        "average_success_probability": round(avg_success_probability, 2),
+        "recent_assessments": recent_assessments
+    }
+
+@app.get("/api/dashboard/metrics")
+async def get_dashboard_metrics(current_user: User = Depends(get_current_user)):
+    try:
+        return await build_dashboard_metrics(current_user.organization)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to retrieve dashboard metrics: {str(e)}")
 
+# ====================================================================================
+# DASHBOARD BOOTSTRAP
+# ====================================================================================
+
+BOOTSTRAP_SECTIONS = ("profile", "metrics", "assessments", "projects", "analytics", "phases", "assessment_types")
+ADMIN_BOOTSTRAP_SECTIONS = ("admin_dashboard", "admin_users")
+
+def parse_bootstrap_sections(sections: Optional[str], user: User) -> List[str]:
+    available = BOOTSTRAP_SECTIONS + (ADMIN_BOOTSTRAP_SECTIONS if user.is_admin else ())
+    if not sections:
+        return list(available)
+    
+    requested = list(dict.fromkeys(name.strip() for name in sections.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in BOOTSTRAP_SECTIONS + ADMIN_BOOTSTRAP_SECTIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown bootstrap sections: {', '.join(unknown)}")
+    if not user.is_admin and any(name in ADMIN_BOOTSTRAP_SECTIONS for name in requested):
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return requested
+
+@app.get("/api/dashboard/bootstrap")
+async def get_dashboard_bootstrap(
+    sections: Optional[str] = Query(None, description="Comma-separated sections to include; defaults to every section the user can see"),
+    current_user: User = Depends(get_current_user)
+):
+    """Everything the dashboard loads after login, in one authenticated round trip"""
+    requested = parse_bootstrap_sections(sections, current_user)
+    try:
+        # Metrics and analytics both read the organization's assessments; fetch them once
+        org_assessments = None
+        if "metrics" in requested or "analytics" in requested:
+            org_assessments = asyncio.ensure_future(fetch_organization_assessments(current_user.organization))
+        
+        async def metrics_section():
+            return await build_dashboard_metrics(current_user.organization, await org_assessments)
+        
+        async def analytics_section():
+            return build_advanced_analytics(await org_assessments)
+        
+        loaders = {
+            "metrics": metrics_section,
+            "assessments": lambda: db.assessments.find({"user_id": current_user.id}, {"_id": 0}).to_list(100),
+            "projects": lambda: list_project_summaries({"user_id": current_user.id}, PROJECT_PAGE_DEFAULT_LIMIT, None),
+            "analytics": analytics_section,
+            "admin_dashboard": cached_admin_dashboard,
+            "admin_users": lambda: list_users({}, 50, 0),
+        }
+        static = {
+            "profile": lambda: current_user,
+            "phases": lambda: IMPACT_PHASES,
+            "assessment_types": lambda: {"assessment_types": ASSESSMENT_TYPES},
+        }
+        
+        queried = [name for name in requested if name in loaders]
+        try:
+            results = await asyncio.gather(*(loaders[name]() for name in queried))
+        finally:
+            if org_assessments is not None and not org_assessments.done():
+                org_assessments.cancel()
+        
+        response = {name: static[name]() for name in requested if name in static}
+        response.update(zip(queried, results))
+        response["sections"] = requested
+        return response
+    except Exception as e:
+        logger.exception("Dashboard Bootstrap Error: %s", e)
+        raise HTTPException(status_code=500, detail=f"Failed to load dashboard: {str(e)}")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
@@ -30,6 +30,20 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         self.deliverable_id = None
         self.typed_assessment_ids = {}  # Store assessment IDs by type
     
+    def wait_for_assessment_analysis(self, assessment, headers, timeout=30):
+        """Poll until a new typed assessment's derived fields are computed; returns them merged in"""
+        self.assertEqual(assessment["analysis_status"], "pending")
+        deadline = time.time() + timeout
+        while True:
+            response = requests.get(f"{self.base_url}/assessments/{assessment['id']}/analysis", headers=headers)
+            self.assertEqual(response.status_code, 200)
+            analysis = response.json()
+            if analysis["analysis_status"] != "pending" or time.time() > deadline:
+                break
+            time.sleep(0.5)
+        self.assertEqual(analysis["analysis_status"], "complete")
+        return {**assessment, **analysis}
+    
     def test_01_health_check(self):
         """Test the health check endpoint"""
         response = requests.get(f"{self.base_url}/health")
@@ -143,7 +157,7 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
         print(f"Create general readiness assessment response: {response.status_code} - {response.text[:200]}...")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = self.wait_for_assessment_analysis(response.json(), headers)
         
         self.assertIn("id", data)
         self.assertEqual(data["project_name"], assessment_data["project_name"])
@@ -181,7 +195,7 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
         print(f"Create software implementation assessment response: {response.status_code} - {response.text[:200]}...")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = self.wait_for_assessment_analysis(response.json(), headers)
         
         self.assertIn("id", data)
         self.assertEqual(data["project_name"], assessment_data["project_name"])
@@ -225,7 +239,7 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
         print(f"Create business process assessment response: {response.status_code} - {response.text[:200]}...")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = self.wait_for_assessment_analysis(response.json(), headers)
         
         self.assertIn("id", data)
         self.assertEqual(data["project_name"], assessment_data["project_name"])
@@ -269,7 +283,7 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
         print(f"Create manufacturing operations assessment response: {response.status_code} - {response.text[:200]}...")
         self.assertEqual(response.status_code, 200)
-        data = response.json()
+        data = self.wait_for_assessment_analysis(response.json(), headers)
         
         self.assertIn("id", data)
         self.assertEqual(data["project_name"], assessment_data["project_name"])
@@ -3080,6 +3094,543 @@ class IMPACTMethodologyAPITest(unittest.TestCase):
         print("   - Missing required fields handling: ✓")
         print("   - Unauthorized access handling: ✓")
 
+    # ====================================================================================
+    # PERFORMANCE AND OBSERVABILITY
+    # ====================================================================================
+
+    def test_57_admin_request_metrics(self):
+        """Test Prometheus request metrics endpoint"""
+        response = requests.get(f"{self.base_url}/admin/metrics")
+        self.assertIn(response.status_code, [401, 403], "Metrics should require authentication")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        requests.get(f"{self.base_url}/health")
+        response = requests.get(f"{self.base_url}/admin/metrics", headers=headers)
+
+        if response.status_code == 200:
+            self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+            self.assertIn("impact_http_requests_in_flight", response.text)
+            self.assertIn('route="/api/health"', response.text)
+            self.assertIn("impact_http_request_duration_seconds_bucket", response.text)
+            print("✅ Request metrics endpoint successful")
+        elif response.status_code == 403:
+            print("⚠️ User does not have admin privileges - this is expected for non-admin users")
+        else:
+            self.fail(f"Unexpected response: {response.status_code}")
+
+    def test_58_server_timing_database_header(self):
+        """Test that responses report Mongo time in the Server-Timing header"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(f"{self.base_url}/assessments", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Server-Timing", response.headers)
+        self.assertIn("db;dur=", response.headers["Server-Timing"])
+        print(f"✅ Server-Timing header present: {response.headers['Server-Timing']}")
+
+    def test_59_admin_bulk_user_import(self):
+        """Test bulk user onboarding from a CSV upload"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        stamp = int(time.time())
+        csv_body = "email,password,full_name,organization,role\n"
+        csv_body += "\n".join(
+            f"bulk{stamp}_{i}@test.com,password123,Bulk User {i},Test Organization,Team Member" for i in range(3)
+        )
+        csv_body += f"\nbulk{stamp}_0@test.com,password123,Repeat,Test Organization,Team Member\n"
+
+        response = requests.post(
+            f"{self.base_url}/admin/users/bulk-import",
+            files={"file": ("users.csv", csv_body, "text/csv")},
+            headers=headers
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            self.assertEqual(data["total_rows"], 4)
+            self.assertEqual(data["created"], 3)
+            self.assertEqual(data["duplicates"], 1)
+            self.assertEqual([row["status"] for row in data["results"]], ["created", "created", "created", "duplicate"])
+            print("✅ Bulk user import successful")
+            print(f"   - Created: {data['created']}, Duplicates: {data['duplicates']}")
+        elif response.status_code == 403:
+            print("⚠️ User does not have admin privileges - this is expected for non-admin users")
+        else:
+            self.fail(f"Unexpected response: {response.status_code}")
+
+    def test_60_admin_bulk_user_approval(self):
+        """Test approving several pending registrations in one request"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        stamp = int(time.time())
+        user_ids = []
+        for i in range(2):
+            response = requests.post(f"{self.base_url}/auth/register", json={
+                "email": f"bulkapprove{stamp}_{i}@test.com",
+                "password": "password123",
+                "full_name": f"Bulk Approve {i}",
+                "organization": "Test Organization",
+                "role": "Team Member"
+            })
+            self.assertEqual(response.status_code, 200)
+            user_ids.append(response.json()["user_id"])
+
+        response = requests.post(
+            f"{self.base_url}/admin/users/bulk-approve",
+            json={"user_ids": user_ids + ["missing-user-id"], "action": "approve"},
+            headers=headers
+        )
+
+        if response.status_code == 200:
+            data = response.json()
+            self.assertEqual(data["processed_count"], 2)
+            statuses = {outcome["user_id"]: outcome["status"] for outcome in data["outcomes"]}
+            self.assertEqual(statuses["missing-user-id"], "not_found")
+            self.assertTrue(all(statuses[user_id] == "approved" for user_id in user_ids))
+            print("✅ Bulk user approval successful")
+        elif response.status_code == 403:
+            print("⚠️ User does not have admin privileges - this is expected for non-admin users")
+        else:
+            self.fail(f"Unexpected response: {response.status_code}")
+
+    def test_61_bulk_work_item_update(self):
+        """Test updating several tasks and deliverables in one request"""
+        if not self.project_id or not self.task_id or not self.deliverable_id:
+            self.skipTest("No project, task or deliverable ID available")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        bulk_update = {
+            "tasks": [
+                {"id": self.task_id, "changes": {"status": "completed", "notes": "Closed in bulk"}},
+                {"id": "missing-task-id", "changes": {"status": "completed"}}
+            ],
+            "deliverables": [
+                {"id": self.deliverable_id, "changes": {"status": "approved"}}
+            ]
+        }
+
+        response = requests.patch(
+            f"{self.base_url}/projects/{self.project_id}/work-items",
+            json=bulk_update,
+            headers=headers
+        )
+        print(f"Bulk work item update response: {response.status_code} - {response.text}")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["updated_tasks"], [self.task_id])
+        self.assertEqual(data["updated_deliverables"], [self.deliverable_id])
+        self.assertEqual(data["not_found"]["tasks"], ["missing-task-id"])
+        self.assertIn("progress_percentage", data)
+        self.assertIn("phase_progress", data)
+        print("✅ Bulk work item update successful")
+
+    def test_62_project_summaries_pagination(self):
+        """Test project list summaries and cursor pagination"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(f"{self.base_url}/projects", params={"limit": 1}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIn("next_cursor", data)
+        self.assertIn("has_more", data)
+        self.assertLessEqual(len(data["projects"]), 1)
+
+        for project in data["projects"]:
+            self.assertNotIn("tasks", project)
+            self.assertNotIn("deliverables", project)
+            self.assertIn("work_item_counts", project)
+            self.assertIn("phase_counts", project)
+
+        seen_ids = [project["id"] for project in data["projects"]]
+        while data["has_more"]:
+            response = requests.get(
+                f"{self.base_url}/projects",
+                params={"limit": 1, "cursor": data["next_cursor"]},
+                headers=headers
+            )
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            seen_ids.extend(project["id"] for project in data["projects"])
+
+        self.assertEqual(len(seen_ids), len(set(seen_ids)), "Pages should not overlap")
+
+        response = requests.get(f"{self.base_url}/projects", params={"cursor": "not-a-cursor"}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Project summaries paginated across {len(seen_ids)} projects")
+
+    def test_63_dashboard_bootstrap(self):
+        """Test composite dashboard bootstrap endpoint"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(f"{self.base_url}/dashboard/bootstrap", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        for section in ["profile", "metrics", "assessments", "projects", "analytics", "phases", "assessment_types"]:
+            self.assertIn(section, data)
+            self.assertIn(section, data["sections"])
+
+        metrics = requests.get(f"{self.base_url}/dashboard/metrics", headers=headers).json()
+        self.assertEqual(data["metrics"]["total_assessments"], metrics["total_assessments"])
+        self.assertIn("next_cursor", data["projects"])
+
+        response = requests.get(f"{self.base_url}/dashboard/bootstrap", params={"sections": "profile,phases"}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()), {"profile", "phases", "sections"})
+
+        response = requests.get(f"{self.base_url}/dashboard/bootstrap", params={"sections": "unknown"}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Dashboard bootstrap returned {len(data['sections'])} sections")
+
+    def test_64_project_risk_stream(self):
+        """Test WebSocket risk stream snapshot and token check"""
+        if not self.project_id:
+            self.skipTest("No project ID available")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        try:
+            from websockets.sync.client import connect
+        except ImportError:
+            self.skipTest("websockets package not installed")
+
+        ws_url = self.base_url.replace("http", "ws", 1)
+        stream_url = f"{ws_url}/projects/{self.project_id}/risk-stream"
+        with connect(f"{stream_url}?token={self.token}") as websocket:
+            snapshot = json.loads(websocket.recv(timeout=10))
+        self.assertEqual(snapshot["type"], "snapshot")
+        self.assertEqual(snapshot["project_id"], self.project_id)
+        self.assertIn("budget_utilization", snapshot["current_status"])
+        self.assertIsInstance(snapshot["risk_alerts"], list)
+
+        with self.assertRaises(Exception):
+            with connect(f"{stream_url}?token=invalid") as websocket:
+                websocket.recv(timeout=10)
+        print(f"✅ Risk stream snapshot with {len(snapshot['risk_alerts'])} alerts")
+
+    def test_65_admin_risk_alert_sweep(self):
+        """Test batch risk alert sweep deduplicates persisted alerts"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.post(f"{self.base_url}/admin/risk-alerts/sweep", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Risk alert sweep requires admin access")
+            return
+
+        self.assertEqual(response.status_code, 200)
+        first = response.json()
+        for key in ["projects_evaluated", "raised", "updated", "cleared", "projects_per_second"]:
+            self.assertIn(key, first)
+
+        # Nothing changed between sweeps, so nothing fires again
+        second = requests.post(f"{self.base_url}/admin/risk-alerts/sweep", headers=headers).json()
+        self.assertEqual(second["raised"], 0)
+        print(f"✅ Risk sweep evaluated {first['projects_evaluated']} projects ({first['projects_per_second']}/s)")
+
+    def test_66_project_analytics_snapshots(self):
+        """Test analytics endpoints serve stored snapshots unless fresh=true"""
+        if not self.project_id:
+            self.skipTest("No project ID available")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        url = f"{self.base_url}/projects/{self.project_id}/manufacturing-excellence-tracking"
+        computed = requests.post(url, params={"fresh": "true"}, headers=headers)
+        self.assertEqual(computed.status_code, 200)
+
+        stored = requests.post(url, headers=headers)
+        self.assertEqual(stored.status_code, 200)
+        self.assertEqual(stored.json()["generated_at"], computed.json()["generated_at"], "Second call should reuse the snapshot")
+
+        response = requests.get(f"{self.base_url}/admin/analytics/sweep", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Analytics sweep status requires admin access")
+        else:
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("running", response.json())
+        print("✅ Analytics snapshot reused until fresh=true")
+
+    def test_67_phase_intelligence_with_assessment_scores(self):
+        """Test phase intelligence loads the project and its assessment scores together"""
+        if not self.project_id:
+            self.skipTest("No project ID available")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.post(
+            f"{self.base_url}/projects/{self.project_id}/phases/identify/intelligence",
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+
+        missing = requests.post(f"{self.base_url}/projects/{uuid.uuid4()}/phases/identify/intelligence", headers=headers)
+        self.assertEqual(missing.status_code, 404, "Unknown projects should be 404, not wrapped in a 500")
+        print("✅ Phase intelligence generated from joined assessment scores")
+
+    def test_68_predictive_analytics_dimension_aliases(self):
+        """Test typed assessments feed leadership_commitment into analytics that read leadership_support"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        assessment_data = {
+            "assessment_type": "general_readiness",
+            "project_name": "Score Alias Test Project",
+            "leadership_commitment": {"name": "Leadership Commitment & Sponsorship", "score": 5},
+            "organizational_culture": {"name": "Organizational Culture & Change History", "score": 3},
+            "resource_availability": {"name": "Resource Availability & Capability", "score": 2},
+            "stakeholder_engagement": {"name": "Stakeholder Engagement & Communication", "score": 4},
+            "training_capability": {"name": "Training & Development Capability", "score": 3}
+        }
+        response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        assessment_id = response.json()["id"]
+
+        response = requests.post(f"{self.base_url}/assessments/{assessment_id}/predictive-analytics", headers=headers)
+        self.assertEqual(response.status_code, 200)
+        kick_off = next(p for p in response.json()["task_success_predictions"] if p["task_id"] == "task_1")
+        self.assertEqual(kick_off["factor_scores"]["leadership_support"], 5)
+        self.assertEqual(kick_off["factor_scores"]["stakeholder_engagement"], 4)
+        print("✅ Predictive analytics read scores through dimension aliases")
+
+    def test_69_typed_assessment_readiness_lookup(self):
+        """Test typed assessments with the same score mean get the same readiness analysis"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        analyses = []
+        for scores in ([4, 3, 4, 3, 4], [3, 4, 4, 4, 3], [4, 3, 2.5, 3, 5.5]):
+            assessment_data = {
+                "assessment_type": "general_readiness",
+                "project_name": "Readiness Lookup Test Project",
+                **{
+                    dimension: {"name": dimension, "score": score}
+                    for dimension, score in zip(
+                        ["leadership_commitment", "organizational_culture", "resource_availability",
+                         "stakeholder_engagement", "training_capability"],
+                        scores
+                    )
+                }
+            }
+            response = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
+            self.assertEqual(response.status_code, 200)
+            analyses.append(self.wait_for_assessment_analysis(response.json(), headers)["newton_analysis"])
+
+        self.assertEqual(analyses[0], analyses[1], "Equal score means should share an analysis")
+        self.assertEqual(analyses[0]["inertia"]["value"], 28.0)
+        self.assertEqual(analyses[2]["inertia"]["value"], 28.0, "Off-lattice scores should still be computed")
+        print("✅ Readiness analysis consistent for table lookups and computed scores")
+
+    def test_70_idempotent_assessment_submission(self):
+        """Test retried assessment submissions with the same Idempotency-Key return the first result"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        idempotency_key = str(uuid.uuid4())
+        headers = {"Authorization": f"Bearer {self.token}", "Idempotency-Key": idempotency_key}
+        assessment_data = {
+            "assessment_type": "general_readiness",
+            "project_name": "Idempotent Submission Test Project",
+            "leadership_commitment": {"name": "Leadership Commitment", "score": 4},
+            "organizational_culture": {"name": "Organizational Culture", "score": 3}
+        }
+
+        first = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
+        self.assertEqual(first.status_code, 200)
+        retry = requests.post(f"{self.base_url}/assessments/create", json=assessment_data, headers=headers)
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.json()["id"], first.json()["id"], "Retry should return the original assessment")
+        self.assertEqual(retry.headers.get("Idempotent-Replayed"), "true")
+
+        changed = requests.post(
+            f"{self.base_url}/assessments/create",
+            json={**assessment_data, "project_name": "Different Project"},
+            headers=headers
+        )
+        self.assertEqual(changed.status_code, 422, "Reusing a key with a different body should be rejected")
+        print(f"✅ Idempotent submission replayed assessment {first.json()['id']}")
+
+    def test_71_stream_organization_exports(self):
+        """Test assessments and projects stream as NDJSON and CSV with selected fields"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(
+            f"{self.base_url}/exports/assessments",
+            params={"batch_size": 50},
+            headers=headers,
+            stream=True
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("application/x-ndjson", response.headers.get("Content-Type", ""))
+        assessments = [json.loads(line) for line in response.iter_lines() if line]
+        for assessment in assessments:
+            self.assertIn("id", assessment)
+            self.assertNotIn("_id", assessment)
+
+        response = requests.get(
+            f"{self.base_url}/exports/projects",
+            params={"format": "csv", "fields": "id,project_name,created_at"},
+            headers=headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("text/csv", response.headers.get("Content-Type", ""))
+        self.assertEqual(response.text.splitlines()[0], "id,project_name,created_at")
+
+        response = requests.get(f"{self.base_url}/exports/projects", params={"fields": "$where"}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        print(f"✅ Exported {len(assessments)} assessments as NDJSON and projects as CSV")
+
+    def test_72_admin_analytics_snapshot(self):
+        """Test the columnar analytics snapshot job can be started and reports its watermarks"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.post(f"{self.base_url}/admin/analytics/snapshot", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Analytics snapshot requires admin access")
+            return
+
+        self.assertIn(response.status_code, [202, 409])
+        status_response = requests.get(f"{self.base_url}/admin/analytics/snapshot", headers=headers)
+        self.assertEqual(status_response.status_code, 200)
+        status = status_response.json()
+        for key in ["running", "snapshot_dir", "next_scheduled_run"]:
+            self.assertIn(key, status)
+        print(f"✅ Analytics snapshot job status: running={status['running']}, watermarks={status.get('watermarks')}")
+
+    def test_73_admin_user_deletion_job(self):
+        """Test deleting a user returns a background job that removes the account"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        registration = {
+            "email": f"delete_{uuid.uuid4().hex[:8]}@example.com",
+            "password": "TestPass123!",
+            "full_name": "Deletion Test User",
+            "organization": "Deletion Test Org",
+            "role": "Team Member"
+        }
+        response = requests.post(f"{self.base_url}/auth/register", json=registration)
+        self.assertEqual(response.status_code, 200)
+        user_id = response.json()["user_id"]
+
+        response = requests.delete(f"{self.base_url}/admin/users/{user_id}", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ User deletion requires admin access")
+            return
+
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+        job = {}
+        for _ in range(30):
+            job = requests.get(f"{self.base_url}/admin/deletion-jobs/{job_id}", headers=headers).json()
+            if job.get("status") in ("completed", "failed"):
+                break
+            time.sleep(1)
+
+        self.assertEqual(job.get("status"), "completed", job.get("error"))
+        self.assertEqual(job["deleted"].get("users"), 1)
+        print(f"✅ Deletion job {job_id} removed user {user_id}")
+
+    def test_74_admin_activity_retention(self):
+        """Test retention status reports hot and archived counts and daily usage rollups are served"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(f"{self.base_url}/admin/retention", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Retention status requires admin access")
+            return
+
+        self.assertEqual(response.status_code, 200)
+        policies = response.json()["policies"]
+        for collection in ["user_activities", "user_notifications", "admin_notifications"]:
+            self.assertIn(collection, policies)
+            self.assertGreaterEqual(policies[collection]["hot_days"], 1)
+        self.assertGreaterEqual(policies["user_activities"]["hot_days"], 31, "Monthly active users need 30 hot days")
+
+        response = requests.get(f"{self.base_url}/admin/usage/daily", params={"days": 7}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertLessEqual(len(response.json()["rollups"]), 7)
+        print(f"✅ Retention keeps {policies['user_activities']['hot_documents']} hot activity documents")
+
+    def test_75_project_activity_records_shape(self):
+        """Test project activities come back flat, newest first, whichever way they are stored"""
+        if not self.project_id:
+            self.skipTest("No project ID available")
+
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        response = requests.get(f"{self.base_url}/projects/{self.project_id}/activities", params={"limit": 10}, headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Project activities not accessible for this user")
+            return
+
+        self.assertEqual(response.status_code, 200)
+        activities = response.json()["activities"]
+        for activity in activities:
+            self.assertNotIn("meta", activity)
+            self.assertEqual(activity.get("project_id"), self.project_id)
+        timestamps = [activity["timestamp"] for activity in activities]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
+        print(f"✅ {len(activities)} project activity records in reverse time order")
+
+    def test_76_cache_stats_and_invalidation(self):
+        """Test cache stats report per-namespace hit/miss counters and tags can be invalidated"""
+        if not self.token:
+            self.skipTest("No token available")
+
+        headers = {"Authorization": f"Bearer {self.token}"}
+        # Authenticated requests go through the cached user lookup
+        requests.get(f"{self.base_url}/user/profile", headers=headers)
+        response = requests.get(f"{self.base_url}/admin/cache", headers=headers)
+        if response.status_code == 403:
+            print("⚠️ Cache stats require admin access")
+            return
+
+        self.assertEqual(response.status_code, 200)
+        stats = response.json()
+        self.assertIn(stats["backend"], ("memory", "disk", "redis"))
+        for counters in stats["namespaces"].values():
+            self.assertIn("hits", counters)
+            self.assertIn("misses", counters)
+
+        response = requests.post(f"{self.base_url}/admin/cache/invalidate", json={}, headers=headers)
+        self.assertEqual(response.status_code, 400)
+        response = requests.post(f"{self.base_url}/admin/cache/invalidate", json={"tags": ["org:Test Organization"]}, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        print(f"✅ Cache backend {stats['backend']} with {len(stats['namespaces'])} namespaces; invalidated {response.json()['invalidated']} entries")
+
 def run_tests():
     """Run all tests in order"""
     test_suite = unittest.TestSuite()
@@ -209,20 +209,43 @@ function App() {
 
   useEffect(() => {
     if (token) {
-      fetchUserProfile();
-      fetchDashboardData();
-      fetchAdvancedAnalytics();
-      fetchImpactPhases();
-      fetchProjects();
+      fetchBootstrap();
     }
   }, [token]);
 
+  // Keep the open risk dashboard live: the server pushes alert changes instead of us polling
+  const riskProjectId = showRiskMonitoring ? riskMonitoring?.project_id : null;
   useEffect(() => {
-    if (user && user.is_admin) {
-      fetchAdminDashboard();
-      fetchAllUsers();
-    }
-  }, [user]);
+    if (!riskProjectId || !token) return;
+
+    const socket = new WebSocket(
+      `${API_BASE_URL.replace(/^http/, 'ws')}/api/projects/${riskProjectId}/risk-stream?token=${encodeURIComponent(token)}`
+    );
+    socket.onmessage = (event) => {
+      const update = JSON.parse(event.data);
+      if (update.type !== 'risk_update' && update.type !== 'snapshot') return;
+
+      setRiskMonitoring(current => {
+        if (!current || current.project_id !== update.project_id) return current;
+        if (update.type === 'snapshot') {
+          // Sent first and whenever we fell behind: it replaces the alert state outright
+          return {
+            ...current,
+            current_status: { ...current.current_status, ...(update.current_status || {}) },
+            risk_alerts: update.risk_alerts || []
+          };
+        }
+        const changed = [...(update.raised || []), ...(update.updated || [])];
+        const changedKeys = new Set([...changed.map(alert => alert.key), ...(update.cleared || [])]);
+        return {
+          ...current,
+          current_status: { ...current.current_status, ...(update.current_status || {}) },
+          risk_alerts: [...(current.risk_alerts || []).filter(alert => !changedKeys.has(alert.key)), ...changed]
+        };
+      });
+    };
+    return () => socket.close();
+  }, [riskProjectId, token]);
 
   const fetchAssessmentTypes = async () => {
     try {
@@ -267,35 +290,79 @@ function App() {
     setAssessmentData(newData);
   };
 
-  const fetchUserProfile = async () => {
+  // Project list returns summaries one page at a time; follow the cursor to load them all
+  const fetchProjectSummaries = async () => {
+    const summaries = [];
+    let cursor = null;
+    do {
+      const response = await axios.get(`${API_BASE_URL}/api/projects`, {
+        headers: { Authorization: `Bearer ${token}` },
+        params: cursor ? { cursor } : {}
+      });
+      summaries.push(...(response.data.projects || []));
+      cursor = response.data.has_more ? response.data.next_cursor : null;
+    } while (cursor);
+    return summaries;
+  };
+
+  const openProjectDetails = async (projectId) => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/user/profile`, {
+      const response = await axios.get(`${API_BASE_URL}/api/projects/${projectId}`, {
         headers: { Authorization: `Bearer ${token}` }
       });
-      setUser(response.data);
+      setSelectedProject(response.data);
     } catch (err) {
-      console.error('Failed to fetch user profile:', err);
-      handleAuthError();
+      setError(err.response?.data?.detail || 'Failed to load project');
+    }
+  };
+
+  // Initial load: profile, dashboard, analytics and (for admins) the admin center in one request
+  const fetchBootstrap = async () => {
+    try {
+      const response = await axios.get(`${API_BASE_URL}/api/dashboard/bootstrap`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      const data = response.data;
+
+      setUser(data.profile);
+      setDashboardMetrics(data.metrics);
+      setAssessments(data.assessments);
+      setAdvancedAnalytics(data.analytics);
+      setImpactPhases(data.phases);
+
+      if (data.admin_dashboard) {
+        setAdminDashboard(data.admin_dashboard);
+      }
+      if (data.admin_users) {
+        setAllUsers(data.admin_users.users);
+        setPendingUsers(data.admin_users.users.filter(user => user.status === 'pending_approval'));
+      }
+
+      // Remaining project pages are fetched by following the cursor
+      setProjects(data.projects.has_more ? await fetchProjectSummaries() : data.projects.projects);
+    } catch (err) {
+      console.error('Failed to load dashboard:', err);
+      if (err.response?.status === 401) {
+        handleAuthError();
+      }
     }
   };
 
   const fetchDashboardData = async () => {
     try {
-      const [metricsRes, assessmentsRes, projectsRes] = await Promise.all([
+      const [metricsRes, assessmentsRes, projectSummaries] = await Promise.all([
         axios.get(`${API_BASE_URL}/api/dashboard/metrics`, {
           headers: { Authorization: `Bearer ${token}` }
         }),
         axios.get(`${API_BASE_URL}/api/assessments`, {
           headers: { Authorization: `Bearer ${token}` }
         }),
-        axios.get(`${API_BASE_URL}/api/projects`, {
-          headers: { Authorization: `Bearer ${token}` }
-        })
+        fetchProjectSummaries()
       ]);
 
       setDashboardMetrics(metricsRes.data);
       setAssessments(assessmentsRes.data);
-      setProjects(projectsRes.data.projects || []);
+      setProjects(projectSummaries);
     } catch (err) {
       console.error('Failed to fetch dashboard data:', err);
     }
@@ -312,15 +379,6 @@ function App() {
     }
   };
 
-  const fetchImpactPhases = async () => {
-    try {
-      const response = await axios.get(`${API_BASE_URL}/api/impact/phases`);
-      setImpactPhases(response.data);
-    } catch (err) {
-      console.error('Failed to fetch IMPACT phases:', err);
-    }
-  };
-
   const handleAuthError = () => {
     setToken(null);
     setUser(null);
@@ -370,6 +428,21 @@ function App() {
     }
   };
 
+  const pollAssessmentAnalysis = async (assessmentId, attempt = 0) => {
+    try {
+      const response = await axios.get(`${API_BASE_URL}/api/assessments/${assessmentId}/analysis`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      if (response.data.analysis_status === 'pending' && attempt < 30) {
+        setTimeout(() => pollAssessmentAnalysis(assessmentId, attempt + 1), 1000);
+      } else {
+        fetchDashboardData();
+      }
+    } catch (err) {
+      console.error('Assessment analysis status error:', err);
+    }
+  };
+
   const handleTypedAssessmentSubmit = async (e) => {
     e.preventDefault();
     setLoading(true);
@@ -384,14 +457,15 @@ function App() {
 
       if (response.status === 200) {
         const result = response.data;
-        alert(`${assessmentTypes[selectedAssessmentType]?.name || 'Assessment'} completed successfully! AI analysis has been generated.`);
+        alert(`${assessmentTypes[selectedAssessmentType]?.name || 'Assessment'} submitted successfully! AI analysis is being generated.`);
         
         // Reset form
         initializeAssessmentData(selectedAssessmentType);
         
-        // Refresh data
+        // Refresh data now, and again once the analysis is ready
         fetchDashboardData();
         setActiveTab('results');
+        pollAssessmentAnalysis(result.id);
       } else {
         throw new Error('Failed to create assessment');
       }
@@ -904,7 +978,7 @@ function App() {
 
       if (response.ok) {
         const data = await response.json();
-        setShowMessage(`User "${userName}" deleted successfully. Removed ${data.cleanup_stats.projects_deleted} projects and ${data.cleanup_stats.assessments_deleted} assessments.`);
+        setShowMessage(`User "${userName}" is being deleted. Removing ${data.cleanup_stats.projects_deleted} projects and ${data.cleanup_stats.assessments_deleted} assessments in the background.`);
         
         // Refresh user lists and dashboard
         fetchAllUsers();
@@ -1239,7 +1313,7 @@ function App() {
                       </span>
                     </p>
                     <p className="text-sm text-gray-500">
-                      {project.tasks?.filter(t => t.status === 'completed').length || 0} / {project.tasks?.length || 0} tasks
+                      {project.work_item_counts?.tasks?.completed || 0} / {project.work_item_counts?.tasks?.total || 0} tasks
                     </p>
                   </div>
                 </div>
@@ -1423,10 +1497,7 @@ function App() {
 
   const fetchProjects = async () => {
     try {
-      const response = await axios.get(`${API_BASE_URL}/api/projects`, {
-        headers: { 'Authorization': `Bearer ${token}` }
-      });
-      setProjects(response.data.projects || []);
+      setProjects(await fetchProjectSummaries());
     } catch (err) {
       console.error('Failed to fetch projects:', err);
     }
@@ -1569,10 +1640,10 @@ function App() {
                 </div>
 
                 {/* Project Tasks Summary */}
-                {project.tasks && project.tasks.length > 0 && (
+                {project.work_item_counts?.tasks?.total > 0 && (
                   <div className="mt-4 pt-4 border-t border-gray-200">
                     <div className="flex justify-between text-sm">
-                      <span className="text-gray-600">Tasks: {project.tasks.filter(t => t.status === 'completed').length}/{project.tasks.length}</span>
+                      <span className="text-gray-600">Tasks: {project.work_item_counts.tasks.completed}/{project.work_item_counts.tasks.total}</span>
                       <span className="text-gray-600">
                         {project.target_completion_date && 
                           `Due: ${new Date(project.target_completion_date).toLocaleDateString()}`
@@ -1584,7 +1655,7 @@ function App() {
 
                 <div className="mt-4 flex space-x-2">
                   <button
-                    onClick={() => setSelectedProject(project)}
+                    onClick={() => openProjectDetails(project.id)}
                     className="flex-1 bg-blue-600 text-white py-2 px-4 rounded-lg hover:bg-blue-700 text-sm"
                   >
                     View Details
@@ -2314,9 +2385,15 @@ function App() {
                   }`}>
                     {assessment.overall_score?.toFixed(1)}/5
                   </span>
-                  <span className="px-3 py-1 rounded-full text-sm font-medium bg-purple-100 text-purple-800">
-                    {assessment.success_probability?.toFixed(1)}% Success
-                  </span>
+                  {assessment.analysis_status === 'pending' ? (
+                    <span className="px-3 py-1 rounded-full text-sm font-medium bg-gray-100 text-gray-600">
+                      Analyzing...
+                    </span>
+                  ) : (
+                    <span className="px-3 py-1 rounded-full text-sm font-medium bg-purple-100 text-purple-800">
+                      {assessment.success_probability?.toFixed(1)}% Success
+                    </span>
+                  )}
                 </div>
               </div>
               
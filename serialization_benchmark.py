@@ -0,0 +1,109 @@
+"""
+Serialization benchmark for large project payloads.
+
+Compares the previous response path (stringify ObjectIds, jsonable_encoder,
+json.dumps) against MongoJSONResponse (orjson with native datetime/ObjectId
+handling) on project documents shaped like the ones created from assessments.
+
+Usage:
+    python serialization_benchmark.py [--projects 50] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from server import (  # noqa: E402
+    IMPACT_PHASES,
+    MongoJSONResponse,
+    generate_comprehensive_tasks_for_phase,
+    generate_deliverables_for_phase,
+    generate_milestones_for_phase,
+)
+
+
+def build_project(index: int) -> dict:
+    """Build a stored project document with every phase's tasks, deliverables and milestones"""
+    project_id = f"bench-project-{index}"
+    now = datetime.utcnow()
+    tasks, deliverables, milestones = [], [], []
+    for phase_name in IMPACT_PHASES.keys():
+        tasks.extend(generate_comprehensive_tasks_for_phase(phase_name, project_id))
+        deliverables.extend(generate_deliverables_for_phase(phase_name, project_id))
+        milestones.extend(generate_milestones_for_phase(phase_name, project_id, now))
+    return {
+        "_id": ObjectId(),
+        "id": project_id,
+        "name": f"Benchmark Project {index}",
+        "organization": "Benchmark Org",
+        "current_phase": "investigate",
+        "status": "active",
+        "start_date": now,
+        "created_at": now,
+        "updated_at": now,
+        "phase_progress": {phase: 0.0 for phase in IMPACT_PHASES.keys()},
+        "tasks": tasks,
+        "deliverables": deliverables,
+        "milestones": milestones,
+    }
+
+
+def legacy_render(projects: list) -> bytes:
+    """Previous path: munge _id, then FastAPI's encoder and Starlette's json.dumps"""
+    for project in projects:
+        project["_id"] = str(project["_id"])
+    return json.dumps(
+        jsonable_encoder(projects),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def fast_render(projects: list) -> bytes:
+    return MongoJSONResponse(projects).body
+
+
+def time_it(label: str, render, make_payload, repeat: int) -> float:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        payload = make_payload()
+        start = time.perf_counter()
+        size = len(render(payload))
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    median_ms = timings[len(timings) // 2] * 1000
+    print(f"{label:<28} median {median_ms:8.2f} ms   best {timings[0] * 1000:8.2f} ms   {size / 1024:8.1f} KiB")
+    return median_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark project payload serialization")
+    parser.add_argument("--projects", type=int, default=50, help="projects per response")
+    parser.add_argument("--repeat", type=int, default=20, help="timed iterations per renderer")
+    args = parser.parse_args()
+
+    template = [build_project(i) for i in range(args.projects)]
+    items = sum(len(p["tasks"]) + len(p["deliverables"]) + len(p["milestones"]) for p in template)
+    print(f"📦 {args.projects} projects, {items} embedded work items, {args.repeat} iterations\n")
+
+    def make_payload():
+        return [dict(project, _id=ObjectId()) for project in template]
+
+    legacy_ms = time_it("jsonable_encoder + json", legacy_render, make_payload, args.repeat)
+    fast_ms = time_it("MongoJSONResponse (orjson)", fast_render, make_payload, args.repeat)
+    print(f"\n🚀 Speedup: {legacy_ms / fast_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
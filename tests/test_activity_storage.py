@@ -0,0 +1,66 @@
+"""
+Time-series activity reads keep records still waiting in user_activities during the backfill.
+"""
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import server  # noqa: E402
+
+
+class ActivityBackfillReadTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.saved = (server.db, server.ACTIVITY_STORAGE, server.activity_legacy_check_at)
+        self.db = AsyncMongoMockClient()[f"impact_test_{uuid.uuid4().hex}"]
+        server.db = self.db
+        server.ACTIVITY_STORAGE = "timeseries"
+        server.activity_legacy_check_at = 0.0
+
+    def tearDown(self):
+        server.db, server.ACTIVITY_STORAGE, server.activity_legacy_check_at = self.saved
+
+    async def seed(self, now):
+        await self.db.user_activities.insert_many([
+            {"user_id": "u1", "project_id": "p1", "action": "login", "timestamp": now - timedelta(minutes=30)},
+            {"user_id": "u2", "project_id": "p1", "action": "project_updated", "timestamp": now - timedelta(minutes=10)},
+        ])
+        await self.db[server.ACTIVITY_EVENTS_COLLECTION].insert_many([
+            {"meta": {"user_id": "u3", "project_id": "p1"}, "action": "login", "timestamp": now - timedelta(minutes=20)},
+            {"meta": {"user_id": "u3", "project_id": "p2"}, "action": "login", "timestamp": now},
+        ])
+
+    async def test_reads_span_both_collections_until_drained(self):
+        await self.seed(datetime.utcnow())
+
+        feed = await server.find_activities({"project_id": "p1"}, limit=2, offset=1)
+        self.assertEqual([(a["user_id"], a["action"]) for a in feed], [("u3", "login"), ("u1", "login")])
+        self.assertEqual(await server.count_activities({"project_id": "p1"}), 3)
+        self.assertEqual(await server.calculate_weekly_active_users(), 3)
+
+    async def test_rollup_unions_users_across_collections(self):
+        await self.seed(datetime(2026, 3, 2, 12, 0))
+        rollup = await server.roll_up_activity_day(datetime(2026, 3, 2))
+        self.assertEqual(rollup["events"], 4)
+        self.assertEqual(rollup["active_users"], 3)
+        self.assertEqual(rollup["actions"]["login"], 3)
+
+    async def test_drained_legacy_collection_is_no_longer_read(self):
+        await self.seed(datetime.utcnow())
+        while await server.migrate_activity_batch(batch_size=1):
+            pass
+        server.activity_legacy_check_at = 0.0
+
+        self.assertEqual(len(await server.activity_sources()), 1)
+        self.assertIsNone(server.activity_legacy_check_at)
+        self.assertEqual(await server.count_activities({"project_id": "p1"}), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
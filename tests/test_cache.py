@@ -0,0 +1,213 @@
+"""
+Cache backends exercised in-process; the Redis backend runs against an in-memory stand-in.
+"""
+
+import asyncio
+import fnmatch
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import server  # noqa: E402
+
+
+class FakeRedisPipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    """The redis.asyncio commands RedisCacheBackend uses, with PX/EXPIRE honoured"""
+
+    def __init__(self):
+        self.data = {}
+        self.expires = {}
+
+    def _live(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    async def get(self, key):
+        return self.data[key] if self._live(key) else None
+
+    async def mget(self, keys):
+        return [await self.get(key) for key in keys]
+
+    async def incr(self, key):
+        self.data[key] = str(int(await self.get(key) or 0) + 1).encode()
+        return int(self.data[key])
+
+    async def set(self, key, value, px=None):
+        self.data[key] = value
+        if px is not None:
+            self.expires[key] = time.monotonic() + px / 1000
+        else:
+            self.expires.pop(key, None)
+
+    async def sadd(self, key, *members):
+        if not self._live(key):
+            self.data[key] = set()
+        self.data[key].update(member.encode() for member in members)
+
+    async def expire(self, key, seconds):
+        if self._live(key):
+            self.expires[key] = time.monotonic() + seconds
+
+    async def smembers(self, key):
+        return set(self.data[key]) if self._live(key) else set()
+
+    async def delete(self, *keys):
+        deleted = sum(1 for key in keys if self._live(key))
+        for key in keys:
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return deleted
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if self._live(key) and fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+
+class CacheBackendTest(unittest.IsolatedAsyncioTestCase):
+    def backends(self):
+        directory = tempfile.mkdtemp()
+        return [
+            server.MemoryCacheBackend(max_entries=100),
+            server.DiskCacheBackend(path=os.path.join(directory, "cache.sqlite3"), max_entries=100),
+            server.RedisCacheBackend(client=FakeRedis()),
+        ]
+
+    async def test_set_get_and_delete(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.name):
+                cache = server.Cache(backend)
+                await cache.set("project:1", {"name": "Line 3", "budget": [1, 2]})
+                self.assertEqual(await cache.get("project:1"), {"name": "Line 3", "budget": [1, 2]})
+                await cache.delete("project:1")
+                self.assertIsNone(await cache.get("project:1"))
+                self.assertEqual(cache.counters["project"]["hits"], 1)
+                self.assertEqual(cache.counters["project"]["misses"], 1)
+
+    async def test_tag_invalidation(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.name):
+                cache = server.Cache(backend)
+                await cache.set("org_assessments:Acme", [1], tags=("org:Acme",))
+                await cache.set("predictive:a1", {"risk": "Low"}, tags=("org:Acme", "assessment:a1"))
+                await cache.set("predictive:a2", {"risk": "High"}, tags=("assessment:a2",))
+                self.assertEqual(await cache.invalidate("org:Acme"), 2)
+                self.assertIsNone(await cache.get("org_assessments:Acme"))
+                self.assertIsNone(await cache.get("predictive:a1"))
+                self.assertEqual(await cache.get("predictive:a2"), {"risk": "High"})
+
+    async def test_ttl_expiry(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.name):
+                cache = server.Cache(backend)
+                await cache.set("user:1", {"id": "1"}, ttl=0.05)
+                self.assertEqual(await cache.get("user:1"), {"id": "1"})
+                await asyncio.sleep(0.1)
+                self.assertIsNone(await cache.get("user:1"))
+
+    async def test_concurrent_misses_share_one_load(self):
+        for backend in self.backends():
+            with self.subTest(backend=backend.name):
+                cache = server.Cache(backend)
+                loads = []
+
+                async def load():
+                    loads.append(1)
+                    await asyncio.sleep(0.05)
+                    return "playbook"
+
+                results = await asyncio.gather(*(cache.get_or_set("playbook:a1", load) for _ in range(5)))
+                self.assertEqual(results, ["playbook"] * 5)
+                self.assertEqual(len(loads), 1)
+                self.assertEqual(cache.counters["playbook"]["coalesced"], 4)
+
+    def shared_backends(self):
+        """Pairs of backends standing in for two workers sharing one store"""
+        path = os.path.join(tempfile.mkdtemp(), "cache.sqlite3")
+        redis = FakeRedis()
+        memory = server.MemoryCacheBackend(max_entries=100)
+        return [
+            (memory, memory),
+            (server.DiskCacheBackend(path=path, max_entries=100), server.DiskCacheBackend(path=path, max_entries=100)),
+            (server.RedisCacheBackend(client=redis), server.RedisCacheBackend(client=redis)),
+        ]
+
+    async def test_invalidation_on_another_worker_skips_stale_store(self):
+        for first, second in self.shared_backends():
+            with self.subTest(backend=first.name):
+                loading, other = server.Cache(first), server.Cache(second)
+                started = asyncio.Event()
+
+                async def load():
+                    started.set()
+                    await asyncio.sleep(0.05)
+                    return ["before the edit"]
+
+                task = asyncio.create_task(loading.get_or_set("org_assessments:Acme", load, tags=("org:Acme",)))
+                await started.wait()
+                await other.invalidate("org:Acme")
+                self.assertEqual(await task, ["before the edit"])
+
+                self.assertIsNone(await other.get("org_assessments:Acme"))
+                self.assertEqual(loading.counters["org_assessments"]["stale_skips"], 1)
+                # Unrelated tags do not block the store, and a later load caches again
+                await loading.get_or_set("predictive:a1", load, tags=("assessment:a1",))
+                await loading.get_or_set("org_assessments:Acme", load, tags=("org:Acme",))
+                self.assertEqual(await other.get("predictive:a1"), ["before the edit"])
+                self.assertEqual(await other.get("org_assessments:Acme"), ["before the edit"])
+
+    async def test_clear_on_another_worker_skips_stale_store(self):
+        for first, second in self.shared_backends():
+            with self.subTest(backend=first.name):
+                loading, other = server.Cache(first), server.Cache(second)
+                started = asyncio.Event()
+
+                async def load():
+                    started.set()
+                    await asyncio.sleep(0.05)
+                    return "old"
+
+                task = asyncio.create_task(loading.get_or_set("user:1", load))
+                await started.wait()
+                await other.clear()
+                await task
+                self.assertIsNone(await other.get("user:1"))
+
+    async def test_redis_clear_only_touches_prefix(self):
+        redis = FakeRedis()
+        await redis.set("other:key", b"kept")
+        cache = server.Cache(server.RedisCacheBackend(client=redis))
+        await cache.set("user:1", {"id": "1"}, tags=("user:1",))
+        await cache.clear()
+        self.assertEqual([key for key in redis.data if ":version:" not in key], ["other:key"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Idempotent submissions when the finished request's result cannot be stored.
+"""
+
+import os
+import sys
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from fastapi import HTTPException  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+from pymongo.errors import AutoReconnect  # noqa: E402
+
+import server  # noqa: E402
+
+
+class FlakyCompletionCollection:
+    """Fails every write that stores a response, as a primary stepping down would"""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    async def update_one(self, query, update, **kwargs):
+        if "response" in update.get("$set", {}):
+            raise AutoReconnect("primary stepped down")
+        return await self.collection.update_one(query, update, **kwargs)
+
+
+class FlakyDatabase:
+    def __init__(self, database):
+        self.database = database
+
+    def __getattr__(self, name):
+        return self[name]
+
+    def __getitem__(self, name):
+        collection = self.database[name]
+        return FlakyCompletionCollection(collection) if name == "idempotency_keys" else collection
+
+
+class IdempotencyCompletionTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.saved = (server.db, server.IDEMPOTENCY_COMPLETE_BACKOFF_SECONDS)
+        self.database = AsyncMongoMockClient()[f"impact_test_{uuid.uuid4().hex}"]
+        server.IDEMPOTENCY_COMPLETE_BACKOFF_SECONDS = 0
+
+    def tearDown(self):
+        server.db, server.IDEMPOTENCY_COMPLETE_BACKOFF_SECONDS = self.saved
+
+    async def submit(self, runs):
+        async def handler():
+            runs.append(1)
+            await self.database.assessments.insert_one({"id": str(uuid.uuid4())})
+            return {"id": "a1"}
+
+        return await server.run_idempotent("u1", "assessments.create", "key-1", {"organization": "Acme"}, handler)
+
+    async def test_replay_after_stored_result(self):
+        server.db = self.database
+        runs = []
+        self.assertEqual(await self.submit(runs), {"id": "a1"})
+        replay = await self.submit(runs)
+        self.assertEqual(replay.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(len(runs), 1)
+
+    async def test_unstored_result_is_refused_not_rerun(self):
+        server.db = FlakyDatabase(self.database)
+        runs = []
+        self.assertEqual(await self.submit(runs), {"id": "a1"})
+
+        record = await self.database.idempotency_keys.find_one({})
+        self.assertEqual(record["status"], "complete")
+        self.assertTrue(record["response_lost"])
+
+        with self.assertRaises(HTTPException) as raised:
+            await self.submit(runs)
+        self.assertEqual(raised.exception.status_code, 409)
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(await self.database.assessments.count_documents({}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+JSON log lines keep the traceback in its own field after passing through the log queue.
+"""
+
+import json
+import logging
+import os
+import queue
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+import server  # noqa: E402
+
+
+class StructuredQueueHandlerTest(unittest.TestCase):
+    def queued_entry(self, log):
+        log_queue = queue.SimpleQueue()
+        test_logger = logging.getLogger(f"impact.test.{self.id()}")
+        test_logger.handlers = [server.StructuredQueueHandler(log_queue)]
+        test_logger.propagate = False
+        log(test_logger)
+        return json.loads(server.JSONLogFormatter().format(log_queue.get_nowait()))
+
+    def test_exception_stays_a_separate_field(self):
+        def log(test_logger):
+            try:
+                raise ValueError("bad score")
+            except ValueError as e:
+                test_logger.exception("Assessment Creation Error: %s", e)
+
+        entry = self.queued_entry(log)
+        self.assertEqual(entry["message"], "Assessment Creation Error: bad score")
+        self.assertIn("Traceback", entry["exception"])
+        self.assertIn("ValueError: bad score", entry["exception"])
+
+    def test_plain_record_has_no_exception(self):
+        entry = self.queued_entry(lambda test_logger: test_logger.warning("Slow command %dms", 250))
+        self.assertEqual(entry["message"], "Slow command 250ms")
+        self.assertNotIn("exception", entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
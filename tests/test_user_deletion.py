@@ -0,0 +1,108 @@
+"""
+User deletion cascade with time-series activity storage on a deployment with transactions.
+"""
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+from pymongo.errors import OperationFailure  # noqa: E402
+
+import server  # noqa: E402
+
+
+class FakeSession:
+    """Runs the callback as a transaction would, passing itself as the session"""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def with_transaction(self, callback):
+        return await callback(self)
+
+
+class ReplicaSetClient:
+    async def start_session(self):
+        return FakeSession()
+
+
+class SessionCollection:
+    """Accepts the session the cascade passes (mongomock has none) and, for the
+    time-series collection, rejects writes inside one as MongoDB does"""
+
+    def __init__(self, collection, time_series: bool):
+        self.collection = collection
+        self.time_series = time_series
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    async def delete_many(self, query, session=None):
+        if session is not None and self.time_series:
+            raise OperationFailure("Cannot write to a time-series collection in a multi-document transaction", 263)
+        return await self.collection.delete_many(query)
+
+
+class ReplicaSetDatabase:
+    def __init__(self, database):
+        self.database = database
+
+    def __getattr__(self, name):
+        return self[name]
+
+    def __getitem__(self, name):
+        return SessionCollection(self.database[name], name == server.ACTIVITY_EVENTS_COLLECTION)
+
+
+class TimeSeriesUserDeletionTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.saved = (
+            server.db, server.client, server.ACTIVITY_STORAGE, server.USER_OWNED_FILTERS,
+            server.USER_DELETION_TRANSACTIONS, server.transactions_supported,
+        )
+        self.database = AsyncMongoMockClient()[f"impact_test_{uuid.uuid4().hex}"]
+        server.db = ReplicaSetDatabase(self.database)
+        server.client = ReplicaSetClient()
+        server.ACTIVITY_STORAGE = "timeseries"
+        if (server.ACTIVITY_EVENTS_COLLECTION, "meta.user_id") not in server.USER_OWNED_FILTERS:
+            server.USER_OWNED_FILTERS += ((server.ACTIVITY_EVENTS_COLLECTION, "meta.user_id"),)
+        server.USER_DELETION_TRANSACTIONS = True
+        server.transactions_supported = True
+
+    def tearDown(self):
+        (
+            server.db, server.client, server.ACTIVITY_STORAGE, server.USER_OWNED_FILTERS,
+            server.USER_DELETION_TRANSACTIONS, server.transactions_supported,
+        ) = self.saved
+
+    async def test_cascade_deletes_time_series_activity(self):
+        user_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        await self.database.users.insert_one({"id": user_id, "email": "leaving@acme.test", "status": "deleting"})
+        await self.database.projects.insert_one({"id": "p1", "user_id": user_id})
+        await self.database.assessments.insert_one({"id": "a1", "user_id": user_id, "organization": "Acme"})
+        await self.database[server.ACTIVITY_EVENTS_COLLECTION].insert_many([
+            {"timestamp": now, "meta": {"user_id": user_id, "project_id": "p1"}, "action": "project_updated"},
+            {"timestamp": now, "meta": {"user_id": "someone-else"}, "action": "login"},
+        ])
+        job = {"id": str(uuid.uuid4()), "user_id": user_id, "requested_by": "admin", "status": server.DELETION_RUNNING}
+        await self.database.deletion_jobs.insert_one(dict(job))
+
+        await server.cascade_user_deletion(job, batch_size=10)
+
+        self.assertIsNone(await self.database.users.find_one({"id": user_id}))
+        self.assertEqual(await self.database.projects.count_documents({"user_id": user_id}), 0)
+        remaining = await self.database[server.ACTIVITY_EVENTS_COLLECTION].find({}, {"_id": 0, "meta": 1}).to_list(None)
+        self.assertEqual(remaining, [{"meta": {"user_id": "someone-else"}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
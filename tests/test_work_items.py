@@ -0,0 +1,94 @@
+"""
+Work item storage: embedded projects moved into per-type collections and read back.
+"""
+
+import os
+import sys
+import unittest
+import uuid
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import migrate_work_items  # noqa: E402
+import server  # noqa: E402
+
+
+def embedded_project():
+    project_id = str(uuid.uuid4())
+    return {
+        "id": project_id,
+        "organization": "Acme",
+        "project_name": "Line 3 EAM rollout",
+        "updated_at": datetime(2026, 1, 5, 9, 30),
+        "tasks": [
+            {"id": "t1", "name": "Stakeholder map", "phase": "identify", "status": "completed"},
+            {"id": "t2", "name": "Baseline KPIs", "phase": "measure", "status": "pending"},
+        ],
+        "deliverables": [{"id": "d1", "name": "Project Charter", "status": "approved"}],
+        "milestones": [{"id": "m1", "name": "Kickoff", "phase": "identify", "status": "completed"}],
+        # PhaseGateReview carries its project_id, so it is kept on read
+        "gate_reviews": [{"id": "g1", "project_id": project_id, "phase": "identify", "status": "approved"}],
+    }
+
+
+class WorkItemMigrationTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.db = AsyncMongoMockClient()[f"impact_test_{uuid.uuid4().hex}"]
+        self.original_dbs = (server.db, migrate_work_items.db)
+        server.db = migrate_work_items.db = self.db
+
+    def tearDown(self):
+        server.db, migrate_work_items.db = self.original_dbs
+
+    async def stored_project(self, project_id):
+        return await self.db.projects.find_one({"id": project_id}, {"_id": 0})
+
+    async def test_migration_round_trip(self):
+        project = embedded_project()
+        await self.db.projects.insert_one(dict(project))
+
+        await migrate_work_items.migrate(batch_size=10, passes=2, dry_run=False)
+
+        stored = await self.stored_project(project["id"])
+        self.assertEqual(stored["work_item_storage"], "collections")
+        for field in server.WORK_ITEM_COLLECTIONS:
+            self.assertNotIn(field, stored)
+
+        [attached] = await server.attach_work_items([stored])
+        for field in server.WORK_ITEM_COLLECTIONS:
+            self.assertEqual(attached[field], project[field], field)
+
+    async def test_migration_retries_project_changed_after_read(self):
+        project = embedded_project()
+        await self.db.projects.insert_one(dict(project))
+        stale = await self.stored_project(project["id"])
+
+        await server.append_work_items(stale, "gate_reviews", [{"id": "g2", "phase": "measure", "status": "pending"}])
+
+        self.assertFalse(await server.migrate_project_work_items(stale))
+        stored = await self.stored_project(project["id"])
+        self.assertNotEqual(stored.get("work_item_storage"), "collections")
+        self.assertEqual([review["id"] for review in stored["gate_reviews"]], ["g1", "g2"])
+
+        self.assertTrue(await server.migrate_project_work_items(stored))
+        [attached] = await server.attach_work_items([await self.stored_project(project["id"])])
+        self.assertEqual([review["id"] for review in attached["gate_reviews"]], ["g1", "g2"])
+
+    async def test_append_to_split_project_keeps_order(self):
+        project = embedded_project()
+        await self.db.projects.insert_one(dict(project))
+        self.assertTrue(await server.migrate_project_work_items(await self.stored_project(project["id"])))
+        split = await self.stored_project(project["id"])
+
+        await server.append_work_items(split, "tasks", [{"id": "t3", "name": "Pilot", "phase": "pilot", "status": "pending"}])
+
+        [attached] = await server.attach_work_items([await self.stored_project(project["id"])])
+        self.assertEqual([task["id"] for task in attached["tasks"]], ["t1", "t2", "t3"])
+        self.assertGreater((await self.stored_project(project["id"]))["updated_at"], project["updated_at"])
+
+
+if __name__ == "__main__":
+    unittest.main()